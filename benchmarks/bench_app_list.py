@@ -0,0 +1,52 @@
+"""
+Compares matching a library against a synthetic Steam app list using the
+cached `AppList` and the linear scan of `Steam.get_app_id` it replaced.
+
+Run from the project folder with `python -m benchmarks.bench_app_list`.
+"""
+
+import argparse, random, tempfile, time
+from pathlib import Path
+
+# classes
+from classes.app_list import AppList
+from classes.steam import Steam
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--apps", default=200_000, type=int)
+    arg_parser.add_argument("--library", default=5_000, type=int)
+    arg_parser.add_argument("--sample", default=100, type=int)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(1)
+    app_ids = rng.sample(range(10, 3_000_000), args.apps)
+    apps = [{"appid": app_id, "name": f"Game {app_id}"} for app_id in app_ids]
+    library = [app["name"] for app in rng.sample(apps, args.library)]
+    print(f"{len(apps):,} apps, {len(library):,} library games")
+
+    # the linear scan is too slow for the whole library so it is scaled
+    start = time.perf_counter()
+    for name in library[: args.sample]:
+        Steam.get_app_id(name, apps)
+    scan = (time.perf_counter() - start) * len(library) / args.sample
+    print(f"{'linear scan (scaled)':<22} {scan:>8.3f} s")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_path = Path(temp_dir) / "app_list.bin"
+        start = time.perf_counter()
+        AppList(cache_path).update(apps, full=True)
+        print(f"{'cache build':<22} {time.perf_counter() - start:>8.3f} s")
+        print(f"{'cache size':<22} {cache_path.stat().st_size / 2**20:>8.1f} MB")
+
+        start = time.perf_counter()
+        app_list = AppList(cache_path)
+        for name in library:
+            Steam.get_app_id(name, app_list)
+        print(f"{'cache load and match':<22} {time.perf_counter() - start:>8.3f} s")
+        app_list.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Compares the Levenshtein distance engines in `Utils` with the full matrix
+version they replaced by matching names against a synthetic app list.
+
+Run from the project folder with `python -m benchmarks.bench_levenshtein`.
+"""
+
+import argparse, time
+
+# classes
+from benchmarks.bench_search import make_names, make_queries
+from classes.utils import Utils
+
+
+def matrix_lev_distance(word1: str, word2: str) -> int:
+    """
+    The original full matrix Levenshtein distance.
+    """
+    word1, word2 = word1.lower(), word2.lower()
+    cache = [[float("inf")] * (len(word2) + 1) for _ in range(len(word1) + 1)]
+    for j in range(len(word2) + 1):
+        cache[len(word1)][j] = len(word2) - j
+    for i in range(len(word1) + 1):
+        cache[i][len(word2)] = len(word1) - i
+    for i in range(len(word1) - 1, -1, -1):
+        for j in range(len(word2) - 1, -1, -1):
+            if word1[i] == word2[j]:
+                cache[i][j] = cache[i + 1][j + 1]
+            else:
+                min_change = min(cache[i + 1][j], cache[i][j + 1], cache[i + 1][j + 1])
+                cache[i][j] = 1 + min_change
+    return cache[0][0]
+
+
+def time_func(func, repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--apps", default=150_000, type=int)
+    arg_parser.add_argument("--queries", default=5, type=int)
+    arg_parser.add_argument("--sample", default=2_000, type=int)
+    args = arg_parser.parse_args()
+
+    utils = Utils()
+    app_names = list(make_names(args.apps).values())
+    queries = make_queries(dict(enumerate(app_names)), args.queries)
+    sample = app_names[: args.sample]
+    scale = len(app_names) / len(sample)
+    print(f"{len(app_names):,} app names, {len(queries)} queries")
+    # warms up the lazy numpy import
+    utils.lev_distance_batch("warm up", sample[:10])
+
+    results = {}
+    for query in queries:
+        max_distance = round(len(query) * 0.5)
+        timings = {
+            # the full matrix is too slow for the whole list so it is scaled
+            "matrix (scaled)": time_func(
+                lambda: [matrix_lev_distance(query, name) for name in sample]
+            )
+            * scale,
+            "bit-parallel": time_func(
+                lambda: [utils.lev_distance(query, name) for name in app_names]
+            ),
+            "bit-parallel bounded": time_func(
+                lambda: [
+                    utils.lev_distance(query, name, max_distance=max_distance)
+                    for name in app_names
+                ]
+            ),
+            "numpy batch bounded": time_func(
+                lambda: utils.lev_distance_batch(query, app_names, max_distance)
+            ),
+            "lev_dist_matcher": time_func(
+                lambda: utils.lev_dist_matcher(query, app_names)
+            ),
+        }
+        for name, seconds in timings.items():
+            results[name] = results.get(name, 0) + seconds / len(queries)
+    for name, seconds in results.items():
+        print(f"{name:<22} {seconds:>8.3f} s per query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Times recording and querying `PriceHistory` for years of daily price checks
+and compares the summary with a pandas groupby over the same records.
+
+Run from the project folder with `python -m benchmarks.bench_price_history`.
+"""
+
+from pathlib import Path
+import argparse, tempfile, time
+
+import numpy as np
+import pandas as pd
+
+# classes
+from classes.price_history import PriceHistory
+
+
+def fill_history(history: PriceHistory, games: int, days: int, seed: int = 1):
+    """
+    Records a price for each of `games` once a day for `days` days with an
+    occasional sale.
+    """
+    rng = np.random.default_rng(seed)
+    app_ids = np.arange(1, games + 1) * 10
+    base_prices = rng.integers(1, 60, games) * 100 - 1
+    for day in range(days):
+        discounts = np.where(rng.random(games) < 0.1, rng.integers(1, 9, games), 0)
+        discounts *= 10
+        prices = base_prices * (100 - discounts) // 100
+        history.append(app_ids, prices, discounts, day * 24 * 60 * 60)
+
+
+def groupby_summary(records: np.ndarray) -> pd.DataFrame:
+    """
+    Summary of the lowest, average and latest price with a pandas groupby.
+    """
+    df = pd.DataFrame(records).astype(np.int64)
+    grouped = df.groupby("app_id")["price"]
+    return pd.DataFrame(
+        {"low": grouped.min(), "average": grouped.mean(), "price": grouped.last()}
+    )
+
+
+def time_func(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--games", default=3_000, type=int)
+    arg_parser.add_argument("--days", default=5 * 365, type=int)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "price_history.bin"
+        history = PriceHistory(path)
+        start = time.perf_counter()
+        fill_history(history, args.games, args.days)
+        fill_seconds = time.perf_counter() - start
+        records = history.read()
+        expected = groupby_summary(records)
+        summary = history.summary()
+        pd.testing.assert_frame_equal(
+            summary[expected.columns], expected, check_dtype=False, check_names=False
+        )
+        print(
+            f"{len(records):,} observations of {args.games:,} games over "
+            f"{args.days:,} days in {path.stat().st_size / 1024 ** 2:.1f} MB"
+        )
+
+        def fresh_summary():
+            history._summary = None
+            return history.summary()
+
+        timings = {
+            "groupby summary": time_func(lambda: groupby_summary(history.read())),
+            "summary": time_func(fresh_summary),
+            "cached all time lows": time_func(history.at_all_time_low),
+            "cached historical low": time_func(lambda: history.historical_low(10)),
+            "append one day": time_func(
+                lambda: fill_history(PriceHistory(Path(temp_dir) / "day.bin"), 3000, 1)
+            ),
+        }
+        print(f"daily appends took {fill_seconds / args.days * 1000:.2f} ms each")
+    base = timings["groupby summary"]
+    for name, seconds in timings.items():
+        print(f"{name:<22} {seconds * 1000:>8.1f} ms {base / seconds:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
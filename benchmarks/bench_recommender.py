@@ -0,0 +1,100 @@
+"""
+Compares the blocked similarity of `Recommender` with a dense games by
+labels matrix product over a synthetic library.
+
+Run from the project folder with `python -m benchmarks.bench_recommender`.
+"""
+
+import argparse, random, time
+
+import numpy as np
+import pandas as pd
+
+# classes
+from classes.recommender import Recommender
+from classes.tag_matrix import TagMatrix
+
+
+def make_library(total: int, total_tags: int, seed: int = 1) -> pd.DataFrame:
+    """
+    Makes `total` games with up to 20 of `total_tags` user tags, a genre and a
+    rating for about a tenth of them.
+    """
+    rng = random.Random(seed)
+    # a few tags are on most games like on Steam
+    weights = [1 / (rank + 1) for rank in range(total_tags)]
+    tags = [f"Tag {number}" for number in range(total_tags)]
+    genres = ["Action", "Adventure", "Indie", "RPG", "Simulation", "Strategy"]
+    rows = []
+    for _ in range(total):
+        game_tags = dict.fromkeys(rng.choices(tags, weights, k=rng.randint(0, 20)))
+        rows.append(
+            {
+                "User Tags": ", ".join(game_tags) or np.nan,
+                "Genre": ", ".join(rng.sample(genres, rng.randint(1, 3))),
+                "My Rating": rng.randint(1, 10) if rng.random() < 0.1 else np.nan,
+            }
+        )
+    return pd.DataFrame(rows, index=[str(i * 10) for i in range(total)])
+
+
+def build(df: pd.DataFrame) -> Recommender:
+    matrices = {
+        "User Tags": TagMatrix.from_series(df["User Tags"]),
+        "Genre": TagMatrix.from_series(df["Genre"]),
+    }
+    return Recommender(matrices, {"Genre": 0.5})
+
+
+def dense_similarity(recommender: Recommender, keys) -> np.ndarray:
+    """
+    Similarity from the dense vectors of every game.
+    """
+    return recommender.vectors(recommender.keys).T @ recommender.vectors(keys)
+
+
+def time_func(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--games", default=10_000, type=int)
+    arg_parser.add_argument("--tags", default=400, type=int)
+    args = arg_parser.parse_args()
+
+    df = make_library(args.games, args.tags)
+    ratings = pd.to_numeric(df["My Rating"], errors="coerce")
+    liked = ratings[ratings >= 8]
+    recommender = build(df)
+    np.testing.assert_allclose(
+        recommender.similarity(liked.index),
+        dense_similarity(recommender, liked.index),
+        atol=1e-5,
+    )
+    print(
+        f"{args.games:,} games with {len(recommender.labels):,} labels and "
+        f"{len(liked):,} liked games"
+    )
+    timings = {
+        "dense similarity": time_func(
+            lambda: dense_similarity(recommender, liked.index)
+        ),
+        "build recommender": time_func(lambda: build(df)),
+        "blocked similarity": time_func(lambda: recommender.similarity(liked.index)),
+        "recommend top 15": time_func(
+            lambda: recommender.recommend(liked, df.index, 15)
+        ),
+    }
+    base = timings["dense similarity"]
+    for name, seconds in timings.items():
+        print(f"{name:<22} {seconds * 1000:>8.1f} ms {base / seconds:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Compares fuzzy game search over a synthetic library using the trigram
+`SearchIndex` and the linear SequenceMatcher scan it replaced.
+
+Run from the project folder with `python -m benchmarks.bench_search`.
+"""
+
+from difflib import SequenceMatcher
+import argparse, random, statistics, time
+
+# classes
+from classes.search_index import SearchIndex
+
+WORDS = (
+    "dark souls deep rock galactic hades hollow knight celeste dishonored "
+    "stardew valley portal half life slay spire outer wilds terraria doom "
+    "eternal divinity original sin baldur gate disco elysium inscryption "
+    "factorio rimworld subnautica noita cult lamb dead cells hotline miami "
+    "tunic return obra dinn ori blind forest will wisps cuphead into breach"
+).split()
+
+
+def make_names(total: int, seed: int = 1) -> dict:
+    """
+    Makes `total` game names from random word combinations.
+    """
+    rng = random.Random(seed)
+    names = {}
+    for app_id in range(total):
+        words = rng.sample(WORDS, rng.randint(1, 4)) + [str(rng.randint(1, 9))]
+        names[str(app_id)] = " ".join(words).title()
+    return names
+
+
+def make_queries(names: dict, total: int, seed: int = 2) -> list:
+    """
+    Makes search queries from library names with typos and missing words.
+    """
+    rng = random.Random(seed)
+    queries = []
+    for name in rng.sample(list(names.values()), total):
+        chars = list(name.lower())
+        position = rng.randrange(len(chars))
+        chars[position] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+        queries.append("".join(chars))
+    return queries
+
+
+def linear_search(names: dict, query: str, min_match: float = 0.6) -> list:
+    """
+    Scores every name like the old search did and gets `(key, score)`
+    tuples for the matches with the best first.
+    """
+    query = query.lower()
+    matches = []
+    for key, name in names.items():
+        score = SequenceMatcher(None, query, name.lower()).ratio()
+        if score >= min_match:
+            matches.append((key, score))
+    return sorted(matches, key=lambda match: -match[1])
+
+
+def time_queries(func, queries: list) -> list:
+    """
+    Gets the seconds each query took.
+    """
+    times = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def summary(times: list) -> str:
+    times = sorted(times)
+    p95 = times[int(len(times) * 0.95) - 1]
+    return (
+        f"mean {statistics.mean(times) * 1000:.2f} ms, "
+        f"p95 {p95 * 1000:.2f} ms, max {times[-1] * 1000:.2f} ms"
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--games", default=10_000, type=int)
+    arg_parser.add_argument("--queries", default=100, type=int)
+    args = arg_parser.parse_args()
+
+    names = make_names(args.games)
+    queries = make_queries(names, args.queries)
+
+    start = time.perf_counter()
+    index = SearchIndex(names)
+    # the first search loads numpy and builds the posting arrays
+    index.search(queries[0])
+    build_time = time.perf_counter() - start
+    print(f"{args.games:,} games, index built in {build_time * 1000:.0f} ms")
+
+    index_times = time_queries(index.search, queries)
+    print(f"Index:  {summary(index_times)}")
+    linear_times = time_queries(lambda query: linear_search(names, query), queries)
+    print(f"Linear: {summary(linear_times)}")
+
+    # scores are compared since many synthetic names tie
+    found = total = 0
+    for query in queries:
+        best_scores = [score for _, score in linear_search(names, query)[:10]]
+        index_scores = [score for _, score in index.search(query)]
+        total += len(best_scores)
+        found += sum(a >= b for a, b in zip(index_scores, best_scores))
+    print(f"Top 10 recall vs linear scan: {found / max(total, 1):.1%}")
+
+
+if __name__ == "__main__":
+    main()
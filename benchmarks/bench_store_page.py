@@ -0,0 +1,92 @@
+"""
+Compares store page parse times of the single pass `StorePageParser` and the
+BeautifulSoup scraper it replaced.
+
+Saved store pages are read from `benchmarks/store_pages/*.html`. Save a few
+with your browser or `curl https://store.steampowered.com/app/<app_id>/`.
+The test fixture padded out to a real page size is used if none are found.
+
+Run from the project folder with `python -m benchmarks.bench_store_page`.
+"""
+
+from pathlib import Path
+import argparse, statistics, time
+
+from bs4 import BeautifulSoup
+
+# classes
+from classes.store_page import StorePageParser
+
+FIXTURE = Path("testing/data/store_page.html")
+
+
+def load_corpus(corpus_dir: Path, padded_kb: int = 400) -> dict:
+    """
+    Loads the saved store pages by file name.
+    """
+    pages = {
+        path.name: path.read_text(encoding="utf-8")
+        for path in corpus_dir.glob("*.html")
+    }
+    if pages:
+        return pages
+    # pads the fixture with markup so it is closer to a real store page
+    html = FIXTURE.read_text(encoding="utf-8")
+    filler = (
+        '<div class="block"><p class="highlight">filler text &amp; more</p></div>\n'
+    )
+    padding = filler * (padded_kb * 1024 // len(filler))
+    html = html.replace("</body>", padding + "</body>")
+    return {f"{FIXTURE.name} (padded to {padded_kb} KB)": html}
+
+
+def bs4_parse(html: str):
+    """
+    Parses a page the way the old scraper did with one soup per value.
+    """
+    review_soup = BeautifulSoup(html, "html.parser")
+    review_soup.find_all(class_="nonresponsive_hidden responsive_reviewdesc")
+    tag_soup = BeautifulSoup(html, "html.parser")
+    return [tag.text.strip() for tag in tag_soup.find_all(class_="app_tag")]
+
+
+def time_parse(func, html: str, repeat: int) -> float:
+    """
+    Gets the median seconds `func` takes to parse `html`.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--corpus", default="benchmarks/store_pages", type=Path)
+    arg_parser.add_argument("--repeat", default=5, type=int)
+    args = arg_parser.parse_args()
+
+    parser = StorePageParser()
+    pages = load_corpus(args.corpus)
+    print(f"{'Page':<40} {'KB':>6} {'bs4 ms':>9} {'parser ms':>10} {'speedup':>8}")
+    bs4_total = parser_total = 0.0
+    for name, html in pages.items():
+        bs4_time = time_parse(bs4_parse, html, args.repeat)
+        parser_time = time_parse(parser.parse, html, args.repeat)
+        bs4_total += bs4_time
+        parser_total += parser_time
+        print(
+            f"{name[:40]:<40} {len(html) / 1024:>6.0f} {bs4_time * 1000:>9.2f} "
+            f"{parser_time * 1000:>10.2f} {bs4_time / parser_time:>7.1f}x"
+        )
+    count = len(pages)
+    print(
+        f"\nPer page: bs4 {bs4_total / count * 1000:.2f} ms, "
+        f"parser {parser_total / count * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
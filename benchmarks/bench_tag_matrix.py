@@ -0,0 +1,99 @@
+"""
+Compares tag analytics from `TagMatrix` with exploding the "User Tags" column
+to one row per game and tag over a synthetic library.
+
+Run from the project folder with `python -m benchmarks.bench_tag_matrix`.
+"""
+
+import argparse, random, time
+
+import numpy as np
+import pandas as pd
+
+# classes
+from classes.tag_matrix import TagMatrix
+
+
+def make_library(total: int, total_tags: int, seed: int = 1) -> pd.DataFrame:
+    """
+    Makes `total` games with up to 20 of `total_tags` user tags, a rating for
+    about half of them and hours played.
+    """
+    rng = random.Random(seed)
+    # a few tags are on most games like on Steam
+    weights = [1 / (rank + 1) for rank in range(total_tags)]
+    tags = [f"Tag {number}" for number in range(total_tags)]
+    rows = []
+    for _ in range(total):
+        game_tags = dict.fromkeys(rng.choices(tags, weights, k=rng.randint(0, 20)))
+        rows.append(
+            {
+                "User Tags": ", ".join(game_tags) or np.nan,
+                "My Rating": rng.randint(1, 10) if rng.random() < 0.5 else np.nan,
+                "Hours Played": round(rng.uniform(0, 200), 1),
+            }
+        )
+    return pd.DataFrame(rows, index=[str(i * 10) for i in range(total)])
+
+
+def exploded_rating_avg(df: pd.DataFrame, min_ratings: int) -> pd.Series:
+    """
+    Average rating per tag by exploding the DataFrame.
+    """
+    exploded = df.assign(Tag=df["User Tags"].str.split(", ")).explode("Tag")
+    grouped = exploded.groupby("Tag")["My Rating"].agg(["count", "mean"])
+    grouped = grouped[grouped["count"] >= min_ratings]
+    return grouped["mean"].sort_values(ascending=False, kind="stable")
+
+
+def matrix_rating_avg(df: pd.DataFrame, min_ratings: int) -> pd.Series:
+    """
+    Average rating per tag with a freshly built `TagMatrix`.
+    """
+    ratings = TagMatrix.from_series(df["User Tags"]).aggregate(df["My Rating"])
+    ratings = ratings[ratings["count"] >= min_ratings]
+    return ratings["mean"].sort_values(ascending=False, kind="stable")
+
+
+def time_func(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--games", default=10_000, type=int)
+    arg_parser.add_argument("--tags", default=3_000, type=int)
+    args = arg_parser.parse_args()
+
+    df = make_library(args.games, args.tags)
+    expected = exploded_rating_avg(df, 5)
+    result = matrix_rating_avg(df, 5)
+    pd.testing.assert_series_equal(
+        result.sort_index(), expected.sort_index(), check_names=False
+    )
+    tag_matrix = TagMatrix.from_series(df["User Tags"])
+    print(
+        f"{args.games:,} games with {len(tag_matrix.labels):,} tags and "
+        f"{len(tag_matrix.indices):,} game tags"
+    )
+    timings = {
+        "explode rating avg": time_func(lambda: exploded_rating_avg(df, 5)),
+        "build matrix": time_func(lambda: TagMatrix.from_series(df["User Tags"])),
+        "build + rating avg": time_func(lambda: matrix_rating_avg(df, 5)),
+        "cached rating avg": time_func(lambda: tag_matrix.aggregate(df["My Rating"])),
+        "cached tag counts": time_func(tag_matrix.counts),
+        "cached hours sum": time_func(lambda: tag_matrix.aggregate(df["Hours Played"])),
+        "co-occurrence top 50": time_func(lambda: tag_matrix.co_occurrence(50)),
+    }
+    base = timings["explode rating avg"]
+    for name, seconds in timings.items():
+        print(f"{name:<22} {seconds * 1000:>8.1f} ms {base / seconds:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compares `Utils.unicode_remover` and its bulk mode with the chained replace
+version they replaced over synthetic game names and store text.
+
+Run from the project folder with `python -m benchmarks.bench_unicode`.
+"""
+
+import argparse, random, time
+
+# classes
+from benchmarks.bench_search import make_names
+from classes.utils import Utils, unicode_replacements
+
+EXTRAS = ["™", "®", "é", "ö", "–", "&amp;", "&quot;", "â€", "日本"]
+
+
+def chained_unicode_remover(string) -> str:
+    """
+    The original chained replace version.
+    """
+    if type(string) != str:
+        return string
+    for unicode in unicode_replacements.keys():
+        if unicode in string:
+            for unicode, sub in unicode_replacements.items():
+                string = string.replace(unicode, sub)
+    conv_string = string.encode("ascii", "ignore").decode()
+    return conv_string.strip()
+
+
+def make_values(total: int, unicode_share: float, seed: int = 1) -> list:
+    """
+    Makes `total` names with about `unicode_share` of them containing
+    characters the rules replace.
+    """
+    rng = random.Random(seed)
+    values = []
+    for name in make_names(total, seed).values():
+        if rng.random() < unicode_share:
+            name = f"{name}{rng.choice(EXTRAS)} {rng.choice(EXTRAS)}"
+        values.append(name)
+    return values
+
+
+def time_func(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--values", default=100_000, type=int)
+    args = arg_parser.parse_args()
+
+    utils = Utils()
+    for share in (0.0, 0.1, 0.5):
+        values = make_values(args.values, share)
+        expected = [chained_unicode_remover(value) for value in values]
+        assert [utils.unicode_remover(value) for value in values] == expected
+        assert utils.unicode_remover_bulk(values) == expected
+        print(f"\n{len(values):,} values with {share:.0%} needing replacements")
+        timings = {
+            "chained replace": time_func(
+                lambda: [chained_unicode_remover(value) for value in values]
+            ),
+            "unicode_remover": time_func(
+                lambda: [utils.unicode_remover(value) for value in values]
+            ),
+            "unicode_remover_bulk": time_func(
+                lambda: utils.unicode_remover_bulk(values)
+            ),
+        }
+        base = timings["chained replace"]
+        for name, seconds in timings.items():
+            print(f"{name:<22} {seconds * 1000:>8.1f} ms {base / seconds:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+Times the Tracker hot paths against synthetic libraries of several sizes and
+checks the results against a stored baseline.
+
+Run from the project folder with `python -m benchmarks.suite`. Every run is
+added to the history file and `--save-baseline` makes it the new baseline.
+Any timing slower than the baseline by more than `--threshold` percent is
+reported as a regression and the exit code is 1.
+"""
+
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+import argparse, datetime as dt, io, json, platform, random, shutil
+import subprocess, sys, tempfile, time
+
+import openpyxl, requests
+
+# classes
+from benchmarks.bench_search import make_names, make_queries
+from classes.datastore import Datastore
+from classes.game_skipper import GameSkipper
+from classes.setup import Setup
+from classes.utils import lazy_property
+from main import Tracker
+
+RESULTS_DIR = Path("benchmarks/results")
+TEMPLATE = Path("configs/templates/Game_Library_Template.xlsx")
+STORE_PAGE = Path("testing/data/store_page.html")
+PLAY_STATUSES = list(Tracker.play_status_choices.values())
+TAGS = ["Roguelike", "Action", "Indie", "Puzzle", "RPG", "Strategy", "Co-op"]
+
+
+def make_library(total: int, seed: int = 1) -> tuple[list, list]:
+    """
+    Makes `total` Steam sheet rows and the matching `GetOwnedGames` payload.
+    """
+    rng = random.Random(seed)
+    now = dt.datetime.now()
+    rows, owned_games = [], []
+    for key, name in make_names(total, seed).items():
+        app_id = 10 + int(key) * 10
+        minutes = rng.choice([0, 0, rng.randint(1, 10_000)])
+        hours = round(minutes / 60, 1) or None
+        # some names have characters unicode_remover replaces
+        if rng.random() < 0.1:
+            name += rng.choice(["™", "®", " – Deluxe", " &amp; Friends"])
+        rows.append(
+            {
+                "App ID": app_id,
+                "Date Added": now - dt.timedelta(days=rng.randint(0, 3000)),
+                "Date Updated": now - dt.timedelta(days=rng.randint(0, 60)),
+                "My Rating": rng.choice([None, rng.randint(1, 10)]),
+                "Steam Review Percent": round(rng.random(), 2),
+                "Steam Review Total": rng.randint(10, 100_000),
+                "Name": name,
+                "Play Status": rng.choice(PLAY_STATUSES),
+                "Developers": f"Studio {rng.randint(1, 500)}",
+                "Publishers": f"Publisher {rng.randint(1, 100)}",
+                "Genre": ", ".join(rng.sample(TAGS[:5], 2)),
+                "User Tags": ", ".join(rng.sample(TAGS, 4)),
+                "Early Access": "No",
+                "Hours Played": hours,
+                "Time To Beat in Hours": round(rng.uniform(1, 80), 1),
+                "Release Year": rng.randint(2000, 2024),
+            }
+        )
+        owned_games.append(
+            {
+                "appid": app_id,
+                "name": name,
+                "playtime_forever": minutes,
+                "playtime_linux_forever": 0,
+            }
+        )
+    return rows, owned_games
+
+
+def write_workbook(path: Path, rows: list) -> None:
+    """
+    Writes `rows` to the Steam sheet of a copy of the template workbook.
+    """
+    shutil.copyfile(TEMPLATE, path)
+    wb = openpyxl.load_workbook(path)
+    sheet = wb["Steam"]
+    columns = [cell.value for cell in sheet[1]]
+    for row in rows:
+        sheet.append([row.get(column) for column in columns])
+    wb.save(path)
+
+
+def make_app_details(app_id: int) -> dict:
+    """
+    Makes an `appdetails` payload like the Steam store API returns.
+    """
+    data = {
+        "name": f"Game {app_id}™",
+        "developers": ["Studio One", "Studio Two"],
+        "publishers": ["Publisher &amp; Co"],
+        "genres": [{"description": "Action"}, {"description": "Indie"}],
+        "categories": [{"description": "Single-player"}],
+        "release_date": {"date": "14 Sep, 2016"},
+        "platforms": {"linux": True},
+        "price_overview": {"final_formatted": "$19.99", "discount_percent": 25},
+        "drm_notice": "Denuvo Anti-tamper",
+    }
+    return {str(app_id): {"success": True, "data": data}}
+
+
+class BenchTracker(Tracker):
+    """
+    Tracker using a synthetic workbook with every request answered locally.
+    """
+
+    def __init__(self, bench_dir: Path, excel_path: Path) -> None:
+        self.bench_dir = bench_dir
+        self.excel_path = excel_path
+        self.store_page = STORE_PAGE.read_text(encoding="utf-8")
+        super().__init__(save=False)
+
+    def load_config(self):
+        config_data = json.loads(
+            Path("configs/templates/config_template.json").read_text()
+        )
+        config_data["steam_data"]["steam_id"] = "76561197960287930"
+        config_data["steam_data"]["api_key"] = "A" * 32
+        config_data["settings"]["excel_filename"] = str(self.excel_path)
+        ignore_data = {"name_ignore_list": [], "app_id_ignore_list": []}
+        config_path = self.bench_dir / "config.json"
+        setup_data = (config_path, config_data, ignore_data)
+        with patch.object(Setup, "run", return_value=setup_data):
+            super().load_config()
+
+    @lazy_property
+    def datastore(self):
+        return Datastore(self.bench_dir / "library.db")
+
+    def api_sleeper(self, api) -> float:
+        return 0.0
+
+    def request_url(
+        self, url, params=None, headers=None, api=None, max_retries=3, use_cache=True
+    ):
+        response = requests.Response()
+        response.status_code = requests.codes.ok
+        response.url = url
+        if "appdetails" in url:
+            app_id = params["appids"]
+            response._content = json.dumps(make_app_details(app_id)).encode()
+        else:
+            response._content = self.store_page.encode()
+        response.encoding = "utf-8"
+        return response
+
+
+def best_time(func, repeat: int) -> float:
+    """
+    Gets the fastest of `repeat` runs of `func` in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_size(total: int, bench_dir: Path, repeat: int) -> dict:
+    """
+    Times every hot path against a synthetic library of `total` games.
+    """
+    rows, owned_games = make_library(total)
+    bench_dir = bench_dir / str(total)
+    bench_dir.mkdir()
+    excel_path = bench_dir / f"library_{total}.xlsx"
+    write_workbook(excel_path, rows)
+    names = {str(row["App ID"]): row["Name"] for row in rows}
+    queries = make_queries(names, min(100, total))
+    timings = {}
+
+    tracker = BenchTracker(bench_dir, excel_path)
+    timings["library_load_workbook"] = best_time(lambda: tracker.library, 1)
+    timings["library_load_datastore"] = best_time(
+        lambda: BenchTracker(bench_dir, excel_path).library, repeat
+    )
+    timings["create_dataframe_datastore"] = best_time(
+        tracker.create_library_dataframe, repeat
+    )
+    timings["create_dataframe_workbook"] = best_time(
+        lambda: tracker.steam.create_dataframe(na_vals=tracker.na_values), 1
+    )
+
+    # syncs with nothing changed and then with 1% of games played
+    timings["game_check_no_change"] = best_time(
+        lambda: tracker.game_check(owned_games), repeat
+    )
+    played = owned_games[::100] if total >= 100 else owned_games[:1]
+
+    def play_games():
+        for game in played:
+            game["playtime_forever"] += 60
+        tracker.game_check(owned_games)
+
+    timings["game_check_1pct_played"] = best_time(play_games, repeat)
+
+    sample = [row["App ID"] for row in rows[:100]]
+    timings["get_game_info_100"] = best_time(
+        lambda: [tracker.get_game_info(app_id) for app_id in sample], repeat
+    )
+
+    timings["search_index_build"] = best_time(lambda: tracker.search_index, 1)
+    timings["search_games_100"] = best_time(
+        lambda: [tracker.search_games(query) for query in queries], repeat
+    )
+    name_list = list(names.values())
+    timings["lev_dist_matcher_5"] = best_time(
+        lambda: [tracker.lev_dist_matcher(query, name_list) for query in queries[:5]],
+        repeat,
+    )
+
+    def skip_games():
+        game_skipper = GameSkipper(["Half-Life 2: Lost Coast"], [12345])
+        for game in owned_games:
+            game_skipper.skip_game(game["name"], game["appid"])
+
+    timings["skip_game"] = best_time(skip_games, repeat)
+    timings["unicode_remover"] = best_time(
+        lambda: [tracker.unicode_remover(name) for name in name_list], repeat
+    )
+    timings["unicode_remover_bulk"] = best_time(
+        lambda: tracker.unicode_remover_bulk(name_list), repeat
+    )
+
+    df = tracker.create_library_dataframe()
+
+    def output_statistics():
+        tracker.output_statistics(df.copy())
+        tracker.output_recently_played_games(df.copy())
+
+    timings["output_statistics"] = best_time(output_statistics, repeat)
+    tracker.datastore.close()
+    return timings
+
+
+def get_commit() -> str:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return output.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def find_regressions(
+    results: dict, baseline: dict, threshold: float, min_seconds: float = 0.001
+) -> list:
+    """
+    Gets `(size, name, baseline, current, percent)` for every timing over
+    the `threshold` percent slower than the baseline. Slowdowns under
+    `min_seconds` are ignored as noise.
+    """
+    regressions = []
+    for size, timings in results.items():
+        for name, seconds in timings.items():
+            base = baseline.get(size, {}).get(name)
+            if not base:
+                continue
+            percent = (seconds - base) / base * 100
+            if percent > threshold and seconds - base >= min_seconds:
+                regressions.append((size, name, base, seconds, percent))
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument(
+        "--sizes", default=[100, 1_000, 10_000, 50_000], nargs="+", type=int
+    )
+    arg_parser.add_argument("--repeat", default=3, type=int)
+    arg_parser.add_argument("--threshold", default=20.0, type=float)
+    arg_parser.add_argument(
+        "--history", default=RESULTS_DIR / "history.json", type=Path
+    )
+    arg_parser.add_argument(
+        "--baseline", default=RESULTS_DIR / "baseline.json", type=Path
+    )
+    arg_parser.add_argument("--save-baseline", action="store_true")
+    args = arg_parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for total in args.sizes:
+            print(f"\n{total:,} games")
+            results[str(total)] = run_size(total, Path(temp_dir), args.repeat)
+            for name, seconds in results[str(total)].items():
+                print(f"{name:<28} {seconds * 1000:>10.1f} ms")
+
+    run = {
+        "date": dt.datetime.now().isoformat(timespec="seconds"),
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    history = []
+    if args.history.exists():
+        history = json.loads(args.history.read_text())
+    history.append(run)
+    args.history.write_text(json.dumps(history, indent=2))
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(run, indent=2))
+        print(f"\nSaved baseline to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print("\nNo baseline to compare against. Use --save-baseline to make one.")
+        return
+    baseline = json.loads(args.baseline.read_text())
+    regressions = find_regressions(results, baseline["results"], args.threshold)
+    if not regressions:
+        print(f"\nNo regressions over {args.threshold:.0f}% vs {baseline['commit']}")
+        return
+    print(f"\nRegressions over {args.threshold:.0f}% vs {baseline['commit']}:")
+    for size, name, base, seconds, percent in regressions:
+        print(
+            f"{size:>6} {name:<28} {base * 1000:>10.1f} ms -> "
+            f"{seconds * 1000:.1f} ms (+{percent:.0f}%)"
+        )
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
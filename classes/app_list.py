@@ -0,0 +1,294 @@
+from pathlib import Path
+import hashlib, os, time
+
+from classes.utils import lazy_import
+
+np = lazy_import("numpy")
+
+
+class AppList:
+    # fixed size header at the start of the cache file
+    header_dtype = [
+        ("magic", "S4"),
+        ("version", "<u4"),
+        ("count", "<u8"),
+        ("table_size", "<u8"),
+        ("blob_size", "<u8"),
+        ("last_modified", "<u8"),
+        ("fetched", "<f8"),
+    ]
+    magic = b"APPL"
+    version = 1
+    # trademark symbols are often left out of names in the library
+    name_table = str.maketrans("", "", "™®©")
+    empty = -1
+
+    def __init__(self, cache_path: str = "configs/app_list.bin") -> None:
+        """
+        Steam app list cached on disk in a compact binary file.
+
+        Names are packed into a single utf-8 blob with offsets and the file
+        holds open addressing hash tables for app ID and normalized name
+        lookups. The file is memory mapped so only the pages a lookup touches
+        are read.
+        """
+        self.cache_path = Path(cache_path)
+        self.count = 0
+        self.last_modified = 0
+        self.fetched = 0.0
+        self.load()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, app_id) -> bool:
+        return self.get_name(app_id) is not None
+
+    @classmethod
+    def normalize(cls, name: str) -> str:
+        """
+        Gets the key used for name lookups.
+        """
+        return " ".join(str(name).translate(cls.name_table).casefold().split())
+
+    @staticmethod
+    def hash_name(key: str) -> int:
+        # python's own hash is salted per run so it can not be stored
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+    # fibonacci hashing spreads the mostly sequential app IDs out
+    fibonacci = 11400714819323198485
+
+    @classmethod
+    def app_id_slots(cls, app_ids, mask: int):
+        shift = np.uint64(64 - mask.bit_length())
+        return (app_ids.astype(np.uint64) * np.uint64(cls.fibonacci)) >> shift
+
+    @classmethod
+    def app_id_slot(cls, app_id: int, mask: int) -> int:
+        return ((app_id * cls.fibonacci) & 0xFFFFFFFFFFFFFFFF) >> (
+            64 - mask.bit_length()
+        )
+
+    @classmethod
+    def build_table(cls, home_slots, size: int):
+        """
+        Creates a linear probing hash table of record indexes with every record
+        placed as close to its `home_slots` entry as possible.
+        """
+        table = np.full(size, cls.empty, dtype=np.int32)
+        pending = np.arange(len(home_slots), dtype=np.int64)
+        slots = home_slots.astype(np.int64)
+        mask = size - 1
+        while len(pending):
+            free = table[slots] == cls.empty
+            # the first record wanting a free slot gets it
+            unique_slots, first = np.unique(slots[free], return_index=True)
+            table[unique_slots] = pending[free][first]
+            placed = np.zeros(len(pending), dtype=bool)
+            placed[np.flatnonzero(free)[first]] = True
+            pending = pending[~placed]
+            slots = (slots[~placed] + 1) & mask
+        return table
+
+    def load(self) -> bool:
+        """
+        Memory maps the cache file. Returns False if there is no usable cache.
+        """
+        self.count = 0
+        if not self.cache_path.exists():
+            return False
+        header = np.fromfile(self.cache_path, dtype=self.header_dtype, count=1)
+        if not len(header):
+            return False
+        header = header[0]
+        if header["magic"] != self.magic or header["version"] != self.version:
+            return False
+        count, size = int(header["count"]), int(header["table_size"])
+        if not count:
+            return False
+        offset = np.dtype(self.header_dtype).itemsize
+        layout = [
+            ("name_hashes", np.uint64, count),
+            ("app_ids", np.uint32, count),
+            ("offsets", np.uint64, count + 1),
+            ("name_table", np.int32, size),
+            ("id_table", np.int32, size),
+            ("blob", np.uint8, int(header["blob_size"])),
+        ]
+        for name, dtype, length in layout:
+            array = np.memmap(
+                self.cache_path, dtype=dtype, mode="r", offset=offset, shape=(length,)
+            )
+            # plain array views skip the slow memmap item access
+            setattr(self, name, array.view(np.ndarray))
+            offset += array.nbytes
+        self.mask = size - 1
+        self.count = count
+        self.last_modified = int(header["last_modified"])
+        self.fetched = float(header["fetched"])
+        return True
+
+    def save(self, apps: dict, last_modified: int = None) -> int:
+        """
+        Replaces the cache with `apps` which maps each app ID to its name.
+        Returns the number of apps saved.
+        """
+        apps = {int(app_id): name for app_id, name in apps.items() if name}
+        app_ids = np.fromiter(apps.keys(), dtype=np.uint32, count=len(apps))
+        names = list(apps.values())
+        name_hashes = np.fromiter(
+            (self.hash_name(self.normalize(name)) for name in names),
+            dtype=np.uint64,
+            count=len(names),
+        )
+        # records sharing a name sit together with the lowest app ID first
+        order = np.lexsort((app_ids, name_hashes))
+        app_ids, name_hashes = app_ids[order], name_hashes[order]
+        encoded = [names[i].encode() for i in order]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+        np.cumsum([len(name) for name in encoded], out=offsets[1:])
+        blob = b"".join(encoded)
+        # at most half full so probes stay short
+        size = 1 << max(len(apps) * 2, 1).bit_length()
+        mask = size - 1
+        firsts = np.flatnonzero(np.diff(name_hashes, prepend=np.uint64(0)) != 0)
+        if len(name_hashes) and name_hashes[0] == 0:
+            firsts = np.union1d([0], firsts)
+        name_table = np.full(size, self.empty, dtype=np.int32)
+        table = self.build_table(name_hashes[firsts] & np.uint64(mask), size)
+        name_table[table != self.empty] = firsts[table[table != self.empty]]
+        id_table = self.build_table(self.app_id_slots(app_ids, mask), size)
+        if last_modified is None:
+            last_modified = self.last_modified
+        header = np.array(
+            [
+                (
+                    self.magic,
+                    self.version,
+                    len(apps),
+                    size,
+                    len(blob),
+                    last_modified,
+                    time.time(),
+                )
+            ],
+            dtype=self.header_dtype,
+        )
+        self.close()
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_path.with_name(f".{self.cache_path.name}.tmp")
+        try:
+            with open(temp_path, "wb") as file:
+                for array in (header, name_hashes, app_ids, offsets):
+                    file.write(array.tobytes())
+                file.write(name_table.tobytes())
+                file.write(id_table.tobytes())
+                file.write(blob)
+            os.replace(temp_path, self.cache_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        self.load()
+        return len(apps)
+
+    def to_dict(self) -> dict:
+        """
+        Gets every cached app as a dict of app ID to name.
+        """
+        return {int(self.app_ids[i]): self.get_record_name(i) for i in range(len(self))}
+
+    def update(self, apps: list, full: bool = False) -> int:
+        """
+        Merges `apps` from the Steam API into the cache. Every other app is
+        dropped if `full` is True. Returns the number of apps saved.
+        """
+        if not apps and not full and self.count:
+            self.mark_fetched()
+            return self.count
+        current = {} if full else self.to_dict()
+        # a full list is up to date as of now even without modified times
+        last_modified = int(time.time()) if full else self.last_modified
+        for app in apps:
+            current[int(app["appid"])] = app["name"]
+            last_modified = max(last_modified, app.get("last_modified", 0))
+        return self.save(current, last_modified)
+
+    def mark_fetched(self) -> None:
+        """
+        Records that the cache was checked for changes just now.
+        """
+        header = np.fromfile(self.cache_path, dtype=self.header_dtype, count=1)
+        header["fetched"] = self.fetched = time.time()
+        with open(self.cache_path, "r+b") as file:
+            file.write(header.tobytes())
+
+    def is_stale(self, max_age_hours: float) -> bool:
+        """
+        Checks if the cache is missing or older than `max_age_hours`.
+        """
+        if not self.count:
+            return True
+        return time.time() - self.fetched >= max_age_hours * 3600
+
+    def get_record_name(self, index: int) -> str:
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        return self.blob[start:end].tobytes().decode()
+
+    def get_name(self, app_id) -> str | None:
+        """
+        Gets the name of `app_id` or None if it is not in the app list.
+        """
+        if not self.count:
+            return None
+        app_id = int(app_id)
+        if not 0 <= app_id < 2**32:
+            return None
+        slot = self.app_id_slot(app_id, self.mask)
+        while (index := int(self.id_table[slot])) != self.empty:
+            if self.app_ids[index] == app_id:
+                return self.get_record_name(index)
+            slot = (slot + 1) & self.mask
+        return None
+
+    def get_app_ids(self, name: str) -> list:
+        """
+        Gets the ID of every app named `name` ignoring case, spacing and
+        trademark symbols with the lowest app ID first.
+        """
+        if not self.count:
+            return []
+        key = self.normalize(name)
+        name_hash = self.hash_name(key)
+        slot = name_hash & self.mask
+        while (index := int(self.name_table[slot])) != self.empty:
+            if self.name_hashes[index] == name_hash:
+                break
+            slot = (slot + 1) & self.mask
+        else:
+            return []
+        app_ids = []
+        while index < self.count and self.name_hashes[index] == name_hash:
+            if self.normalize(self.get_record_name(index)) == key:
+                app_ids.append(int(self.app_ids[index]))
+            index += 1
+        return app_ids
+
+    def get_app_id(self, name: str) -> int | None:
+        """
+        Gets the app ID for `name`. An exact name match is picked over one
+        that only matches once normalized.
+        """
+        app_ids = self.get_app_ids(name)
+        for app_id in app_ids:
+            if self.get_name(app_id) == name:
+                return app_id
+        return app_ids[0] if app_ids else None
+
+    def close(self) -> None:
+        # memory maps have to be dropped before the file can be replaced
+        for name in ("name_hashes", "app_ids", "offsets", "name_table", "id_table"):
+            self.__dict__.pop(name, None)
+        self.__dict__.pop("blob", None)
+        self.count = 0
@@ -0,0 +1,316 @@
+from pathlib import Path
+import datetime as dt
+import threading, json
+import sqlite3
+
+from classes.utils import lazy_import
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+
+
+def encode_value(value):
+    """
+    Converts cell values JSON can not store into tagged dicts.
+    """
+    if isinstance(value, dt.datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, dt.date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, dt.time):
+        return {"$time": value.isoformat()}
+    if isinstance(value, dt.timedelta):
+        return {"$timedelta": value.total_seconds()}
+    raise TypeError(f"{type(value).__name__} can not be stored")
+
+
+def decode_value(obj: dict):
+    """
+    Converts tagged dicts made by `encode_value` back into cell values.
+    """
+    if "$datetime" in obj:
+        return dt.datetime.fromisoformat(obj["$datetime"])
+    if "$date" in obj:
+        return dt.date.fromisoformat(obj["$date"])
+    if "$time" in obj:
+        return dt.time.fromisoformat(obj["$time"])
+    if "$timedelta" in obj:
+        return dt.timedelta(seconds=obj["$timedelta"])
+    return obj
+
+
+class Datastore:
+    def __init__(self, db_path: str = "configs/library.db") -> None:
+        """
+        SQLite mirror of the workbook sheets.
+
+        Each row is stored as JSON under its sheet and key so any sheet layout
+        can be mirrored. The workbooks modified time is recorded with every
+        sync so edits made to the .xlsx outside the tracker are noticed.
+
+        Changing a row clears that time since the workbook has not been saved
+        with it yet. `mark_synced` sets it again once the workbook is saved so
+        changes lost to a crash or a skipped save reload from the workbook.
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS rows ("
+                "sheet TEXT NOT NULL, key TEXT NOT NULL, "
+                "position INTEGER NOT NULL, data TEXT NOT NULL, "
+                "PRIMARY KEY (sheet, key))"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS sheets ("
+                "sheet TEXT PRIMARY KEY, columns TEXT NOT NULL, "
+                "key_column TEXT NOT NULL, source_mtime REAL)"
+            )
+
+    @staticmethod
+    def dumps(row: dict) -> str:
+        return json.dumps(row, default=encode_value)
+
+    @staticmethod
+    def loads(data: str) -> dict:
+        return json.loads(data, object_hook=decode_value)
+
+    def has_sheet(self, sheet_name: str) -> bool:
+        """
+        Checks if `sheet_name` has been mirrored.
+        """
+        with self.lock:
+            cursor = self.conn.execute(
+                "SELECT 1 FROM sheets WHERE sheet = ?", (sheet_name,)
+            )
+            return cursor.fetchone() is not None
+
+    def is_fresh(self, sheet_name: str, source_mtime: float) -> bool:
+        """
+        Checks if `sheet_name` was last synced with a workbook modified at
+        `source_mtime`.
+        """
+        with self.lock:
+            cursor = self.conn.execute(
+                "SELECT source_mtime FROM sheets WHERE sheet = ?", (sheet_name,)
+            )
+            row = cursor.fetchone()
+        return row is not None and row[0] is not None and row[0] == source_mtime
+
+    def mark_synced(self, source_mtime: float, sheet_names: list = None) -> None:
+        """
+        Records that `sheet_names` or all sheets match the workbook modified
+        at `source_mtime`.
+        """
+        with self.lock, self.conn:
+            if sheet_names is None:
+                self.conn.execute("UPDATE sheets SET source_mtime = ?", (source_mtime,))
+            else:
+                self.conn.executemany(
+                    "UPDATE sheets SET source_mtime = ? WHERE sheet = ?",
+                    [(source_mtime, name) for name in sheet_names],
+                )
+
+    def mark_unsaved(self, sheet_name: str) -> None:
+        """
+        Records that `sheet_name` has changes the workbook was not saved with.
+        Must be called with the connection already in a transaction.
+        """
+        self.conn.execute(
+            "UPDATE sheets SET source_mtime = NULL WHERE sheet = ?", (sheet_name,)
+        )
+
+    def get_columns(self, sheet_name: str) -> list:
+        """
+        Gets the column names of `sheet_name` in sheet order.
+        """
+        with self.lock:
+            cursor = self.conn.execute(
+                "SELECT columns FROM sheets WHERE sheet = ?", (sheet_name,)
+            )
+            row = cursor.fetchone()
+        return json.loads(row[0]) if row else []
+
+    def replace_sheet(
+        self,
+        sheet_name: str,
+        columns: list,
+        key_column: str,
+        rows: dict,
+        source_mtime: float = None,
+    ) -> None:
+        """
+        Replaces everything stored for `sheet_name` with `rows` which maps each
+        row key to a dict of column values.
+        """
+        records = [
+            (sheet_name, str(key), position, self.dumps(row))
+            for position, (key, row) in enumerate(rows.items())
+        ]
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM rows WHERE sheet = ?", (sheet_name,))
+            self.conn.executemany("INSERT INTO rows VALUES (?, ?, ?, ?)", records)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sheets VALUES (?, ?, ?, ?)",
+                (sheet_name, json.dumps(columns), key_column, source_mtime),
+            )
+
+    def sync_sheet(self, sheet, source_mtime: float = None) -> int:
+        """
+        Mirrors every row of `sheet` into the store. Returns the row total.
+        """
+        columns = list(sheet.col_idx.keys())
+        key_pos = sheet.col_idx[sheet.column_name] - 1
+        rows = {}
+        sheet_rows = sheet.cur_sheet.iter_rows(
+            min_row=2,
+            max_col=max(sheet.col_idx.values()),
+            values_only=True,
+        )
+        for row in sheet_rows:
+            if row[key_pos] is None:
+                continue
+            key = str(row[key_pos])
+            rows.pop(key, None)
+            rows[key] = {col: row[i - 1] for col, i in sheet.col_idx.items()}
+        self.replace_sheet(
+            sheet.sheet_name, columns, sheet.column_name, rows, source_mtime
+        )
+        return len(rows)
+
+    def get_rows(self, sheet_name: str) -> dict:
+        """
+        Gets every row of `sheet_name` as a dict of row key to column values
+        in sheet order.
+        """
+        with self.lock:
+            cursor = self.conn.execute(
+                "SELECT key, data FROM rows WHERE sheet = ? ORDER BY position",
+                (sheet_name,),
+            )
+            return {key: self.loads(data) for key, data in cursor.fetchall()}
+
+    def get_row(self, sheet_name: str, key) -> dict or None:
+        """
+        Gets the row at `key` or None if it does not exist.
+        """
+        with self.lock:
+            cursor = self.conn.execute(
+                "SELECT data FROM rows WHERE sheet = ? AND key = ?",
+                (sheet_name, str(key)),
+            )
+            row = cursor.fetchone()
+        return self.loads(row[0]) if row else None
+
+    def upsert(self, sheet_name: str, key, row: dict) -> None:
+        """
+        Adds `row` at `key` or replaces the existing row.
+        """
+        key = str(key)
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "SELECT position FROM rows WHERE sheet = ? AND key = ?",
+                (sheet_name, key),
+            )
+            existing = cursor.fetchone()
+            if existing:
+                position = existing[0]
+            else:
+                cursor = self.conn.execute(
+                    "SELECT COALESCE(MAX(position) + 1, 0) FROM rows WHERE sheet = ?",
+                    (sheet_name,),
+                )
+                position = cursor.fetchone()[0]
+            self.conn.execute(
+                "INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?)",
+                (sheet_name, key, position, self.dumps(row)),
+            )
+            self.mark_unsaved(sheet_name)
+
+    def update_cells(self, sheet_name: str, cells: dict) -> int:
+        """
+        Updates many cells at once. `cells` maps `(key, column)` to the new
+        value. Returns the number of rows changed.
+        """
+        by_row = {}
+        for (key, column), value in cells.items():
+            by_row.setdefault(str(key), {})[column] = value
+        updated = 0
+        with self.lock, self.conn:
+            for key, changes in by_row.items():
+                cursor = self.conn.execute(
+                    "SELECT data FROM rows WHERE sheet = ? AND key = ?",
+                    (sheet_name, key),
+                )
+                row = cursor.fetchone()
+                if not row:
+                    continue
+                data = self.loads(row[0])
+                data.update(changes)
+                self.conn.execute(
+                    "UPDATE rows SET data = ? WHERE sheet = ? AND key = ?",
+                    (self.dumps(data), sheet_name, key),
+                )
+                updated += 1
+            if updated:
+                self.mark_unsaved(sheet_name)
+        return updated
+
+    def delete(self, sheet_name: str, key) -> bool:
+        """
+        Deletes the row at `key`. Returns True if it existed.
+        """
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM rows WHERE sheet = ? AND key = ?",
+                (sheet_name, str(key)),
+            )
+            if cursor.rowcount > 0:
+                self.mark_unsaved(sheet_name)
+            return cursor.rowcount > 0
+
+    def create_dataframe(self, sheet_name: str, na_vals: list = None):
+        """
+        Creates a DataFrame of `sheet_name` like `Sheet.create_dataframe` does
+        without reading the workbook.
+
+        `na_vals` sets what should be considered N/A values that are ignored.
+        """
+        rows = self.get_rows(sheet_name)
+        df = pd.DataFrame(list(rows.values()), columns=self.get_columns(sheet_name))
+        # blank cells are read as N/A by pandas as well
+        df = df.replace([""] + (na_vals or []), np.nan)
+        df = df.fillna(value=np.nan).infer_objects()
+        # date columns come back as objects when any cell is blank
+        for column in df.columns[df.dtypes == object]:
+            values = df[column].dropna()
+            if len(values) and all(isinstance(v, dt.datetime) for v in values):
+                df[column] = pd.to_datetime(df[column])
+        return df
+
+    def export_sheet(self, sheet) -> int:
+        """
+        Writes the stored rows of `sheet` back into it so the workbook can be
+        regenerated from the store. Returns the number of cells changed.
+        """
+        rows = self.get_rows(sheet.sheet_name)
+        changed = 0
+        for key, row in rows.items():
+            if key not in sheet.row_idx:
+                sheet.add_new_line(row)
+                changed += len(row)
+                continue
+            for column, value in row.items():
+                if column not in sheet.col_idx:
+                    continue
+                if sheet.update_cell(key, column, value):
+                    changed += 1
+        for key in set(sheet.row_idx) - set(rows):
+            sheet.delete_row(key)
+            changed += 1
+        return changed
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import time
+
+from classes.logger import Logger
+
+
+class FetchPool:
+    Log = Logger()
+    error_log = Log.create_log(name="fetch_pool", log_path="logs/error.log")
+
+    def __init__(self, max_workers: int = 4) -> None:
+        """
+        Runs network bound fetches for many items at once while handing every
+        result back to the calling thread so only one thread writes to a Sheet.
+
+        `max_workers` sets how many fetches can be in flight at the same time.
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.completed = 0
+        self.failed = 0
+        self.elapsed = 0.0
+
+    def imap(self, fetch, items):
+        """
+        Runs `fetch` on every entry in `items` using the thread pool and yields
+        `(item, result)` tuples in the order they finish.
+
+        The result is None if `fetch` raised an exception.
+        """
+        items = iter(items)
+        # keeps a small backlog queued so workers never wait on the writer
+        max_in_flight = self.max_workers * 2
+        self.completed, self.failed = 0, 0
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = {}
+
+            def submit_next():
+                for item in items:
+                    in_flight[executor.submit(fetch, item)] = item
+                    return True
+                return False
+
+            while len(in_flight) < max_in_flight and submit_next():
+                pass
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                        self.completed += 1
+                    except Exception as error:
+                        self.error_log.warning(f"Fetch failed for {item}: {error}")
+                        result = None
+                        self.failed += 1
+                    self.elapsed = time.perf_counter() - start
+                    yield item, result
+                    submit_next()
+        self.elapsed = time.perf_counter() - start
+
+    @property
+    def games_per_minute(self) -> float:
+        """
+        Returns the throughput of the last run in items per minute.
+        """
+        if not self.elapsed:
+            return 0.0
+        return (self.completed + self.failed) / self.elapsed * 60
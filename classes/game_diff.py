@@ -0,0 +1,88 @@
+from typing import NamedTuple
+
+from classes.utils import lazy_import
+
+pd = lazy_import("pandas")
+
+
+class GameDiff(NamedTuple):
+    """
+    Changes between the owned Steam games and the Steam sheet.
+    """
+
+    added: list = []
+    removed: list = []
+    renamed: list = []
+    played: list = []
+
+
+class GameDiffer:
+    def __init__(self, name_col: str, hours_played_col: str, skip_game=None) -> None:
+        """
+        Finds what changed between the `GetOwnedGames` payload and the sheet
+        by joining them on App ID so unchanged games are never looked at one
+        by one.
+
+        `skip_game` is called with each games name and app ID and games it
+        returns True for are left out like they were never owned.
+        """
+        self.name_col = name_col
+        self.hours_played_col = hours_played_col
+        self.skip_game = skip_game
+
+    @staticmethod
+    def hours_played(minutes_played) -> float:
+        # matches `Utils.hours_played` with 0 instead of None
+        return round(minutes_played / 60, 1)
+
+    def create_owned_dataframe(self, steam_games: list) -> "pd.DataFrame":
+        """
+        Creates a DataFrame of `steam_games` keyed like the sheet with the
+        skipped games left out.
+        """
+        owned = pd.DataFrame(
+            steam_games, columns=["appid", "name", "playtime_forever"]
+        ).astype(object)
+        if self.skip_game:
+            skipped = [
+                self.skip_game(name, app_id)
+                for name, app_id in zip(owned["name"], owned["appid"])
+            ]
+            owned = owned[[not skip for skip in skipped]]
+        owned.index = owned["appid"].astype(str)
+        return owned
+
+    def diff(self, steam_games: list, sheet_df: "pd.DataFrame") -> GameDiff:
+        """
+        Compares `steam_games` with `sheet_df` which is the sheet keyed by App
+        ID. Owned games are given as app IDs and removed games as sheet keys
+        both in their original order.
+        """
+        owned = self.create_owned_dataframe(steam_games)
+        in_sheet = owned.index.isin(sheet_df.index)
+        added = owned["appid"][~in_sheet].tolist()
+        removed = sheet_df.index[~sheet_df.index.isin(owned.index)].tolist()
+        existing = owned[in_sheet].join(
+            sheet_df[[self.name_col, self.hours_played_col]]
+        )
+        # name changes
+        old_names = existing[self.name_col]
+        renamed_mask = (
+            old_names.notna() & (old_names != "") & (old_names != existing["name"])
+        )
+        renamed = [
+            (app_id, old_name, new_name)
+            for app_id, old_name, new_name in zip(
+                existing["appid"][renamed_mask],
+                old_names[renamed_mask],
+                existing["name"][renamed_mask],
+            )
+        ]
+        # games with more hours than the sheet has
+        previous_hours = pd.to_numeric(
+            existing[self.hours_played_col], errors="coerce"
+        ).fillna(0)
+        current_hours = [self.hours_played(m) for m in existing["playtime_forever"]]
+        played_mask = pd.Series(current_hours, index=existing.index) > previous_hours
+        played = existing["appid"][played_mask].tolist()
+        return GameDiff(added, removed, renamed, played)
@@ -1,4 +1,5 @@
-import re
+from pathlib import Path
+import json, re
 
 from classes.utils import Utils
 
@@ -46,13 +47,63 @@ class GameSkipper(Utils):
         self,
         custom_names_to_ignore: list[str] = [],
         app_id_ignore_list: list[int] = [],
+        ignore_path: str = None,
     ) -> None:
         """
         Game Skipping class that determines if a game should be skipped based on the games name or app ID.
+
+        The ignore lists are reloaded from `ignore_path` by `refresh` if it
+        has changed since it was last read.
         """
+        self.ignore_path = Path(ignore_path) if ignore_path else None
+        self.ignore_mtime = self.get_ignore_mtime()
+        # keywords are matched with a single pattern instead of one per keyword
+        keywords = "|".join(re.escape(k.lower()) for k in self.keyword_ignore_list)
+        self.keyword_re = re.compile(rf"\b(?:{keywords})\b")
+        self.decisions = {}
         self.name_ignore_list = custom_names_to_ignore + self.media_list
         self.app_id_ignore_list = app_id_ignore_list
 
+    @property
+    def name_ignore_list(self) -> list[str]:
+        return self._name_ignore_list
+
+    @name_ignore_list.setter
+    def name_ignore_list(self, names: list[str]) -> None:
+        self._name_ignore_list = names
+        self.ignored_names = frozenset(name.lower() for name in names)
+        self.decisions.clear()
+
+    @property
+    def app_id_ignore_list(self) -> list[int]:
+        return self._app_id_ignore_list
+
+    @app_id_ignore_list.setter
+    def app_id_ignore_list(self, app_ids: list[int]) -> None:
+        self._app_id_ignore_list = app_ids
+        self.ignored_app_ids = frozenset(int(app_id) for app_id in app_ids)
+        self.decisions.clear()
+
+    def get_ignore_mtime(self) -> float | None:
+        if not self.ignore_path or not self.ignore_path.exists():
+            return None
+        return self.ignore_path.stat().st_mtime
+
+    def refresh(self) -> bool:
+        """
+        Reloads the ignore lists if the ignore file changed. Returns True if
+        they were reloaded.
+        """
+        mtime = self.get_ignore_mtime()
+        if mtime is None or mtime == self.ignore_mtime:
+            return False
+        with open(self.ignore_path) as file:
+            ignore_data = json.load(file)
+        self.ignore_mtime = mtime
+        self.name_ignore_list = ignore_data["name_ignore_list"] + self.media_list
+        self.app_id_ignore_list = ignore_data["app_id_ignore_list"]
+        return True
+
     def skip_game(self, game_name: str = None, app_id: int = None) -> bool:
         """
         TODO improve docstring
@@ -64,23 +115,32 @@ class GameSkipper(Utils):
         `Name` check looks for keywords and if the name is in the name_ignore_list or media list.
 
         `app_id` check looks for the `app_id` in the app_id_ignore_list.
+
+        Decisions are remembered until the ignore lists change.
         """
         # return False if name and app_id is not given
         if not any([game_name, app_id]):
             raise ValueError("No game_name or app_id was given")
+        key = (game_name, app_id)
+        if key not in self.decisions:
+            self.decisions[key] = self.check_game(game_name, app_id)
+        return self.decisions[key]
+
+    def check_game(self, game_name: str = None, app_id: int = None) -> bool:
+        """
+        Checks the ignore lists for `game_name` and `app_id` without using the
+        remembered decisions.
+        """
         # ignore by app id
-        if app_id and int(app_id) in self.app_id_ignore_list:
+        if app_id and int(app_id) in self.ignored_app_ids:
             return True
         # ignore by name
         if game_name:
             # checks if name means it should be skipped
             cleaned_name = self.unicode_remover(game_name).lower()
-            if cleaned_name and cleaned_name in (
-                name.lower() for name in self.name_ignore_list
-            ):
+            if cleaned_name and cleaned_name in self.ignored_names:
                 return True
             # keyword check
-            for keyword in self.keyword_ignore_list:
-                if re.search(rf"\b{keyword}\b", game_name.lower()):
-                    return True
+            if self.keyword_re.search(game_name.lower()):
+                return True
         return False
@@ -0,0 +1,96 @@
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from requests.adapters import HTTPAdapter
+import threading, time
+import requests
+
+
+class SessionMetrics:
+    def __init__(self) -> None:
+        """
+        Tracks connection reuse and where request time goes for a session.
+        """
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+        self.handshake_time = 0.0
+        self.response_time = 0.0
+        self.payload_time = 0.0
+
+    def add_connection(self, seconds: float) -> None:
+        """
+        Records a new connection that took `seconds` to connect and handshake.
+        """
+        with self.lock:
+            self.connections += 1
+            self.handshake_time += seconds
+
+    def add_request(self, total: float, elapsed: float) -> None:
+        """
+        Records a request that took `total` seconds with `elapsed` seconds
+        being the time until the response headers arrived.
+        """
+        with self.lock:
+            self.requests += 1
+            self.response_time += elapsed
+            self.payload_time += max(total - elapsed, 0.0)
+
+    def get_stats(self) -> dict:
+        """
+        Gets the connection reuse and timing statistics.
+        """
+        with self.lock:
+            reused = max(self.requests - self.connections, 0)
+            return {
+                "requests": self.requests,
+                "connections": self.connections,
+                "reused": reused,
+                "reuse_rate": reused / self.requests if self.requests else 0.0,
+                "handshake_seconds": round(self.handshake_time, 3),
+                "wait_seconds": round(
+                    max(self.response_time - self.handshake_time, 0.0), 3
+                ),
+                "payload_seconds": round(self.payload_time, 3),
+            }
+
+
+def create_session(pool_size: int = 10, metrics: SessionMetrics = None):
+    """
+    Creates a `requests.Session` that keeps up to `pool_size` connections
+    alive per host and records new connections in `metrics`.
+    """
+    metrics = metrics or SessionMetrics()
+
+    # connection classes that time the tcp connect and tls handshake
+    class TimedHTTPConnection(HTTPConnection):
+        def connect(self):
+            start = time.perf_counter()
+            super().connect()
+            metrics.add_connection(time.perf_counter() - start)
+
+    class TimedHTTPSConnection(HTTPSConnection):
+        def connect(self):
+            start = time.perf_counter()
+            super().connect()
+            metrics.add_connection(time.perf_counter() - start)
+
+    class TimedHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = TimedHTTPConnection
+
+    class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = TimedHTTPSConnection
+
+    class TimedHTTPAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": TimedHTTPConnectionPool,
+                "https": TimedHTTPSConnectionPool,
+            }
+
+    session = requests.Session()
+    adapter = TimedHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.metrics = metrics
+    return session
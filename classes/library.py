@@ -0,0 +1,277 @@
+from functools import cached_property
+from pathlib import Path
+
+from classes.metrics import metrics
+from classes.utils import lazy_import
+
+pd = lazy_import("pandas")
+
+
+class Library:
+    def __init__(
+        self,
+        sheet,
+        store=None,
+        sheet_name: str = None,
+        file_path: str = None,
+    ) -> None:
+        """
+        In memory copy of a `Sheet` used as the working set during a run.
+
+        Rows are loaded once into a DataFrame keyed the same way as the sheets
+        `row_idx` so queries never go through openpyxl. Cell updates are only
+        tracked as dirty until `flush` writes them back to the sheet.
+        New and deleted rows go to the sheet right away.
+
+        `version` goes up with every change to the rows so anything built from
+        them can tell when it is out of date.
+
+        If a `Datastore` is given as `store` rows are loaded from it while it
+        matches the workbook and every change is mirrored to it. A changed
+        store only matches again once the workbook is saved.
+
+        `sheet` can also be a function that returns the `Sheet` so the workbook
+        is only opened once it is needed. `sheet_name` and `file_path` must be
+        given in that case.
+        """
+        if callable(sheet):
+            self.open_sheet = sheet
+        else:
+            self.sheet = sheet
+            sheet_name = sheet.sheet_name
+            file_path = sheet.excel.file_path
+        self.sheet_name = sheet_name
+        self.file_path = Path(file_path)
+        self.store = store
+        self.dirty = {}
+        self.version = 0
+        self.load()
+
+    @cached_property
+    def sheet(self):
+        return self.open_sheet()
+
+    def source_mtime(self) -> float or None:
+        """
+        Gets the modified time of the workbook the sheet belongs to.
+        """
+        if not self.file_path.exists():
+            return None
+        return self.file_path.stat().st_mtime
+
+    def load(self) -> None:
+        """
+        Loads every row of the sheet into the DataFrame in one pass.
+        """
+        source_mtime = self.source_mtime()
+        if self.store and self.store.is_fresh(self.sheet_name, source_mtime):
+            self.columns = self.store.get_columns(self.sheet_name)
+            rows = {
+                key: [row.get(column) for column in self.columns]
+                for key, row in self.store.get_rows(self.sheet_name).items()
+            }
+        else:
+            self.columns = list(self.sheet.col_idx.keys())
+            rows = self.read_sheet()
+            if self.store:
+                self.store.replace_sheet(
+                    self.sheet_name,
+                    self.columns,
+                    self.sheet.column_name,
+                    {key: dict(zip(self.columns, row)) for key, row in rows.items()},
+                    source_mtime,
+                )
+        # object dtype keeps the cell values exactly as openpyxl returns them
+        self.df = pd.DataFrame(
+            list(rows.values()),
+            index=list(rows.keys()),
+            columns=self.columns,
+            dtype=object,
+        )
+        self.dirty = {}
+        self.version += 1
+
+    @metrics.timed("sheet read")
+    def read_sheet(self) -> dict:
+        """
+        Reads every row of the sheet as a list of values by row key.
+        """
+        key_pos = self.sheet.col_idx[self.sheet.column_name] - 1
+        total_columns = max(self.sheet.col_idx.values())
+        rows = {}
+        sheet_rows = self.sheet.cur_sheet.iter_rows(
+            min_row=2,
+            max_col=total_columns,
+        )
+        for cells in sheet_rows:
+            if cells[key_pos].value is None:
+                continue
+            key = str(cells[key_pos].value)
+            row = [
+                self.link_formula(cell) if cell.hyperlink else cell.value
+                for cell in cells
+            ]
+            # later duplicates replace earlier rows just like the row_idx
+            rows.pop(key, None)
+            rows[key] = [row[i - 1] for i in self.sheet.col_idx.values()]
+        return rows
+
+    @staticmethod
+    def link_formula(cell) -> str:
+        """
+        Gets a cell with a clickable link as a HYPERLINK formula like the ones
+        the tracker writes so the link is kept along with the value.
+        """
+        target = cell.hyperlink.target
+        if not target:
+            return cell.value
+        text = str(cell.value if cell.value is not None else target)
+        text = text.replace('"', '""')
+        return f'=HYPERLINK("{target}","{text}")'
+
+    def __contains__(self, row_value) -> bool:
+        return str(row_value) in self.df.index
+
+    def __len__(self) -> int:
+        return len(self.df.index)
+
+    def keys(self) -> list:
+        """
+        Gets every row key in sheet order.
+        """
+        return list(self.df.index)
+
+    def column(self, column: str) -> "pd.Series":
+        """
+        Gets `column` as a Series indexed by row key.
+        """
+        return self.df[column]
+
+    def get_cell(self, row_value, column: str):
+        """
+        Gets the cell value at `row_value` and `column` or None if either do
+        not exist. Hyperlink formulas and clickable links return their link.
+        """
+        row_value = str(row_value)
+        if row_value not in self.df.index or column not in self.df.columns:
+            return None
+        value = self.df.at[row_value, column]
+        if type(value) is str and value.startswith("=HYPERLINK("):
+            return value.split('"')[1]
+        return value
+
+    def get_row(self, row_value) -> dict:
+        """
+        Gets the row at `row_value` as a dict with every column set to None
+        if it does not exist.
+        """
+        row_value = str(row_value)
+        if row_value not in self.df.index:
+            return {column: None for column in self.columns}
+        return dict(zip(self.columns, self.df.loc[row_value].tolist()))
+
+    def update_cell(self, row_value, column: str, new_value, replace=True) -> bool:
+        """
+        Updates the cell at `row_value` and `column` to `new_value` and marks
+        it dirty. Returns True if the value changed.
+
+        `replace` determines if a cell that already has a value is changed.
+        """
+        row_value = str(row_value)
+        if row_value not in self.df.index or column not in self.df.columns:
+            return False
+        cur_value = self.df.at[row_value, column]
+        if not replace and cur_value:
+            return False
+        if new_value == "":
+            new_value = None
+        if cur_value == new_value:
+            return False
+        self.df.at[row_value, column] = new_value
+        self.dirty[(row_value, column)] = new_value
+        self.version += 1
+        return True
+
+    def update_column(self, column: str, values: dict) -> int:
+        """
+        Updates `column` for every row key and value in `values` in one pass.
+        Returns the number of cells changed.
+        """
+        updated = 0
+        for row_value, new_value in values.items():
+            if self.update_cell(row_value, column, new_value):
+                updated += 1
+        return updated
+
+    def add_row(self, cell_dict: dict) -> bool:
+        """
+        Adds `cell_dict` as a new row to the sheet and the DataFrame.
+        """
+        self.sheet.add_new_line(cell_dict)
+        key = str(cell_dict[self.sheet.column_name])
+        row = [cell_dict.get(column) for column in self.columns]
+        row = [None if value == "" else value for value in row]
+        self.df.loc[key] = pd.Series(row, index=self.columns, dtype=object)
+        self.version += 1
+        if self.store:
+            self.store.upsert(self.sheet_name, key, dict(zip(self.columns, row)))
+        return True
+
+    def rename_key(self, row_value, new_value) -> bool:
+        """
+        Changes the key of the row at `row_value` to `new_value` in the sheet,
+        the DataFrame and the store. Returns False if the row does not exist
+        or another row already uses `new_value`.
+        """
+        row_value, new_key = str(row_value), str(new_value)
+        if row_value not in self.df.index or new_key in self.df.index:
+            return False
+        key_column = self.sheet.column_name
+        self.sheet.update_cell(row_value, key_column, new_value)
+        self.sheet.row_idx[new_key] = self.sheet.row_idx.pop(row_value)
+        self.df = self.df.rename(index={row_value: new_key})
+        self.df.at[new_key, key_column] = new_value
+        self.dirty = {
+            (new_key if key == row_value else key, column): value
+            for (key, column), value in self.dirty.items()
+        }
+        self.version += 1
+        if self.store:
+            self.store.delete(self.sheet_name, row_value)
+            self.store.upsert(self.sheet_name, new_key, self.get_row(new_key))
+        return True
+
+    def delete_row(self, row_value) -> bool:
+        """
+        Deletes the row at `row_value` from the sheet and the DataFrame.
+        """
+        row_value = str(row_value)
+        self.dirty = {k: v for k, v in self.dirty.items() if k[0] != row_value}
+        if row_value in self.df.index:
+            self.df = self.df.drop(index=row_value)
+            self.version += 1
+        if self.store:
+            self.store.delete(self.sheet_name, row_value)
+        return self.sheet.delete_row(row_value)
+
+    @metrics.timed("sheet write")
+    def flush(self, row_value=None) -> int:
+        """
+        Writes dirty cells back to the sheet. Only writes the cells for
+        `row_value` if it is given. Returns the number of cells written.
+        """
+        if row_value is None:
+            cells = self.dirty
+        else:
+            row_value = str(row_value)
+            cells = {k: v for k, v in self.dirty.items() if k[0] == row_value}
+        for row_key, column in cells:
+            self.sheet.update_cell(row_key, column, cells[(row_key, column)])
+        if self.store and cells:
+            self.store.update_cells(self.sheet_name, cells)
+        if row_value is None:
+            self.dirty = {}
+        else:
+            for key in cells:
+                self.dirty.pop(key)
+        return len(cells)
@@ -0,0 +1,118 @@
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+import threading, json, time
+
+
+class Metrics:
+    # separates the names of nested spans
+    separator = " > "
+
+    def __init__(self) -> None:
+        """
+        Thread safe registry of timing spans and counters.
+
+        Spans started while another span is open on the same thread are
+        recorded under it so a summary shows which phase the time went to.
+        Spans started on worker threads are recorded at the top level.
+        """
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.spans = {}
+        self.counters = {}
+        self.started = time.perf_counter()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.spans = {}
+            self.counters = {}
+            self.started = time.perf_counter()
+
+    def get_stack(self) -> list:
+        if not hasattr(self.local, "stack"):
+            self.local.stack = []
+        return self.local.stack
+
+    @contextmanager
+    def span(self, name: str):
+        """
+        Times everything within the `with` block as `name`.
+        """
+        stack = self.get_stack()
+        stack.append(name)
+        path = self.separator.join(stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            with self.lock:
+                span = self.spans.setdefault(
+                    path, {"count": 0, "seconds": 0.0, "max_seconds": 0.0}
+                )
+                span["count"] += 1
+                span["seconds"] += elapsed
+                span["max_seconds"] = max(span["max_seconds"], elapsed)
+
+    def timed(self, name: str = None):
+        """
+        Decorator that times each call as `name` which defaults to the
+        function name.
+        """
+
+        def decorator(func):
+            @wraps(func)
+            def wrapped(*args, **kwargs):
+                with self.span(name or func.__name__):
+                    return func(*args, **kwargs)
+
+            return wrapped
+
+        return decorator
+
+    def count(self, name: str, amount: float = 1) -> None:
+        """
+        Adds `amount` to the counter `name`.
+        """
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def get_summary(self) -> dict:
+        """
+        Gets the spans sorted by name so nested spans follow their parent
+        along with the counters.
+        """
+        with self.lock:
+            spans = {
+                path: {
+                    "count": span["count"],
+                    "seconds": round(span["seconds"], 4),
+                    "max_seconds": round(span["max_seconds"], 4),
+                }
+                for path, span in sorted(self.spans.items())
+            }
+            counters = {
+                name: round(value, 4) if isinstance(value, float) else value
+                for name, value in sorted(self.counters.items())
+            }
+            elapsed = time.perf_counter() - self.started
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "spans": spans,
+            "counters": counters,
+        }
+
+    def save(self, path) -> dict:
+        """
+        Saves the summary as JSON to `path` and returns it.
+        """
+        summary = self.get_summary()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(summary, indent=4))
+        return summary
+
+
+# shared by every class so one run has a single summary
+metrics = Metrics()
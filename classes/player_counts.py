@@ -0,0 +1,67 @@
+from pathlib import Path
+import json, time
+
+from classes.fetch_pool import FetchPool
+
+
+class PlayerCountRefresher:
+    def __init__(
+        self,
+        fetch_count,
+        state_path: str = "configs/player_counts.json",
+        max_age_minutes: float = 30,
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Refreshes player counts for many games at once.
+
+        `fetch_count` is called with an app ID and returns its player count.
+        It is run on `max_workers` threads so it should use the rate limiter.
+
+        Games refreshed within `max_age_minutes` are skipped. Refresh times are
+        kept in `state_path` so they carry over between runs.
+        """
+        self.fetch_count = fetch_count
+        self.state_path = Path(state_path)
+        self.max_age = max_age_minutes * 60
+        self.max_workers = max_workers
+        self.refreshed = {}
+        if self.state_path.exists():
+            with open(self.state_path) as file:
+                self.refreshed = json.load(file)
+
+    def get_stale(self, app_ids) -> list:
+        """
+        Gets the `app_ids` that have not been refreshed recently.
+        """
+        oldest_allowed = time.time() - self.max_age
+        return [
+            app_id
+            for app_id in app_ids
+            if self.refreshed.get(str(app_id), 0) < oldest_allowed
+        ]
+
+    def refresh(self, app_ids):
+        """
+        Fetches the player counts for all `app_ids` concurrently and yields
+        `(app_id, player_count)` tuples as they finish.
+        """
+        pool = FetchPool(self.max_workers)
+        for app_id, player_count in pool.imap(self.fetch_count, app_ids):
+            if player_count is not None:
+                self.refreshed[str(app_id)] = time.time()
+            yield app_id, player_count
+
+    def save(self) -> None:
+        """
+        Saves the refresh times so recently refreshed games are skipped next run.
+        """
+        # drops entries old enough that they would be refreshed anyway
+        oldest_allowed = time.time() - self.max_age
+        self.refreshed = {
+            app_id: refreshed
+            for app_id, refreshed in self.refreshed.items()
+            if refreshed >= oldest_allowed
+        }
+        with open(self.state_path, "w") as file:
+            json.dump(self.refreshed, file)
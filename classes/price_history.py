@@ -0,0 +1,146 @@
+from pathlib import Path
+import threading, time
+
+from classes.utils import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+class PriceHistory:
+    # each observation is a fixed 13 byte record on disk
+    fields = [
+        ("app_id", "<u4"),
+        ("timestamp", "<u4"),
+        ("price", "<u4"),
+        ("discount", "u1"),
+    ]
+
+    def __init__(self, path: str = "configs/price_history.bin") -> None:
+        """
+        Append only store of every price seen for a game.
+
+        Observations are packed records of the app ID, unix timestamp, price
+        in cents and discount percent written to the end of `path`, so years
+        of daily checks across thousands of games stay small and a write
+        never rewrites old data. Queries load the whole file as one numpy
+        array and the per game summary is reused until the file grows.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.dtype = np.dtype(self.fields)
+        self.lock = threading.Lock()
+        self._summary = None
+        self._summary_size = None
+
+    def append(self, app_ids, prices, discounts, timestamp=None) -> int:
+        """
+        Records the `prices` in cents and `discounts` in percent of `app_ids`
+        as seen at `timestamp` which defaults to now. Returns the number of
+        observations written.
+        """
+        records = np.zeros(len(app_ids), dtype=self.dtype)
+        records["app_id"] = np.asarray(app_ids, dtype=np.int64)
+        records["timestamp"] = int(time.time() if timestamp is None else timestamp)
+        records["price"] = np.asarray(prices, dtype=np.int64)
+        records["discount"] = np.asarray(discounts, dtype=np.int64)
+        with self.lock:
+            with open(self.path, "ab") as file:
+                file.write(records.tobytes())
+        return len(records)
+
+    def record(self, prices: dict, timestamp=None) -> int:
+        """
+        Records the prices from `Steam.get_app_prices` which maps app IDs to
+        their price overview. Prices from cached responses were already seen
+        so they are skipped. Returns the number of observations written.
+        """
+        app_ids, cents, discounts = [], [], []
+        for app_id, price_data in prices.items():
+            price_overview = price_data["price_overview"]
+            if price_data.get("from_cache") or "final" not in price_overview:
+                continue
+            app_ids.append(int(app_id))
+            cents.append(price_overview["final"])
+            discounts.append(price_overview.get("discount_percent", 0))
+        if not app_ids:
+            return 0
+        return self.append(app_ids, cents, discounts, timestamp)
+
+    def read(self) -> "np.ndarray":
+        """
+        Gets every observation in the order they were recorded.
+        """
+        if not self.path.exists():
+            return np.zeros(0, dtype=self.dtype)
+        # a partly written last record from a crash is ignored
+        total = self.path.stat().st_size // self.dtype.itemsize
+        return np.fromfile(self.path, dtype=self.dtype, count=total)
+
+    def summary(self) -> "pd.DataFrame":
+        """
+        Gets the price history of each game indexed by app ID.
+
+        Prices are in cents. "price" and "discount" are from the latest
+        observation and "below_average" is how far "price" is under the
+        "average" price as a fraction of it.
+        """
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if self._summary is not None and self._summary_size == size:
+            return self._summary
+        records = self.read()
+        # hashing the app IDs avoids sorting every observation
+        codes, app_ids = pd.factorize(records["app_id"], sort=True)
+        total = len(app_ids)
+        prices = records["price"].astype(np.int64)
+        counts = np.bincount(codes, minlength=total)
+        averages = np.bincount(codes, prices, minlength=total) / np.maximum(counts, 1)
+        lows = np.full(total, np.iinfo(np.int64).max)
+        np.minimum.at(lows, codes, prices)
+        highs = np.zeros(total, dtype=np.int64)
+        np.maximum.at(highs, codes, prices)
+        # the newest observation wins and ties go to the last one written
+        order = records["timestamp"].astype(np.int64) << 32 | np.arange(len(records))
+        newest = np.zeros(total, dtype=np.int64)
+        np.maximum.at(newest, codes, order)
+        latest = newest & 0xFFFFFFFF
+        with np.errstate(divide="ignore", invalid="ignore"):
+            below_average = np.where(averages > 0, 1 - prices[latest] / averages, 0.0)
+        summary = pd.DataFrame(
+            {
+                "price": prices[latest],
+                "discount": records["discount"][latest],
+                "low": lows,
+                "high": highs,
+                "average": averages,
+                "below_average": below_average,
+                "observations": counts,
+                "last_checked": records["timestamp"][latest],
+            },
+            index=pd.Index(app_ids.astype(np.int64), name="app_id"),
+        )
+        self._summary, self._summary_size = summary, size
+        return summary
+
+    def historical_low(self, app_id) -> int | None:
+        """
+        Gets the lowest price in cents ever seen for `app_id`.
+        """
+        summary = self.summary()
+        if int(app_id) not in summary.index:
+            return None
+        return int(summary.at[int(app_id), "low"])
+
+    def at_all_time_low(self, app_ids=None) -> "pd.DataFrame":
+        """
+        Gets the summary of games, or only `app_ids`, whose latest price is
+        the lowest seen and has been higher before.
+        """
+        summary = self.summary()
+        if app_ids is not None:
+            app_ids = pd.Index(pd.to_numeric(pd.Index(app_ids), errors="coerce"))
+            summary = summary[summary.index.isin(app_ids)]
+        at_low = (summary["price"] <= summary["low"]) & (
+            summary["high"] > summary["low"]
+        )
+        return summary[at_low].sort_values("below_average", ascending=False)
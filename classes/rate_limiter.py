@@ -0,0 +1,128 @@
+import threading, random, time
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        per: float = 1.0,
+        burst: float = None,
+        base_penalty: float = 5.0,
+        max_penalty: float = 300.0,
+    ) -> None:
+        """
+        Thread safe token bucket allowing `rate` calls every `per` seconds with
+        up to `burst` calls at once.
+
+        `base_penalty` and `max_penalty` set the range in seconds that the
+        bucket is blocked for when `backoff` is used.
+        """
+        self.fill_rate = rate / per
+        self.capacity = burst if burst else rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.base_penalty = base_penalty
+        self.max_penalty = max_penalty
+        self.penalty = 0.0
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Takes a token, sleeping until one is available.
+        Returns the amount of seconds slept.
+        """
+        with self.lock:
+            cur_time = time.monotonic()
+            elapsed = cur_time - self.updated
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.fill_rate)
+            self.updated = cur_time
+            # tokens can go negative so waiting threads each reserve a later slot
+            self.tokens -= 1
+            delay = 0.0
+            if self.tokens < 0:
+                delay = -self.tokens / self.fill_rate
+            delay = max(delay, self.blocked_until - cur_time)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def backoff(self) -> float:
+        """
+        Blocks the bucket for an exponentially growing period after the api
+        responded with too many requests. Returns the period in seconds.
+
+        The block lasts between half and all of the period so threads that
+        were throttled together do not all retry at once.
+        """
+        with self.lock:
+            if self.penalty:
+                self.penalty = min(self.max_penalty, self.penalty * 2)
+            else:
+                self.penalty = self.base_penalty
+            jittered = self.penalty * random.uniform(0.5, 1.0)
+            self.blocked_until = time.monotonic() + jittered
+            self.tokens = min(self.tokens, 0)
+            return self.penalty
+
+    def reset_backoff(self) -> None:
+        """
+        Resets the backoff period after a successful call.
+        """
+        with self.lock:
+            self.penalty = 0.0
+
+
+class RateLimiter:
+    # rate calls allowed every per seconds with burst calls allowed at once
+    default_limits = {
+        "steam_app_details": {"rate": 200, "per": 300, "burst": 10},
+        "steam_review_scrape": {"rate": 200, "per": 300, "burst": 10},
+        "steam_owned_games": {"rate": 1, "per": 1},
+        "steam_player_count": {"rate": 5, "per": 1},
+        "time_to_beat": {"rate": 2, "per": 1},
+    }
+    # used for any api without a set limit
+    fallback_limit = {"rate": 2, "per": 1}
+
+    def __init__(self, limits: dict = None) -> None:
+        """
+        Shares a `TokenBucket` per api name across all threads.
+
+        `limits` overrides the default limits and usually comes from the
+        "rate_limits" entry in config.json.
+        """
+        self.limits = {api: dict(limit) for api, limit in self.default_limits.items()}
+        if limits:
+            for api, limit in limits.items():
+                self.limits.setdefault(api, dict(self.fallback_limit)).update(limit)
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def get_bucket(self, api: str) -> TokenBucket:
+        """
+        Gets the `TokenBucket` for `api`, creating it on first use.
+        """
+        with self.lock:
+            if api not in self.buckets:
+                limit = self.limits.get(api, self.fallback_limit)
+                self.buckets[api] = TokenBucket(**limit)
+            return self.buckets[api]
+
+    def acquire(self, api: str) -> float:
+        """
+        Waits until `api` can be called. Returns the amount of seconds slept.
+        """
+        return self.get_bucket(api).acquire()
+
+    def backoff(self, api: str) -> float:
+        """
+        Blocks `api` after it responded with too many requests.
+        """
+        return self.get_bucket(api).backoff()
+
+    def reset_backoff(self, api: str) -> None:
+        """
+        Resets the backoff for `api` after a successful call.
+        """
+        self.get_bucket(api).reset_backoff()
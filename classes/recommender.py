@@ -0,0 +1,116 @@
+from classes.utils import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+class Recommender:
+    # placeholder cell values that say nothing about a game
+    ignore_labels = {"-"}
+    # entries of the dense games by labels block made at a time
+    block_size = 4_000_000
+
+    def __init__(self, matrices: dict, weights: dict = None) -> None:
+        """
+        Finds games similar to liked ones using the cosine similarity of their
+        label vectors.
+
+        `matrices` are `TagMatrix` objects by column name for the same games.
+        Each game is a vector of every label from every column weighted by
+        `weights` of its column and how rare the label is so "Indie" says less
+        than "Metroidvania". Vectors are normalized so a dot product is the
+        cosine similarity.
+        """
+        self.matrices = matrices
+        weights = weights or {}
+        rows, indices, data, names = [], [], [], []
+        self.keys = None
+        for column, tag_matrix in matrices.items():
+            if self.keys is None:
+                self.keys = tag_matrix.keys
+            total_games = len(tag_matrix.keys)
+            counts = np.bincount(tag_matrix.indices, minlength=len(tag_matrix.labels))
+            idf = np.log((1 + total_games) / (1 + counts)) + 1
+            idf *= weights.get(column, 1.0)
+            idf[tag_matrix.labels.isin(self.ignore_labels)] = 0
+            rows.append(tag_matrix.rows)
+            indices.append(tag_matrix.indices + len(names))
+            data.append(idf[tag_matrix.indices])
+            names.extend(f"{column}: {label}" for label in tag_matrix.labels)
+        rows, indices, data = (np.concatenate(a) for a in (rows, indices, data))
+        # entries are ordered by game like a CSR matrix
+        order = np.argsort(rows, kind="stable")
+        keep = data[order] > 0
+        self.rows = rows[order][keep]
+        self.indices = indices[order][keep]
+        data = data[order][keep]
+        norms = np.sqrt(np.bincount(self.rows, data**2, minlength=len(self.keys)))
+        self.data = (data / norms[self.rows]).astype(np.float32)
+        self.labels = pd.Index(names)
+        self.indptr = np.zeros(len(self.keys) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.rows, minlength=len(self.keys)), out=self.indptr[1:])
+
+    def vectors(self, keys) -> "np.ndarray":
+        """
+        Gets the dense label by game matrix of the games with `keys`.
+        """
+        positions = self.keys.get_indexer(keys)
+        dense = np.zeros((len(self.labels), len(positions)), dtype=np.float32)
+        for column, row in enumerate(positions):
+            start, stop = self.indptr[row], self.indptr[row + 1]
+            dense[self.indices[start:stop], column] = self.data[start:stop]
+        return dense
+
+    def similarity(self, keys, rows=None) -> "np.ndarray":
+        """
+        Gets the cosine similarity of every game in `rows`, all by default,
+        with each game in `keys` as a games by `keys` array.
+        """
+        liked = self.vectors(keys)
+        rows = np.arange(len(self.keys)) if rows is None else np.asarray(rows)
+        scores = np.zeros((len(rows), len(keys)), dtype=np.float32)
+        lengths = np.diff(self.indptr)[rows]
+        # dense blocks of games keep memory flat for large libraries
+        per_block = max(1, self.block_size // max(1, len(self.labels)))
+        for start in range(0, len(rows), per_block):
+            stop = min(start + per_block, len(rows))
+            block_lengths = lengths[start:stop]
+            ends = np.cumsum(block_lengths)
+            # positions of the entries of each game in the block one after another
+            entries = np.repeat(
+                self.indptr[rows[start:stop]] - ends + block_lengths, block_lengths
+            ) + np.arange(ends[-1])
+            block_rows = np.repeat(np.arange(stop - start), block_lengths)
+            block = np.zeros((stop - start, len(self.labels)), dtype=np.float32)
+            block[block_rows, self.indices[entries]] = self.data[entries]
+            scores[start:stop] = block @ liked
+        return scores
+
+    def recommend(self, liked: "pd.Series", candidates, limit: int = 10):
+        """
+        Gets the `limit` games from `candidates` most similar to the `liked`
+        games which are ratings by key.
+
+        Each candidate is scored by its best match with a liked game scaled
+        by that games rating. Liked games are never recommended. Returns a
+        DataFrame with the "score" and the liked game it is "similar_to".
+        """
+        liked = liked[liked.index.isin(self.keys)]
+        candidates = pd.Index(candidates).difference(liked.index)
+        rows = self.keys.get_indexer(candidates)
+        rows = np.sort(rows[rows >= 0])
+        if not len(liked) or not len(rows):
+            return pd.DataFrame(columns=["score", "similar_to"])
+        weights = (liked / liked.max()).to_numpy(dtype=np.float32)
+        scores = self.similarity(liked.index, rows) * weights
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(rows)), best]
+        top = np.argsort(-best_scores, kind="stable")[:limit]
+        top = top[best_scores[top] > 0]
+        return pd.DataFrame(
+            {
+                "score": best_scores[top],
+                "similar_to": liked.index[best[top]],
+            },
+            index=self.keys[rows[top]],
+        )
@@ -0,0 +1,211 @@
+from pathlib import Path
+import sqlite3, hashlib, threading, json, time, zlib
+import requests
+
+
+class ResponseCache:
+    # seconds each endpoint stays cached, checked in order against the url
+    # without the host so a local `steam_store_url` is cached the same way
+    default_ttls = {
+        # app details include the current price so they go stale with sales
+        "/api/appdetails": 60 * 60,
+        "/app/": 3 * 24 * 60 * 60,
+        "GetNumberOfCurrentPlayers": 5 * 60,
+    }
+
+    def __init__(
+        self,
+        db_path: str = "configs/response_cache.db",
+        max_size_mb: float = 200,
+        endpoint_ttls: dict = None,
+    ) -> None:
+        """
+        Persistent cache of successful `request_url` responses stored in SQLite.
+
+        Entries are keyed on the url and params and expire based on the
+        `endpoint_ttls` entry matching the url. Urls without a matching entry
+        are never cached. Least recently used entries are evicted once the
+        cache grows past `max_size_mb`, which is tracked as a running total so
+        writes do not have to add up every entry.
+        """
+        self.db_path = Path(db_path)
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.endpoint_ttls = dict(self.default_ttls)
+        if endpoint_ttls:
+            self.endpoint_ttls.update(endpoint_ttls)
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                content BLOB,
+                encoding TEXT,
+                content_type TEXT,
+                size INTEGER,
+                expires_at REAL,
+                last_access REAL
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS last_access_idx ON responses(last_access)"
+        )
+        self.conn.commit()
+        self.total_size = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def get_ttl(self, url: str) -> int:
+        """
+        Gets the time to live in seconds for `url`. Returns 0 if `url` should
+        not be cached.
+        """
+        for endpoint, ttl in self.endpoint_ttls.items():
+            if endpoint in url:
+                return ttl
+        return 0
+
+    @staticmethod
+    def make_key(url: str, params: dict = None) -> str:
+        """
+        Creates a cache key from the `url` and `params`.
+        """
+        params = params or {}
+        param_str = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(f"{url}|{param_str}".encode()).hexdigest()
+
+    def get(self, url: str, params: dict = None) -> requests.Response | None:
+        """
+        Gets the cached response for `url` and `params` if it exists and has
+        not expired.
+        """
+        if not self.get_ttl(url):
+            return None
+        key = self.make_key(url, params)
+        cur_time = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT url, content, encoding, content_type, expires_at, size "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or row[4] < cur_time:
+                if row is not None:
+                    self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.conn.commit()
+                    self.total_size -= row[5]
+                self.misses += 1
+                return None
+            self.conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                (cur_time, key),
+            )
+            self.conn.commit()
+            self.hits += 1
+        response_url, content, encoding, content_type, _, _ = row
+        response = requests.Response()
+        response.status_code = requests.codes.ok
+        response.url = response_url
+        response._content = zlib.decompress(content)
+        response.encoding = encoding
+        if content_type:
+            response.headers["Content-Type"] = content_type
+        response.from_cache = True
+        return response
+
+    def set(self, url: str, params: dict, response: requests.Response) -> bool:
+        """
+        Caches `response` for `url` and `params` if the endpoint is cacheable.
+        """
+        ttl = self.get_ttl(url)
+        if not ttl:
+            return False
+        key = self.make_key(url, params)
+        content = zlib.compress(response.content)
+        cur_time = time.time()
+        row = (
+            key,
+            response.url,
+            content,
+            response.encoding,
+            response.headers.get("Content-Type"),
+            len(content),
+            cur_time + ttl,
+            cur_time,
+        )
+        with self.lock:
+            replaced = self.conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            self.total_size += len(content) - (replaced[0] if replaced else 0)
+            if self.total_size > self.max_size:
+                self.evict()
+            self.conn.commit()
+        return True
+
+    def evict(self) -> int:
+        """
+        Deletes expired entries and then the least recently used entries until
+        the cache is below its size cap. Returns the amount of entries deleted.
+
+        Must be called while holding the lock. It is only needed once the
+        running total is over the cap so the full scans here stay rare.
+        """
+        deleted = self.conn.execute(
+            "DELETE FROM responses WHERE expires_at < ?", (time.time(),)
+        ).rowcount
+        total_size = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total_size <= self.max_size:
+            self.total_size = total_size
+            return deleted
+        rows = self.conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access"
+        ).fetchall()
+        # evicts down to 90% so every new entry does not trigger an eviction
+        target_size = self.max_size * 0.9
+        old_keys = []
+        for key, size in rows:
+            if total_size <= target_size:
+                break
+            old_keys.append((key,))
+            total_size -= size
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", old_keys)
+        self.total_size = total_size
+        return deleted + len(old_keys)
+
+    def clear(self) -> None:
+        """
+        Deletes every cached response.
+        """
+        with self.lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+            self.total_size = 0
+
+    def get_stats(self) -> dict:
+        """
+        Gets the hit and miss statistics along with the cache size.
+        """
+        with self.lock:
+            entries, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "size_mb": round(size / 1024 / 1024, 2),
+        }
@@ -0,0 +1,144 @@
+from difflib import SequenceMatcher
+
+from classes.utils import lazy_import
+
+np = lazy_import("numpy")
+
+
+class SearchIndex:
+    def __init__(self, items: dict = None, max_candidates: int = 200) -> None:
+        """
+        Fuzzy name search using an inverted index of character trigrams.
+
+        `items` maps each key to its name. Only the `max_candidates` names that
+        share the most trigrams with a query are scored with SequenceMatcher
+        so searches stay fast no matter how large the library is.
+        """
+        self.max_candidates = max_candidates
+        # each name gets a row id so trigram overlaps can be counted with numpy
+        self.keys = []
+        self.names = []
+        self.trigram_counts = []
+        self.count_array = None
+        self.ids = {}
+        self.postings = {}
+        self.posting_arrays = {}
+        self.exact = {}
+        for key, name in (items or {}).items():
+            self.add(key, name)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return " ".join(str(name).lower().split())
+
+    @staticmethod
+    def get_trigrams(name: str) -> set:
+        """
+        Gets the set of trigrams in `name` with padding so short names and
+        word starts still have trigrams.
+        """
+        padded = f"  {name} "
+        return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+    def add(self, key, name: str) -> None:
+        """
+        Adds or updates the `name` for `key`.
+        """
+        key = str(key)
+        if key in self.ids:
+            self.remove(key)
+        if not name or name != name:
+            return
+        name = self.normalize(name)
+        trigrams = self.get_trigrams(name)
+        row = len(self.keys)
+        self.keys.append(key)
+        self.names.append(name)
+        self.trigram_counts.append(len(trigrams))
+        self.count_array = None
+        self.ids[key] = row
+        self.exact.setdefault(name, set()).add(key)
+        for trigram in trigrams:
+            self.postings.setdefault(trigram, []).append(row)
+            self.posting_arrays.pop(trigram, None)
+
+    def remove(self, key) -> bool:
+        """
+        Removes `key` from the index. Returns True if it was indexed.
+        """
+        key = str(key)
+        row = self.ids.pop(key, None)
+        if row is None:
+            return False
+        name = self.names[row]
+        self.exact[name].discard(key)
+        if not self.exact[name]:
+            del self.exact[name]
+        for trigram in self.get_trigrams(name):
+            rows = self.postings[trigram]
+            rows.remove(row)
+            self.posting_arrays.pop(trigram, None)
+            if not rows:
+                del self.postings[trigram]
+        # the row is left empty so the other row ids stay the same
+        self.names[row] = None
+        return True
+
+    def get_posting_array(self, trigram: str):
+        if trigram not in self.posting_arrays:
+            rows = self.postings.get(trigram, [])
+            self.posting_arrays[trigram] = np.array(rows, dtype=np.int32)
+        return self.posting_arrays[trigram]
+
+    def find_exact(self, query: str) -> list:
+        """
+        Gets the keys with a name matching `query` ignoring case.
+        """
+        return sorted(self.exact.get(self.normalize(query), ()))
+
+    def get_candidates(self, query: str) -> list:
+        """
+        Gets the rows of the names most similar to `query` by trigram overlap.
+        """
+        query_trigrams = self.get_trigrams(query)
+        found = [t for t in query_trigrams if t in self.postings]
+        if not found:
+            return []
+        rows = np.concatenate([self.get_posting_array(t) for t in found])
+        overlap = np.bincount(rows, minlength=len(self.keys))
+        matched = np.flatnonzero(overlap)
+        if self.count_array is None:
+            self.count_array = np.array(self.trigram_counts)
+        # dice coefficient so long names sharing a word do not crowd out matches
+        totals = self.count_array[matched] + len(query_trigrams)
+        dice = 2 * overlap[matched] / totals
+        if len(matched) > self.max_candidates:
+            best = np.argpartition(-dice, self.max_candidates)[: self.max_candidates]
+            matched = matched[best]
+        return matched.tolist()
+
+    def search(self, query: str, limit: int = 10, min_match: float = 0.6) -> list:
+        """
+        Gets up to `limit` `(key, score)` tuples for names that are at least a
+        `min_match` SequenceMatcher ratio of `query` with the best first.
+        """
+        query = self.normalize(query)
+        if not query:
+            return []
+        matches = []
+        matcher = SequenceMatcher(None, b=query)
+        for row in self.get_candidates(query):
+            # SequenceMatcher caches details about the second sequence
+            matcher.set_seq1(self.names[row])
+            if matcher.real_quick_ratio() < min_match:
+                continue
+            if matcher.quick_ratio() < min_match:
+                continue
+            score = matcher.ratio()
+            if score >= min_match:
+                matches.append((self.keys[row], score))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches[:limit]
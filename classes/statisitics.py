@@ -6,14 +6,12 @@ import json
 
 from easierexcel import Excel, Sheet
 
+from classes.tag_matrix import TagMatrix
+
 
 class Stat:
     def __init__(self, dataframe):
         self.df = dataframe
-        # turns Genre section from string to series
-        self.df["Genre"] = self.df["Genre"].str.replace(" and ", ",")
-        self.df["Genre"] = self.df["Genre"].str.replace(" ", "")
-        self.df["Genre"] = self.df["Genre"].str.split(",")
 
     def my_rating_comparison(self):
         y_value = "Steam Review Percent"
@@ -121,6 +119,25 @@ class Stat:
         plt.tight_layout()
         plt.show()
 
+    def tag_co_occurrence(self, top_n=15):
+        """
+        Shows how many games share each pair of the most common user tags.
+        """
+        tags = TagMatrix.from_series(self.df["User Tags"])
+        matrix = tags.co_occurrence(top_n)
+
+        # sets up graph
+        plt.title("User Tag Co-occurrence")
+        plt.imshow(matrix, cmap="Blues")
+        plt.colorbar(label="Games")
+
+        # labels
+        positions = range(len(matrix.index))
+        plt.xticks(positions, matrix.columns, rotation=90)
+        plt.yticks(positions, matrix.index)
+        plt.tight_layout()
+        plt.show()
+
 
 if __name__ == "__main__":
     # excel setup
@@ -153,4 +170,5 @@ if __name__ == "__main__":
     stats = Stat(df)
     stats.get_game_statistics()
     stats.my_rating_comparison()
+    stats.tag_co_occurrence()
     # stats.rating_release_comparison("Steam Review Percent")
@@ -1,17 +1,22 @@
+from classes.metrics import metrics
+from classes.store_page import StorePage, StorePageParser
 from classes.utils import Utils
-from bs4 import BeautifulSoup
-import re
 
 
 class Steam(Utils):
+    store_page_parser = StorePageParser()
+    # can be pointed at a local server such as `testing/fake_steam_server.py`
+    api_url = "https://api.steampowered.com/"
+    store_url = "https://store.steampowered.com/"
+    # most app IDs sent in a single price only app details request
+    price_chunk_size = 100
 
     def get_steam_username(self, steam_id: int, steam_key: int) -> str:
         """
         Gets a username based on the given `steam_id`.
         """
-        main_url = "https://api.steampowered.com/"
         api_action = "ISteamUser/GetPlayerSummaries/v0002/"
-        url = main_url + api_action
+        url = self.api_url + api_action
         params = {"key": steam_key, "steamids": steam_id}
         response = self.request_url(url=url, params=params)
         username = "Unknown"
@@ -32,9 +37,8 @@ class Steam(Utils):
         """
         Gets a users Steam ID via their `vanity_url` or `vanity_username`.
         """
-        main_url = "https://api.steampowered.com/"
         api_action = "ISteamUser/ResolveVanityURL/v0001/"
-        url = main_url + api_action
+        url = self.api_url + api_action
         query = {
             "key": steam_key,
             "vanityurl": vanity_url,
@@ -51,9 +55,8 @@ class Steam(Utils):
         """
         Gets a users Steam friends list.
         """
-        main_url = "https://api.steampowered.com/"
         api_action = "ISteamUser/GetFriendList/v0001/"
-        url = main_url + api_action
+        url = self.api_url + api_action
         params = {
             "key": steam_key,
             "steamid": steam_id,
@@ -71,72 +74,41 @@ class Steam(Utils):
         """
         return f"https://store.steampowered.com/app/{app_id}/"
 
+    def get_store_page(self, app_id: int, response=None) -> StorePage:
+        """
+        Scrapes the review and user tag data from the games steam store page
+        using `app_id` or an already fetched `response`.
+        """
+        if not response:
+            self.api_sleeper("steam_review_scrape")
+            # the sheet keeps the real store link even when `store_url` is changed
+            store_link = f"{self.store_url}app/{app_id}/"
+            response = self.request_url(store_link, api="steam_review_scrape")
+        if not response:
+            return StorePage()
+        with metrics.span("parse store page"):
+            return self.store_page_parser.parse(response.text)
+
     def get_steam_review(self, app_id: int, response=None):
         """
         Scrapes the games review percent and total reviews from
         the steam store page using `app_id` or `store_link`.
         """
-        if not response:
-            self.api_sleeper("steam_review_scrape")
-            store_link = self.get_store_link(app_id)
-            response = self.request_url(store_link)
-        soup = BeautifulSoup(response.text, "html.parser")
-        hidden_review_class = "nonresponsive_hidden responsive_reviewdesc"
-        results = soup.find_all(class_=hidden_review_class)
-        if len(results) == 1:
-            text = results[0].text.strip()
-        elif len(results) > 1:
-            text = results[1].text.strip()
-        else:
-            return "No Reviews", "No Reviews"
-        parsed_data = text[2:26].split("% of the ")
-        # get percent
-        no_reviews = "No Reviews"
-        too_few_reviews = "Few Reviews"
-        review_perc = parsed_data[0]
-        if review_perc.isnumeric():
-            if review_perc == "100":
-                percent = 1
-            else:
-                percent = float(f".{review_perc}")
-        else:
-            percent = too_few_reviews
-        # get total
-        if len(parsed_data) > 1:
-            cleaned_num = parsed_data[1].replace(",", "")
-            total = int(re.search(r"\d+", cleaned_num).group())
-        elif percent == too_few_reviews:
-            total = too_few_reviews
-        else:
-            total = no_reviews
-        return percent, total
+        store_page = self.get_store_page(app_id, response)
+        return store_page.review_percent, store_page.review_total
 
     def get_steam_user_tags(self, app_id: int, response=None):
         """
         Gets a games user tags from Steam.
         """
-        if not response:
-            self.api_sleeper("steam_review_scrape")
-            store_link = self.get_store_link(app_id)
-            response = self.request_url(store_link)
-        soup = BeautifulSoup(response.text, "html.parser")
-        hidden_review_class = "app_tag"
-        results = soup.find_all(class_=hidden_review_class)
-        tags = []
-        ignore_tags = ["+"]
-        for tag in results:
-            string = tag.text.strip()
-            if string not in ignore_tags:
-                tags.append(string)
-        return tags
+        return self.get_store_page(app_id, response).tags
 
     def get_owned_steam_games(self, steam_key: str, steam_id: int):
         """
         Gets the games owned by the given `steam_id`.
         """
-        base_url = "http://api.steampowered.com/"
         api_action = "IPlayerService/GetOwnedGames/v0001/"
-        url = base_url + api_action
+        url = self.api_url + api_action
         self.api_sleeper("steam_owned_games")
         query = {
             "key": steam_key,
@@ -146,7 +118,7 @@ class Steam(Utils):
             "format": "json",
             "include_appinfo": 1,
         }
-        response = self.request_url(url, params=query)
+        response = self.request_url(url, params=query, api="steam_owned_games")
         if response:
             return response.json()["response"]["games"]
         return response
@@ -155,51 +127,143 @@ class Steam(Utils):
         self, steam_key: str, steam_id: int, game_count: int = 10
     ):
         """
-        Gets the games owned by the given `steam_id`.
+        Gets the games played in the last two weeks by the given `steam_id`.
+
+        A `game_count` of 0 gets all of them.
         """
-        base_url = "http://api.steampowered.com/"
         api_action = "IPlayerService/GetRecentlyPlayedGames/v1/"
-        url = base_url + api_action
+        url = self.api_url + api_action
         self.api_sleeper("steam_owned_games")
         query = {
             "key": steam_key,
             "steamid": steam_id,
             "count": game_count,
         }
-        response = self.request_url(url, params=query)
-        return response.json()["response"]["games"]
+        response = self.request_url(url, params=query, api="steam_owned_games")
+        if response:
+            # games is left out when nothing was played recently
+            return response.json()["response"].get("games", [])
+        return None
+
+    def get_owned_game_count(self, steam_key: str, steam_id: int) -> int | None:
+        """
+        Gets the number of games owned by the given `steam_id` without
+        getting each games app info.
+        """
+        api_action = "IPlayerService/GetOwnedGames/v0001/"
+        url = self.api_url + api_action
+        self.api_sleeper("steam_owned_games")
+        query = {
+            "key": steam_key,
+            "steamid": steam_id,
+            "include_played_free_games": 0,
+            "format": "json",
+            "include_appinfo": 0,
+        }
+        response = self.request_url(url, params=query, api="steam_owned_games")
+        if response:
+            return response.json()["response"].get("game_count")
+        return None
 
     def get_app_details(self, app_id) -> [{}]:
         """
         Gets game details.
         """
-        url = "https://store.steampowered.com/api/appdetails"
+        url = self.store_url + "api/appdetails"
         self.api_sleeper("steam_app_details")
         query = {"appids": app_id, "l": "english"}
-        response = self.request_url(url, params=query)
+        response = self.request_url(url, params=query, api="steam_app_details")
         if response:
-            return response.json()
+            with metrics.span("parse app details"):
+                return response.json()
         return None
 
+    def get_app_prices(self, app_ids, use_cache=False) -> dict:
+        """
+        Gets the price overview of each of `app_ids` by app ID string.
+
+        Only the price block is requested so many apps fit in one app details
+        request. Free or unlisted apps and failed requests are left out.
+        Prices skip the response cache unless `use_cache` is True since sales
+        end long before cached app details expire. Prices from a cached
+        response have "from_cache" set so they are not mistaken for new ones.
+        """
+        app_ids = [str(app_id) for app_id in app_ids]
+        url = self.store_url + "api/appdetails"
+        prices = {}
+        for start in range(0, len(app_ids), self.price_chunk_size):
+            chunk = app_ids[start : start + self.price_chunk_size]
+            self.api_sleeper("steam_app_details")
+            query = {
+                "appids": ",".join(chunk),
+                "filters": "price_overview",
+                "l": "english",
+            }
+            response = self.request_url(
+                url, params=query, api="steam_app_details", use_cache=use_cache
+            )
+            if not response:
+                continue
+            with metrics.span("parse app prices"):
+                app_details = response.json() or {}
+                for app_id in chunk:
+                    data = app_details.get(app_id, {}).get("data")
+                    # free apps have an empty list instead of a dict
+                    if data and "price_overview" in data:
+                        if getattr(response, "from_cache", False):
+                            data["from_cache"] = True
+                        prices[app_id] = data
+        return prices
+
     def get_app_list(self) -> [{}]:
         """
         Gets the full Steam app list as a dict.
         """
-        main_url = "https://api.steampowered.com/"
         api_action = "ISteamApps/GetAppList/v0002/"
-        url = main_url + api_action
+        url = self.api_url + api_action
         query = {"l": "english"}
-        response = self.request_url(url, params=query)
+        # `AppList` already keeps the app list on disk
+        response = self.request_url(url, params=query, use_cache=False)
         if not response:
             return None
         app_list = response.json()["applist"]["apps"]
         return app_list
 
+    def get_app_list_changes(self, steam_key: str, if_modified_since: int = 0) -> [{}]:
+        """
+        Gets the apps added or changed on Steam since the `if_modified_since`
+        timestamp using the `steam_key`.
+        """
+        url = self.api_url + "IStoreService/GetAppList/v1/"
+        query = {
+            "key": steam_key,
+            "if_modified_since": if_modified_since,
+            "include_games": True,
+            "include_dlc": True,
+            "include_software": True,
+            "include_videos": True,
+            "include_hardware": True,
+            "max_results": 50000,
+        }
+        apps = []
+        while True:
+            response = self.request_url(url, params=query, use_cache=False)
+            if not response:
+                return None
+            data = response.json().get("response", {})
+            apps.extend(data.get("apps", []))
+            if not data.get("have_more_results"):
+                return apps
+            query["last_appid"] = data["last_appid"]
+
     @staticmethod
     def get_app_id(game: str, app_list: [{}]) -> int | None:
         """
         Gets the games app ID from the `app_list`.
         """
+        # an AppList cache has its own name index
+        if hasattr(app_list, "get_app_id"):
+            return app_list.get_app_id(game)
         for item in app_list:
             if item["name"] == game:
                 return item["appid"]
@@ -211,8 +275,9 @@ class Steam(Utils):
         """
         Gets a games current player count by `app_id` using the Steam API via the `steam_api_key`.
         """
-        url = f"http://api.steampowered.com/ISteamUserStats/GetNumberOfCurrentPlayers/v1/?appid={app_id}&key={steam_api_key}"
-        response = self.request_url(url)
+        url = f"{self.api_url}ISteamUserStats/GetNumberOfCurrentPlayers/v1/?appid={app_id}&key={steam_api_key}"
+        self.api_sleeper("steam_player_count")
+        response = self.request_url(url, api="steam_player_count")
         if response:
             data = response.json()
             current_players = data.get("response", {}).get("player_count", "N/A")
@@ -0,0 +1,96 @@
+from typing import NamedTuple
+from html import unescape
+import re
+
+
+class StorePage(NamedTuple):
+    """
+    Data scraped from a Steam store page.
+    """
+
+    review_percent: float or str = "No Reviews"
+    review_total: int or str = "No Reviews"
+    review_summary: str = "No Reviews"
+    recent_review_percent: float or str = "No Reviews"
+    tags: list = []
+
+
+class StorePageParser:
+    """
+    Pulls the review summary and user tags out of a Steam store page in a
+    single pass over the raw html instead of building a full DOM.
+    """
+
+    # only the elements needed are matched so the rest of the page is skipped
+    element_re = re.compile(
+        r'<(span|a|div)\b[^>]*?\bclass="('
+        r"nonresponsive_hidden responsive_reviewdesc"
+        r"|game_review_summary[^\"]*"
+        r'|app_tag[^"]*'
+        r')"[^>]*>(.*?)</\1>',
+        re.DOTALL,
+    )
+    inner_tag_re = re.compile(r"<[^>]+>")
+    total_re = re.compile(r"\d+")
+    ignore_tags = ["+"]
+    no_reviews = "No Reviews"
+    too_few_reviews = "Few Reviews"
+
+    def get_text(self, html: str) -> str:
+        """
+        Gets the text within an element like BeautifulSoup's `text` does.
+        """
+        return unescape(self.inner_tag_re.sub("", html)).strip()
+
+    def parse_review_desc(self, text: str):
+        """
+        Gets the review percent and total from a review description such as
+        "- 95% of the 1,234 user reviews for this game are positive.".
+        """
+        parsed_data = text[2:26].split("% of the ")
+        # get percent
+        review_perc = parsed_data[0]
+        if review_perc.isnumeric():
+            if review_perc == "100":
+                percent = 1
+            else:
+                percent = float(f".{review_perc}")
+        else:
+            percent = self.too_few_reviews
+        # get total
+        if len(parsed_data) > 1:
+            cleaned_num = parsed_data[1].replace(",", "")
+            total = int(self.total_re.search(cleaned_num).group())
+        elif percent == self.too_few_reviews:
+            total = self.too_few_reviews
+        else:
+            total = self.no_reviews
+        return percent, total
+
+    def parse(self, html: str) -> StorePage:
+        """
+        Parses the store page `html`.
+        """
+        review_descs, summaries, tags = [], [], []
+        for _, class_name, inner in self.element_re.findall(html or ""):
+            if class_name == "nonresponsive_hidden responsive_reviewdesc":
+                review_descs.append(self.get_text(inner))
+            elif class_name.startswith("game_review_summary"):
+                summaries.append(self.get_text(inner))
+            elif "app_tag" in class_name.split():
+                tag = self.get_text(inner)
+                if tag not in self.ignore_tags:
+                    tags.append(tag)
+        if not review_descs:
+            return StorePage(tags=tags)
+        # the recent reviews come first when a game has both
+        recent_percent = self.no_reviews
+        if len(review_descs) > 1:
+            recent_percent, _ = self.parse_review_desc(review_descs[0])
+        percent, total = self.parse_review_desc(
+            review_descs[min(len(review_descs), 2) - 1]
+        )
+        summary = self.no_reviews
+        if summaries:
+            summary = summaries[min(len(summaries), 2) - 1]
+        return StorePage(percent, total, summary, recent_percent, tags)
@@ -0,0 +1,161 @@
+from classes.utils import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+class TagMatrix:
+    # rows of the dense block used for co-occurrence at a time
+    chunk_size = 4096
+
+    def __init__(self, keys: list, labels: list, indptr, indices, source_key=None):
+        """
+        Sparse game by tag indicator matrix stored like a CSR matrix.
+
+        The labels of row `i` are `labels[indices[indptr[i]:indptr[i + 1]]]`
+        so counts and per label aggregates are single `bincount` calls over
+        `indices` instead of exploding a DataFrame to one row per game and tag.
+
+        `source_key` records what the matrix was built from so callers can
+        tell when it has to be rebuilt.
+        """
+        self.keys = pd.Index(keys)
+        self.labels = pd.Index(labels)
+        self.indptr = indptr
+        self.indices = indices
+        self.source_key = source_key
+        # row of each stored entry
+        self.rows = np.repeat(np.arange(len(self.keys)), np.diff(indptr))
+
+    @classmethod
+    def from_series(
+        cls, series: "pd.Series", split_and: bool = False, source_key=None
+    ) -> "TagMatrix":
+        """
+        Builds the matrix from a Series of comma separated labels such as the
+        "User Tags" or "Genre" column. Blank or missing cells have no labels.
+
+        `split_and` also splits on " and " for columns that were written as a
+        sentence like older Genre cells. User tags such as "Hack and Slash"
+        need it left off.
+        """
+        cells = [
+            value.strip() if isinstance(value, str) else "" for value in series.tolist()
+        ]
+        if split_and:
+            cells = [cell.replace(" and ", ",") for cell in cells]
+        # one split over every cell keeps the per label work out of python
+        lengths = np.fromiter((cell.count(",") + 1 for cell in cells), np.int64)
+        joined = ",".join(cells).replace(", ", ",")
+        labels = joined.split(",")
+        # only cells with extra spaces around a comma need stripping
+        if " ," in joined or ", " in joined:
+            labels = [label.strip() for label in labels]
+        codes, vocab = pd.factorize(np.array(labels, dtype=object))
+        rows = np.repeat(np.arange(len(cells)), lengths)
+        # duplicates within a cell are only counted once
+        keep = ~pd.Index(rows * len(vocab) + codes).duplicated()
+        # blank cells and labels are dropped
+        blank = pd.Index(vocab).get_indexer([""])[0]
+        if blank >= 0:
+            keep &= codes != blank
+            codes = codes - (codes > blank)
+            vocab = np.delete(vocab, blank)
+        codes, rows = codes[keep], rows[keep]
+        indptr = np.zeros(len(cells) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(cells)), out=indptr[1:])
+        return cls(
+            series.index,
+            list(vocab),
+            indptr,
+            codes.astype(np.int32),
+            source_key,
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.keys), len(self.labels)
+
+    def align(self, values) -> "np.ndarray":
+        """
+        Gets `values` as floats in row order. A Series is matched on its index
+        and anything that is not a number becomes NaN.
+        """
+        if isinstance(values, pd.Series):
+            values = values.reindex(self.keys)
+        return pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(
+            dtype=float, na_value=np.nan
+        )
+
+    def counts(self) -> "pd.Series":
+        """
+        Gets the number of games with each label, most common first.
+        """
+        counts = np.bincount(self.indices, minlength=len(self.labels))
+        return pd.Series(counts, index=self.labels).sort_values(
+            ascending=False, kind="stable"
+        )
+
+    def aggregate(self, values) -> "pd.DataFrame":
+        """
+        Gets the "count", "sum" and "mean" of `values` for each label with
+        games missing a value left out.
+        """
+        entry_values = self.align(values)[self.rows]
+        valid = ~np.isnan(entry_values)
+        indices = self.indices[valid]
+        total = len(self.labels)
+        counts = np.bincount(indices, minlength=total)
+        sums = np.bincount(indices, weights=entry_values[valid], minlength=total)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / counts
+        return pd.DataFrame(
+            {"count": counts, "sum": sums, "mean": means}, index=self.labels
+        )
+
+    def games_with(self, label: str) -> "pd.Index":
+        """
+        Gets the keys of the games with `label`.
+        """
+        if label not in self.labels:
+            return self.keys[:0]
+        rows = self.rows[self.indices == self.labels.get_loc(label)]
+        return self.keys[rows]
+
+    def related(self, label: str, limit: int = 10) -> "pd.Series":
+        """
+        Gets the labels that appear on the most games along with `label`.
+        """
+        if label not in self.labels:
+            return pd.Series(dtype=int)
+        label_idx = self.labels.get_loc(label)
+        has_label = np.zeros(len(self.keys), dtype=bool)
+        has_label[self.rows[self.indices == label_idx]] = True
+        counts = np.bincount(
+            self.indices[has_label[self.rows]], minlength=len(self.labels)
+        )
+        counts[label_idx] = 0
+        related = pd.Series(counts, index=self.labels)
+        related = related[related > 0].sort_values(ascending=False, kind="stable")
+        return related.head(limit)
+
+    def co_occurrence(self, top_n: int = 20) -> "pd.DataFrame":
+        """
+        Gets how many games share each pair of the `top_n` most common labels.
+        The diagonal is the count of each label.
+        """
+        top = self.counts().head(top_n)
+        position = np.full(len(self.labels), -1)
+        position[self.labels.get_indexer(top.index)] = np.arange(len(top))
+        entry_pos = position[self.indices]
+        keep = entry_pos >= 0
+        rows, entry_pos = self.rows[keep], entry_pos[keep]
+        matrix = np.zeros((len(top), len(top)), dtype=np.float64)
+        # dense blocks of rows keep memory flat for large libraries
+        for start in range(0, len(self.keys), self.chunk_size):
+            stop = min(start + self.chunk_size, len(self.keys))
+            in_chunk = (rows >= start) & (rows < stop)
+            block = np.zeros((stop - start, len(top)), dtype=np.float32)
+            block[rows[in_chunk] - start, entry_pos[in_chunk]] = 1
+            matrix += block.T @ block
+        return pd.DataFrame(matrix.astype(np.int64), index=top.index, columns=top.index)
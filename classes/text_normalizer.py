@@ -0,0 +1,102 @@
+import re
+
+
+class TextNormalizer:
+    # joins strings in bulk mode since no rule or name uses it
+    separator = "\x00"
+
+    def __init__(self, replacements: dict) -> None:
+        """
+        Replaces each key of `replacements` with its value and then drops any
+        character that is not ASCII.
+
+        Every rule is compiled into one regex so a string is only scanned
+        once. The result matches replacing each rule one after the other in
+        the order given.
+        """
+        self.replacements = replacements
+        keys = sorted(replacements, key=len, reverse=True)
+        self.pattern = re.compile("|".join(map(re.escape, keys)))
+        # ascii strings without these only need stripping
+        self.ascii_triggers = tuple({key[0] for key in replacements if key.isascii()})
+
+    def replace_match(self, match) -> str:
+        return self.replacements[match.group()]
+
+    def replace_in_order(self, string: str) -> str:
+        """
+        Applies every rule one after the other like chained `str.replace` calls.
+        """
+        for key in self.replacements:
+            if key in string:
+                for key, value in self.replacements.items():
+                    string = string.replace(key, value)
+        return string
+
+    def needs_rules(self, string: str) -> bool:
+        if not string.isascii():
+            return True
+        for char in self.ascii_triggers:
+            if char in string:
+                return True
+        return False
+
+    def apply_rules(self, string: str) -> str | None:
+        """
+        Applies every rule to `string` in a single pass. Returns None if a
+        replacement formed a new match so the rules have to run in order.
+        """
+        if not self.needs_rules(string):
+            return string
+        text = self.pattern.sub(self.replace_match, string)
+        if self.pattern.search(text):
+            return None
+        return text
+
+    def replace(self, string: str) -> str:
+        """
+        Applies every rule to `string`.
+        """
+        text = self.apply_rules(string)
+        if text is None:
+            return self.replace_in_order(string)
+        return text
+
+    def normalize(self, string):
+        """
+        Normalizes `string`. Anything that is not a string is returned as is.
+        """
+        if type(string) != str:
+            return string
+        text = self.replace(string)
+        if not text.isascii():
+            text = text.encode("ascii", "ignore").decode()
+        return text.strip()
+
+    def normalize_many(self, values) -> list:
+        """
+        Normalizes every value in `values` at once. The strings that need
+        rules are joined so the regex only scans one large string.
+        """
+        cleaned = list(values)
+        indexes = []
+        for index, value in enumerate(cleaned):
+            if type(value) != str:
+                continue
+            if self.needs_rules(value):
+                indexes.append(index)
+            else:
+                cleaned[index] = value.strip()
+        if not indexes:
+            return cleaned
+        strings = [cleaned[index] for index in indexes]
+        text = self.apply_rules(self.separator.join(strings))
+        if text is None or text.count(self.separator) != len(strings) - 1:
+            for index in indexes:
+                cleaned[index] = self.normalize(cleaned[index])
+            return cleaned
+        if not text.isascii():
+            text = text.encode("ascii", "ignore").decode()
+        for index, string in zip(indexes, text.split(self.separator)):
+            cleaned[index] = string.strip()
+        return cleaned
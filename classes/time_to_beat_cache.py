@@ -0,0 +1,133 @@
+from pathlib import Path
+import sqlite3, threading, json, time, re
+
+
+class TimeToBeatCache:
+    # entries without a time to beat are looked up again after these seconds
+    not_found_retry = 30 * 24 * 60 * 60
+    error_retry = 60 * 60
+
+    def __init__(
+        self,
+        db_path: str = "configs/time_to_beat.db",
+        not_found_retry_days: float = None,
+    ) -> None:
+        """
+        Persistent store of HowLongToBeat results stored in SQLite.
+
+        Results are keyed on the normalized game name so Steam and Playstation
+        titles share them and app IDs point to the name they were found with.
+        Games that were not found or failed to load are remembered until their
+        retry time so they are not searched for on every sync.
+        """
+        self.db_path = Path(db_path)
+        if not_found_retry_days is not None:
+            self.not_found_retry = not_found_retry_days * 24 * 60 * 60
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "name_key TEXT PRIMARY KEY, time_to_beat TEXT NOT NULL, "
+                "found INTEGER NOT NULL, checked_at REAL NOT NULL, retry_at REAL)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS app_ids ("
+                "app_id TEXT PRIMARY KEY, name_key TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def normalize(game_name: str) -> str:
+        """
+        Gets the key for `game_name` ignoring case, symbols and punctuation.
+        """
+        name = str(game_name).casefold().replace("’", "'").replace("'", "")
+        return " ".join(re.sub(r"[\W_]+", " ", name).split())
+
+    def get_name_key(self, game_name: str, app_id=None) -> str:
+        """
+        Gets the key a result for `app_id` was stored under or the key for
+        `game_name` if there is none. Must be called while holding the lock.
+        """
+        if app_id is not None:
+            row = self.conn.execute(
+                "SELECT name_key FROM app_ids WHERE app_id = ?", (str(app_id),)
+            ).fetchone()
+            if row:
+                return row[0]
+        return self.normalize(game_name)
+
+    def get(self, game_name: str, app_id=None):
+        """
+        Gets the stored time to beat for `game_name` or `app_id`. Returns None
+        if it has to be looked up.
+        """
+        with self.lock:
+            name_key = self.get_name_key(game_name, app_id)
+            row = self.conn.execute(
+                "SELECT time_to_beat, found, retry_at FROM results WHERE name_key = ?",
+                (name_key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            time_to_beat, found, retry_at = row
+            if found:
+                self.hits += 1
+            elif retry_at is not None and retry_at > time.time():
+                self.negative_hits += 1
+            else:
+                self.misses += 1
+                return None
+        return json.loads(time_to_beat)
+
+    def set(self, game_name: str, time_to_beat, app_id=None) -> None:
+        """
+        Stores `time_to_beat` for `game_name` and `app_id`.
+
+        "-" means the game was not found and "" that HowLongToBeat could not
+        be reached. Both are retried later.
+        """
+        found = time_to_beat not in ("-", "", None)
+        cur_time = time.time()
+        retry_at = None
+        if time_to_beat in ("", None):
+            retry_at = cur_time + self.error_retry
+        elif not found:
+            retry_at = cur_time + self.not_found_retry
+        name_key = self.normalize(game_name)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (name_key, json.dumps(time_to_beat), found, cur_time, retry_at),
+            )
+            if app_id is not None:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO app_ids VALUES (?, ?)",
+                    (str(app_id), name_key),
+                )
+
+    def get_stats(self) -> dict:
+        """
+        Gets the hit and miss statistics along with the stored result totals.
+        """
+        with self.lock:
+            entries, found = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(found), 0) FROM results"
+            ).fetchone()
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+            "entries": entries,
+            "not_found": entries - found,
+        }
+
+    def close(self) -> None:
+        self.conn.close()
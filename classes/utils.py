@@ -1,16 +1,55 @@
+from functools import cached_property, wraps
 from difflib import SequenceMatcher
 from pathlib import Path
-import time, json, requests, re
+from urllib.parse import urlparse
+import time, json, requests, re, sys
+import importlib.util
 from pick import pick
 import datetime as dt
-import pandas as pd
 
 
 # logging import if helper.py is main
 if __name__ != "__main__":
     from classes.logger import Logger
+    from classes.rate_limiter import RateLimiter
+    from classes.http_session import create_session
+    from classes.text_normalizer import TextNormalizer
+    from classes.metrics import metrics
 else:
     from logger import Logger
+    from rate_limiter import RateLimiter
+    from http_session import create_session
+    from text_normalizer import TextNormalizer
+    from metrics import metrics
+
+
+# replaced in order before any other unicode is removed
+unicode_replacements = {
+    # unicode character
+    "â€": "'",
+    "®": "",
+    "™": "",
+    "â„¢": "",
+    "Â": "",
+    "Ã›": "U",
+    "ö": "o",
+    "Ã¶": "o",
+    # unicode value
+    "\u2122": "",  # Trademarked sign
+    "\u00ae": "",  # REGISTERED SIGN
+    "\u00e5": "a",  # a
+    "\u00f6": "o",  # LATIN SMALL LETTER O WITH DIAERESIS
+    "\u00e9": "e",  # LATIN SMALL LETTER E WITH ACUTE
+    "\u2013": "-",  # EN DASH
+    # HTML entities
+    "&amp": "&",  # &
+    "&quot;": '"',  # "
+    "&apos;": "'",  # '
+    "&cent;": "",  # cent
+    "&copy;": "",  # copyright sign
+    "&reg;": "",  # trademark sign
+}
+unicode_normalizer = TextNormalizer(unicode_replacements)
 
 
 def keyboard_interrupt(func):
@@ -35,11 +74,15 @@ def keyboard_interrupt(func):
 def benchmark(func):
     """
     Prints `func` name and a benchmark for runtime.
+
+    The runtime is also recorded as a `metrics` span.
     """
 
+    @wraps(func)
     def wrapped(*args, **kwargs):
         start = time.perf_counter()
-        value = func(*args, **kwargs)
+        with metrics.span(func.__name__):
+            value = func(*args, **kwargs)
         end = time.perf_counter()
         elapsed = end - start
         print(f"{func.__name__} Completion Time: {elapsed:.2f}")
@@ -48,6 +91,47 @@ def benchmark(func):
     return wrapped
 
 
+def lazy_import(name):
+    """
+    Imports the module `name` but only runs it once one of its attributes is
+    first used.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# seconds taken by each `lazy_property` the first time it was used
+startup_times = {}
+
+
+def lazy_property(func):
+    """
+    Cached property that is only created the first time it is used.
+
+    The time it took is recorded in `startup_times`.
+    """
+
+    @wraps(func)
+    def wrapped(self):
+        start = time.perf_counter()
+        value = func(self)
+        startup_times[func.__name__] = time.perf_counter() - start
+        return value
+
+    return cached_property(wrapped)
+
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+
+
 def get_steam_key_and_id():
     """
     Gets the steam key and steam id from the config file.
@@ -75,54 +159,130 @@ class Utils:
         except requests.exceptions.RequestException:
             return False
 
-    def request_url(self, url, params=None, headers=None, second_try=False):
-        try:
-            response = requests.get(url, params=params, headers=headers)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            if second_try:
-                return False
-
-            if isinstance(e, requests.exceptions.ConnectionError):
-                msg = "Connection Error: Internet can't be accessed"
-            elif isinstance(e, requests.exceptions.TooManyRedirects):
-                msg = "Too Many Redirects: Exceeded 30 redirects"
-            elif isinstance(e, requests.exceptions.ReadTimeout):
-                return False
+    # set to a ResponseCache to reuse responses across runs
+    response_cache = None
+    # shared by every instance so limits and connections apply across all threads
+    rate_limiter = RateLimiter()
+    session = create_session()
+    # seconds to wait for a connection and then for the server to respond
+    request_timeout = (5, 30)
+    # retries and seconds between them for requests that could not connect
+    connection_retries = 1
+    connection_retry_delay = 1.0
+
+    def request_url(
+        self, url, params=None, headers=None, api=None, max_retries=3, use_cache=True
+    ):
+        """
+        Gets the response from `url` or False if the request failed.
+
+        Too many requests responses cause the `api` rate limit to back off
+        before retrying up to `max_retries` times. `api` defaults to the host
+        of the `url`.
+
+        Connection errors and timeouts are retried `connection_retries` times
+        after a short wait that does not hold up other requests to `api`.
+        Other request errors are not retried.
+
+        The response cache is skipped if `use_cache` is False.
+        """
+        if self.response_cache and use_cache:
+            response = self.response_cache.get(url, params)
+            if response:
+                metrics.count("response_cache_hits")
+                return response
+            metrics.count("response_cache_misses")
+        api = api or urlparse(url).netloc
+        endpoint = self.get_endpoint(url)
+        connection_failures = 0
+        for attempt in range(max_retries + 1):
+            if attempt:
+                self.api_sleeper(api)
+            try:
+                start = time.perf_counter()
+                with metrics.span(f"request {endpoint}"):
+                    response = self.session.get(
+                        url,
+                        params=params,
+                        headers=headers,
+                        timeout=self.request_timeout,
+                    )
+                total = time.perf_counter() - start
+                metrics.count("requests")
+                metrics.count("response_bytes", len(response.content))
+                elapsed = response.elapsed.total_seconds()
+                self.session.metrics.add_request(total, elapsed)
+            except requests.exceptions.RequestException as e:
+                if isinstance(e, requests.exceptions.ConnectTimeout):
+                    msg = f"Connect Timeout: {urlparse(url).netloc} did not respond"
+                elif isinstance(e, requests.exceptions.ConnectionError):
+                    msg = "Connection Error: Internet can't be accessed"
+                elif isinstance(e, requests.exceptions.TooManyRedirects):
+                    msg = "Too Many Redirects: Exceeded 30 redirects"
+                elif isinstance(e, requests.exceptions.ReadTimeout):
+                    msg = f"Read Timeout: {url} stalled"
+                else:
+                    msg = f"Unknown Error: {e}"
+                metrics.count("request_errors")
+                self.error_log.warning(msg)
+                transient = (
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                )
+                if not isinstance(e, transient):
+                    return False
+                connection_failures += 1
+                if connection_failures > self.connection_retries:
+                    return False
+                time.sleep(self.connection_retry_delay)
+                continue
+
+            if response.status_code == requests.codes.ok:
+                self.rate_limiter.reset_backoff(api)
+                if self.response_cache and use_cache:
+                    self.response_cache.set(url, params, response)
+                return response
+            elif response.status_code == 429 or response.status_code == 403:
+                msg = "Server Error: Too Many requests made. Waiting to try again"
+                metrics.count("throttled")
+                self.error_log.warning(msg)
+                self.rate_limiter.backoff(api)
+                continue
+            elif response.status_code == 500:
+                msg = "Server Error: make sure your api key and steam id is valid"
+            elif response.status_code == 404:
+                msg = f"Server Error: 404 Content does not exist. URL: {url}"
             else:
-                msg = f"Unknown Error: {e}"
-
+                msg = f"Server Error: {response.status_code} URL: {url}"
+            metrics.count("request_errors")
             self.error_log.warning(msg)
-            time.sleep(5)
-            return self.request_url(
-                url, params=params, headers=headers, second_try=True
-            )
-
-        if response.status_code == requests.codes.ok:
-            return response
-        elif response.status_code == 500:
-            msg = "Server Error: make sure your api key and steam id is valid"
-        elif response.status_code == 404:
-            msg = f"Server Error: 404 Content does not exist. URL: {url}"
-        elif response.status_code == 429 or response.status_code == 403:
-            msg = "Server Error: Too Many requests made. Waiting to try again"
-            self.error_log.warning(response)
-            time.sleep(5)
-            return self.request_url(url, params=params, headers=headers)
-
-        self.error_log.warning(msg)
+            return False
         return False
 
-    def api_sleeper(self, api, sleep_length=0.5, api_calls={}) -> None:
+    def api_sleeper(self, api) -> float:
+        """
+        Delays until the rate limit for `api` allows another call.
+        Returns the amount of seconds slept.
+        """
+        slept = self.rate_limiter.acquire(api)
+        if slept:
+            metrics.count("sleeps")
+            metrics.count("sleep_seconds", slept)
+        return slept
+
+    @staticmethod
+    def get_endpoint(url: str) -> str:
         """
-        Delays delays for a set period of time if the `api` was run too recently.
-        Delay length is set by `sleep_length`.
+        Gets a short name for the endpoint `url` is for such as "GetOwnedGames"
+        leaving out versions and IDs.
         """
-        cur_datetime = dt.datetime.now()
-        if api in api_calls.keys():
-            if api_calls[api] + dt.timedelta(seconds=sleep_length) > cur_datetime:
-                time.sleep(sleep_length)
-        api_calls[api] = cur_datetime
+        url_parts = urlparse(url)
+        parts = [
+            part
+            for part in url_parts.path.split("/")
+            if part and not re.fullmatch(r"v\d+|\d+", part)
+        ]
+        return parts[-1] if parts else url_parts.netloc
 
     @staticmethod
     def hours_played(minutes_played):
@@ -248,39 +408,14 @@ class Utils:
         """
         Removes unicode from `string`.
         """
-        if type(string) != str:
-            return string
-        replace_dict = {
-            # unicode character
-            "â€": "'",
-            "®": "",
-            "™": "",
-            "â„¢": "",
-            "Â": "",
-            "Ã›": "U",
-            "ö": "o",
-            "Ã¶": "o",
-            # unicode value
-            "\u2122": "",  # Trademarked sign
-            "\u00ae": "",  # REGISTERED SIGN
-            "\u00e5": "a",  # a
-            "\u00f6": "o",  # LATIN SMALL LETTER O WITH DIAERESIS
-            "\u00e9": "e",  # LATIN SMALL LETTER E WITH ACUTE
-            "\u2013": "-",  # EN DASH
-            # HTML entities
-            "&amp": "&",  # &
-            "&quot;": '"',  # "
-            "&apos;": "'",  # '
-            "&cent;": "",  # cent
-            "&copy;": "",  # copyright sign
-            "&reg;": "",  # trademark sign
-        }
-        for unicode in replace_dict.keys():
-            if unicode in string:
-                for unicode, sub in replace_dict.items():
-                    string = string.replace(unicode, sub)
-        conv_string = string.encode("ascii", "ignore").decode()
-        return conv_string.strip()
+        return unicode_normalizer.normalize(string)
+
+    @staticmethod
+    def unicode_remover_bulk(values) -> list:
+        """
+        Removes unicode from every string in `values` at once.
+        """
+        return unicode_normalizer.normalize_many(values)
 
     @staticmethod
     def list_to_sentence(str_list: [str]) -> str:
@@ -297,27 +432,119 @@ class Utils:
             comma_separated = ", ".join(str_list[:-1])
             return f"{comma_separated} and {str_list[-1]}"
 
-    def lev_distance(self, word1: str, word2: str, lower=True) -> int:
+    def lev_distance(
+        self, word1: str, word2: str, lower=True, max_distance: int = None
+    ) -> int:
         """
         Returns the Levenshtein distance of `word1` and `word2`.
+
+        Once the distance is known to be over `max_distance` it stops early
+        and returns `max_distance + 1`.
         """
         if lower:
             word1, word2 = word1.lower(), word2.lower()
-        cache = [[float("inf")] * (len(word2) + 1) for _ in range(len(word1) + 1)]
-        for j in range(len(word2) + 1):
-            cache[len(word1)][j] = len(word2) - j
-        for i in range(len(word1) + 1):
-            cache[i][len(word2)] = len(word1) - i
-        for i in range(len(word1) - 1, -1, -1):
-            for j in range(len(word2) - 1, -1, -1):
-                if word1[i] == word2[j]:
-                    cache[i][j] = cache[i + 1][j + 1]
-                else:
-                    min_change = min(
-                        cache[i + 1][j], cache[i][j + 1], cache[i + 1][j + 1]
-                    )
-                    cache[i][j] = 1 + min_change
-        return cache[0][0]
+        # the shorter word is used as the bit vector
+        if len(word1) > len(word2):
+            word1, word2 = word2, word1
+        length, total = len(word1), len(word2)
+        if max_distance is not None and total - length > max_distance:
+            return max_distance + 1
+        if not length:
+            return total
+        # Myers bit-parallel algorithm with one bit per character of word1
+        peq = {}
+        for i, char in enumerate(word1):
+            peq[char] = peq.get(char, 0) | 1 << i
+        mask = (1 << length) - 1
+        last_bit = 1 << (length - 1)
+        pos_vert, neg_vert, distance = mask, 0, length
+        for j, char in enumerate(word2, 1):
+            eq = peq.get(char, 0)
+            x_vert = eq | neg_vert
+            x_horz = (((eq & pos_vert) + pos_vert) ^ pos_vert) | eq
+            pos_horz = neg_vert | ~(x_horz | pos_vert) & mask
+            neg_horz = pos_vert & x_horz
+            if pos_horz & last_bit:
+                distance += 1
+            elif neg_horz & last_bit:
+                distance -= 1
+            # the distance can only drop by one for each character left
+            if max_distance is not None and distance - (total - j) > max_distance:
+                return max_distance + 1
+            pos_horz = (pos_horz << 1 | 1) & mask
+            neg_horz = (neg_horz << 1) & mask
+            pos_vert = neg_horz | ~(x_vert | pos_horz) & mask
+            neg_vert = pos_horz & x_vert
+        return distance
+
+    def lev_distance_batch(
+        self,
+        target: str,
+        string_list: list,
+        max_distance: int = None,
+        lower=True,
+        chunk_size: int = 4096,
+    ):
+        """
+        Returns a NumPy array of the Levenshtein distance from `target` to
+        each string in `string_list`.
+
+        Strings that are over `max_distance` are set to `max_distance + 1`
+        and dropped as soon as that is known.
+        """
+        if lower:
+            target = target.lower()
+            string_list = [string.lower() for string in string_list]
+        total = len(string_list)
+        lengths = np.fromiter(map(len, string_list), dtype=np.int32, count=total)
+        if max_distance is None:
+            distances = np.zeros(total, dtype=np.int32)
+            active = np.arange(total)
+        else:
+            distances = np.full(total, max_distance + 1, dtype=np.int32)
+            # strings with too large of a length difference can not match
+            active = np.flatnonzero(np.abs(lengths - len(target)) <= max_distance)
+        target_codes = [ord(char) for char in target]
+        # similar lengths are scored together to keep the padding small
+        active = active[np.argsort(lengths[active], kind="stable")]
+        for start in range(0, len(active), chunk_size):
+            chunk = active[start : start + chunk_size]
+            chunk_lengths = lengths[chunk]
+            width = int(chunk_lengths.max())
+            if not width:
+                distances[chunk] = len(target)
+                continue
+            # unicode arrays are 4 byte code points that are zero padded
+            codes = np.array([string_list[i] for i in chunk], dtype=f"<U{width}")
+            codes = codes.view(np.uint32).reshape(len(chunk), width)
+            columns = np.arange(width + 1, dtype=np.int32)
+            prev_row = np.tile(columns, (len(chunk), 1))
+            rows = np.arange(len(chunk))
+            for i, code in enumerate(target_codes, 1):
+                cost = (codes != code).astype(np.int32)
+                # substitution and deletion for every column at once
+                cur_row = np.empty_like(prev_row)
+                cur_row[:, 0] = i
+                cur_row[:, 1:] = np.minimum(
+                    prev_row[:, 1:] + 1, prev_row[:, :-1] + cost
+                )
+                # insertions only depend on the column to the left
+                cur_row = np.minimum.accumulate(cur_row - columns, axis=1) + columns
+                prev_row = cur_row
+                if max_distance is not None and i % 4 == 0:
+                    # the lowest value in a row never goes down in later rows
+                    keep = prev_row.min(axis=1) <= max_distance
+                    if not keep.all():
+                        prev_row, codes = prev_row[keep], codes[keep]
+                        chunk, chunk_lengths = chunk[keep], chunk_lengths[keep]
+                        rows = np.arange(len(chunk))
+                        if not len(chunk):
+                            break
+            if len(chunk):
+                distances[chunk] = prev_row[rows, chunk_lengths]
+        if max_distance is not None:
+            distances = np.minimum(distances, max_distance + 1)
+        return distances
 
     def sim_matcher(self, target_str, string_list, max_similarity=0.8, debug=False):
         """
@@ -356,8 +583,9 @@ class Utils:
         starting_max = max_distance
         matches = {}
         match = None
-        for string in string_list:
-            distance = self.lev_distance(target_str, string)
+        # only distances under the starting max can ever be kept
+        distances = self.lev_distance_batch(target_str, string_list, max_distance - 1)
+        for string, distance in zip(string_list, distances.tolist()):
             if distance < max_distance:
                 max_distance = distance
                 match = string
@@ -0,0 +1,123 @@
+from pathlib import Path
+import os, shutil, time
+
+from classes.metrics import metrics
+
+
+class WorkbookWriter:
+    def __init__(
+        self,
+        excel,
+        library=None,
+        max_seconds: float = 60,
+        max_changes: int = 500,
+    ) -> None:
+        """
+        Write-behind saver for an `Excel` workbook.
+
+        Cell updates collect as dirty cells in `library` and are only written
+        to the workbook when a checkpoint goes over `max_seconds` since the
+        last save or `max_changes` pending cells.
+
+        Saves go to a temp file that replaces the workbook once it is fully
+        written so a crash mid save never leaves a broken file.
+        """
+        self.excel = excel
+        self.library = library
+        self.max_seconds = max_seconds
+        self.max_changes = max_changes
+        self.last_save = time.perf_counter()
+        self.saves = 0
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of cell changes waiting to be saved.
+        """
+        return len(self.library.dirty) if self.library else 0
+
+    def due(self) -> bool:
+        """
+        Checks if the pending changes are over the time or size budget.
+        """
+        if not self.pending and not self.excel.changes_made:
+            return False
+        if self.pending >= self.max_changes:
+            return True
+        return time.perf_counter() - self.last_save >= self.max_seconds
+
+    def checkpoint(self) -> bool:
+        """
+        Saves if the pending changes are over budget. Returns True if it saved.
+        """
+        if not self.due():
+            return False
+        return self.save(use_print=False, backup=False)
+
+    def flush(self) -> int:
+        """
+        Writes the libraries dirty cells to the workbook without saving.
+        """
+        if not self.library:
+            return 0
+        return self.library.flush()
+
+    def save(
+        self,
+        use_print: bool = True,
+        force_save: bool = False,
+        backup: bool = True,
+    ) -> bool:
+        """
+        Flushes pending changes and atomically saves the workbook.
+
+        Backs up the excel file before the first save if `backup` is True.
+
+        `force_save` can be used to make sure a save occurs.
+        """
+        self.flush()
+        excel = self.excel
+        file_path = Path(excel.file_path)
+        if not file_path.exists():
+            raise Exception(f"{file_path} no longer exists.")
+        if not excel.changes_made and not force_save:
+            self.last_save = time.perf_counter()
+            return False
+        if backup and not excel.backed_up:
+            shutil.copy(file_path, f"{file_path}.bak")
+            excel.backed_up = True
+        if use_print:
+            print("\nSaving...")
+        first_run = True
+        while True:
+            try:
+                self.atomic_save(file_path)
+                break
+            # catches error caused by excel worksheet being open
+            except PermissionError:  # pragma: no cover
+                if first_run and use_print:
+                    print("Make sure the excel sheet is closed.", end="\r")
+                first_run = False
+                time.sleep(1)
+        excel.changes_made = False
+        self.last_save = time.perf_counter()
+        self.saves += 1
+        if use_print:
+            print(f'Save Complete.{34*" "}')
+        return True
+
+    @metrics.timed("workbook save")
+    def atomic_save(self, file_path: Path) -> None:
+        """
+        Saves the workbook to a temp file next to `file_path` and then swaps
+        it into place.
+        """
+        temp_path = file_path.with_name(f".{file_path.name}.tmp")
+        try:
+            self.excel.wb.save(temp_path)
+            with open(temp_path, "rb+") as file:
+                os.fsync(file.fileno())
+            os.replace(temp_path, file_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
@@ -1,10 +1,11 @@
-import random, json, os, sys, time, subprocess, webbrowser, math
-from howlongtobeatpy import HowLongToBeat
-from difflib import SequenceMatcher
+import time
+
+import_start = time.perf_counter()
+
+import random, json, os, sys, subprocess, webbrowser, math, argparse
 from pathlib import Path
 from pick import pick
 import datetime as dt
-import pandas as pd
 
 from rich.console import Console
 from rich.prompt import IntPrompt
@@ -16,11 +17,30 @@ from rich.theme import Theme
 from classes.setup import Setup
 from classes.steam import Steam
 from classes.game_skipper import GameSkipper
+from classes.game_diff import GameDiffer
+from classes.fetch_pool import FetchPool
+from classes.player_counts import PlayerCountRefresher
+from classes.library import Library
+from classes.app_list import AppList
+from classes.search_index import SearchIndex
+from classes.tag_matrix import TagMatrix
+from classes.recommender import Recommender
+from classes.price_history import PriceHistory
+from classes.datastore import Datastore
+from classes.workbook_writer import WorkbookWriter
+from classes.response_cache import ResponseCache
+from classes.time_to_beat_cache import TimeToBeatCache
+from classes.rate_limiter import RateLimiter
+from classes.http_session import create_session
 from classes.utils import Utils, keyboard_interrupt
+from classes.utils import lazy_import, lazy_property, startup_times
 from classes.logger import Logger
+from classes.metrics import metrics
+
+# heavy modules only load once they are used
+pd = lazy_import("pandas")
 
-# my package
-from easierexcel import Excel, Sheet
+startup_times["imports"] = time.perf_counter() - import_start
 
 
 class Tracker(Steam, Utils):
@@ -41,32 +61,6 @@ class Tracker(Steam, Utils):
 
     title = "Game Library Tracker"
 
-    # config init
-    setup = Setup()
-    config_path, config_data, ignore_data = setup.run()
-
-    # steam_data
-    steam_key = config_data["steam_data"]["api_key"]
-    steam_id = str(config_data["steam_data"]["steam_id"])
-    vanity_url = config_data["steam_data"]["vanity_url"]
-
-    # settings
-    playstation_data_link = config_data["settings"]["playstation_data_link"]
-    excel_filename = config_data["settings"]["excel_filename"]
-    logging = config_data["settings"]["logging"]
-
-    # misc
-    name_ignore_list = [string.lower() for string in ignore_data["name_ignore_list"]]
-    app_id_ignore_list = ignore_data["app_id_ignore_list"]
-    game_skipper = GameSkipper(name_ignore_list, app_id_ignore_list)
-
-    # logging setup
-    if logging:
-        Log = Logger()
-        tracker_log_path = "logs/tracker.log"
-        tracker = Log.create_log(name="tracker", log_path=tracker_log_path)
-        error_log = Log.create_log(name="base_error", log_path="logs/error.log")
-
     # class init
     options = {
         "shrink_to_fit_cell": True,
@@ -92,26 +86,6 @@ class Tracker(Steam, Utils):
         "date": ["Last Updated", "Date"],
         "decimal": ["Hours Played", "Linux Hours", "Time To Beat in Hours"],
     }
-    # excel setup
-    excel = Excel(excel_filename, use_logging=logging)
-    steam = Sheet(
-        excel_object=excel,
-        sheet_name="Steam",
-        column_name="App ID",
-        options=options,
-    )
-    playstation = Sheet(
-        excel_object=excel,
-        sheet_name="Playstation",
-        column_name="Name",
-        options=options,
-    )
-    sales = Sheet(
-        excel_object=excel,
-        sheet_name="Sales",
-        column_name="Name",
-        options=options,
-    )
     # sets play status choices for multiple functions
     play_status_choices = {
         "1": "Played",
@@ -126,6 +100,9 @@ class Tracker(Steam, Utils):
     }
     # misc
     ps_data = Path("configs/playstation_games.json")
+    metrics_path = Path("logs/metrics.json")
+    # how much each column counts towards how similar two games are
+    recommender_weights = {"User Tags": 1.0, "Genre": 0.5, "Developers": 0.75}
 
     # columns
     excel_columns = [
@@ -176,11 +153,168 @@ class Tracker(Steam, Utils):
     def __init__(self, save) -> None:
         """
         Game Library Tracking Class.
+
+        Only the config is loaded here. The workbook, datastore and other
+        heavy parts are created the first time they are used.
         """
         self.save_to_file = save
+        start = time.perf_counter()
+        self.load_config()
+        startup_times["config"] = time.perf_counter() - start
         if not self.steam_id:
             self.update_steam_id()
 
+    def load_config(self):
+        """
+        Loads the config and ignore files and the settings within them.
+        """
+        # config init
+        self.setup = Setup()
+        self.config_path, self.config_data, self.ignore_data = self.setup.run()
+        config_data = self.config_data
+        settings = config_data["settings"]
+
+        # steam_data
+        self.steam_key = config_data["steam_data"]["api_key"]
+        self.steam_id = str(config_data["steam_data"]["steam_id"])
+        self.vanity_url = config_data["steam_data"]["vanity_url"]
+
+        # settings
+        self.playstation_data_link = settings["playstation_data_link"]
+        self.excel_filename = settings["excel_filename"]
+        self.logging = settings["logging"]
+        self.max_workers = settings.get("max_workers", 4)
+        self.player_count_max_age = settings.get("player_count_max_age", 30)
+        self.save_interval = settings.get("save_interval", 60)
+        self.save_max_changes = settings.get("save_max_changes", 500)
+        self.use_datastore = settings.get("use_datastore", True)
+        self.app_list_max_age = settings.get("app_list_max_age", 24)
+        self.time_to_beat_retry_days = settings.get("time_to_beat_retry_days", 30)
+        self.full_sync_freq = settings.get("full_sync_freq", 7)
+        self.show_metrics = settings.get("show_metrics", False)
+        self.rate_limiter = RateLimiter(config_data.get("rate_limits"))
+        self.session = create_session(settings.get("pool_size", 10))
+        self.request_timeout = tuple(settings.get("request_timeout", [5, 30]))
+        self.api_url = settings.get("steam_api_url", self.api_url)
+        self.store_url = settings.get("steam_store_url", self.store_url)
+
+        # misc
+        ignore_data = self.ignore_data
+        self.name_ignore_list = [
+            string.lower() for string in ignore_data["name_ignore_list"]
+        ]
+        self.app_id_ignore_list = ignore_data["app_id_ignore_list"]
+        self.game_skipper = GameSkipper(
+            self.name_ignore_list, self.app_id_ignore_list, "configs/ignore.json"
+        )
+
+        # logging setup
+        if self.logging:
+            self.Log = Logger()
+            self.tracker_log_path = "logs/tracker.log"
+            self.tracker = self.Log.create_log(
+                name="tracker", log_path=self.tracker_log_path
+            )
+            self.error_log = self.Log.create_log(
+                name="base_error", log_path="logs/error.log"
+            )
+
+    @lazy_property
+    def response_cache(self):
+        return ResponseCache(
+            max_size_mb=self.config_data["settings"].get("cache_max_mb", 200),
+            endpoint_ttls=self.config_data["settings"].get("cache_ttls"),
+        )
+
+    @lazy_property
+    def excel(self):
+        from easierexcel import Excel
+
+        return Excel(self.excel_filename, use_logging=self.logging)
+
+    def create_sheet(self, sheet_name, column_name):
+        """
+        Creates a `Sheet` for `sheet_name` using `column_name` as its key.
+        """
+        from easierexcel import Sheet
+
+        return Sheet(
+            excel_object=self.excel,
+            sheet_name=sheet_name,
+            column_name=column_name,
+            options=self.options,
+        )
+
+    @lazy_property
+    def steam(self):
+        return self.create_sheet("Steam", "App ID")
+
+    @lazy_property
+    def playstation(self):
+        return self.create_sheet("Playstation", "Name")
+
+    @lazy_property
+    def sales(self):
+        return self.create_sheet("Sales", "Name")
+
+    @lazy_property
+    def datastore(self):
+        # sidecar datastore mirroring the sheets
+        if not self.use_datastore:
+            return None
+        return Datastore()
+
+    @lazy_property
+    def library(self):
+        # in memory working set of the Steam sheet
+        return Library(
+            lambda: self.steam,
+            self.datastore,
+            sheet_name="Steam",
+            file_path=self.excel_filename,
+        )
+
+    @lazy_property
+    def price_history(self):
+        # every price seen by sales syncs
+        return PriceHistory()
+
+    @lazy_property
+    def app_list(self):
+        # steam app list cached on disk between runs
+        return AppList()
+
+    @lazy_property
+    def search_index(self):
+        # fuzzy name search over the library built once per run
+        names = self.library.column(self.name_col).dropna()
+        return SearchIndex(names.to_dict())
+
+    def index_game_name(self, app_id, game_name=None):
+        """
+        Updates the search index for `app_id` if it has been built. The game is
+        removed from it if `game_name` is None.
+        """
+        if "search_index" not in self.__dict__:
+            return
+        if game_name is None:
+            self.search_index.remove(app_id)
+        else:
+            self.search_index.add(app_id, game_name)
+
+    @lazy_property
+    def writer(self):
+        return WorkbookWriter(
+            self.excel, self.library, self.save_interval, self.save_max_changes
+        )
+
+    @property
+    def excel_loaded(self):
+        """
+        Checks if the workbook has been opened yet.
+        """
+        return "excel" in self.__dict__
+
     def update_steam_id(self):
         """
         Updates the steam id in the config using the given vanity url if present.
@@ -260,56 +394,146 @@ class Tracker(Steam, Utils):
             set_title = self.title
         os.system("title " + set_title)
 
-    def get_time_to_beat(self, game_name):
+    @lazy_property
+    def hltb(self):
+        # one client is shared by every search
+        from howlongtobeatpy import HowLongToBeat
+
+        return HowLongToBeat()
+
+    @lazy_property
+    def time_to_beat_cache(self):
+        return TimeToBeatCache(not_found_retry_days=self.time_to_beat_retry_days)
+
+    def get_time_to_beat(self, game_name, app_id=None):
+        """
+        Gets the time to beat for entered game from the time to beat cache or
+        by searching HowLongToBeat if it is not known yet.
+        """
+        time_to_beat = self.time_to_beat_cache.get(game_name, app_id)
+        if time_to_beat is not None:
+            metrics.count("time_to_beat_cache_hits")
+            return time_to_beat
+        metrics.count("time_to_beat_cache_misses")
+        time_to_beat = self.search_time_to_beat(game_name)
+        self.time_to_beat_cache.set(game_name, time_to_beat, app_id)
+        return time_to_beat
+
+    @metrics.timed("time to beat search")
+    def search_time_to_beat(self, game_name):
         """
         Uses howlongtobeatpy to get the time to beat for entered game.
+
+        Returns "" if HowLongToBeat could not be reached.
         """
-        self.api_sleeper("time_to_beat")
-        try:
-            results = HowLongToBeat().search(game_name)
-        except:
-            for _ in range(3):
+        results = None
+        for attempt in range(3):
+            if attempt:
                 time.sleep(10)
-                results = HowLongToBeat().search(game_name)
+            self.api_sleeper("time_to_beat")
+            try:
+                results = self.hltb.search(game_name)
+                break
+            except Exception:
+                continue
+        else:
             return ""
         if not results:
             self.api_sleeper("time_to_beat")
             if game_name.isupper():
-                results = HowLongToBeat().search(game_name.title())
+                results = self.hltb.search(game_name.title())
             else:
-                results = HowLongToBeat().search(game_name.upper())
+                results = self.hltb.search(game_name.upper())
         time_to_beat = "-"
         if results is not None and len(results) > 0:
             best_element = max(results, key=lambda element: element.similarity)
             time_to_beat = best_element.main_extra or best_element.main_story or "-"
         return time_to_beat
 
-    def create_save_every_nth(self, save_on_nth=20):
-        counter = 0
+    def save_excel(self, **kwargs):
+        """
+        Writes the libraries dirty cells to the workbook and then saves it.
+        """
+        # nothing can have changed if the workbook was never opened
+        if not self.excel_loaded and not self.library.dirty:
+            return False
+        saved = self.writer.save(**kwargs)
+        if saved:
+            self.mirror_sheets()
+        return saved
+
+    def format_row(self, app_id):
+        """
+        Writes the dirty cells for `app_id` to the workbook and formats its row.
+        """
+        self.library.flush(app_id)
+        self.steam.format_row(app_id)
 
-        def save_every_nth():
-            nonlocal counter
-            counter += 1
-            if counter % save_on_nth == 0:
-                self.excel.save(use_print=False, backup=False)
-                counter = 0
+    def open_excel(self):
+        """
+        Writes the libraries dirty cells to the workbook and opens it.
+        """
+        self.save_excel(use_print=False)
+        self.excel.open_excel(save=False)
 
-        return save_every_nth
+    def checkpoint(self):
+        """
+        Saves pending changes if they are over the save time or size budget.
+        """
+        if self.save_to_file and self.writer.checkpoint():
+            self.mirror_sheets()
+
+    def mirror_sheets(self):
+        """
+        Mirrors the Playstation and Sales sheets to the datastore and marks
+        every sheet as matching the saved workbook.
+        """
+        if not self.datastore:
+            return
+        source_mtime = self.library.source_mtime()
+        for sheet in (self.playstation, self.sales):
+            self.datastore.sync_sheet(sheet, source_mtime)
+        self.datastore.mark_synced(source_mtime)
+
+    def create_library_dataframe(self):
+        """
+        Creates a DataFrame of the Steam sheet. It is read from the datastore
+        when it is in use instead of parsing the workbook again.
+        """
+        if not self.datastore:
+            return self.steam.create_dataframe(na_vals=self.na_values)
+        self.library.flush()
+        return self.datastore.create_dataframe(self.library.sheet_name, self.na_values)
+
+    def export_excel(self):
+        """
+        Regenerates the workbook from the datastore and saves it.
+        """
+        if not self.datastore:
+            print("\nThe datastore is not in use")
+            return
+        self.library.flush()
+        changed = 0
+        for sheet in (self.steam, self.playstation, self.sales):
+            if self.datastore.has_sheet(sheet.sheet_name):
+                changed += self.datastore.export_sheet(sheet)
+        print(f"\nExported {changed:,} changed cells to {self.excel.file_path.name}")
+        self.save_excel(use_print=False)
 
     def set_release_year(self, app_id, release_year):
         """
         Sets `app_id`'s release year cell to `release_year` if a year is not
         already set.
         """
-        cur_val = self.steam.get_cell(app_id, self.release_col)
+        cur_val = self.library.get_cell(app_id, self.release_col)
         if not self.any_is_num(cur_val):
-            return self.steam.update_cell(app_id, self.release_col, release_year)
+            return self.library.update_cell(app_id, self.release_col, release_year)
 
     def set_genre(self, app_id, genre):
         """
         Sets `app_id`'s genre cell to `genre`.
         """
-        return self.steam.update_cell(app_id, self.genre_col, genre)
+        return self.library.update_cell(app_id, self.genre_col, genre)
 
     def set_time_to_beat(self, app_id, new_ttb, cur_ttb):
         """
@@ -318,47 +542,47 @@ class Tracker(Steam, Utils):
         if not new_ttb:
             return
         if not self.any_is_num(cur_ttb):
-            return self.steam.update_cell(app_id, self.time_to_beat_col, new_ttb)
+            return self.library.update_cell(app_id, self.time_to_beat_col, new_ttb)
 
     def set_hours_played(self, app_id, hours):
         """
         Sets `app_id`'s Hours Played cell to `hours`.
         """
-        return self.steam.update_cell(app_id, self.hours_played_col, hours)
+        return self.library.update_cell(app_id, self.hours_played_col, hours)
 
     def set_linux_hours_played(self, app_id, hours):
         """
         Sets `app_id`'s Linux Hours cell to `hours`.
         """
-        return self.steam.update_cell(app_id, self.linux_hours_col, hours)
+        return self.library.update_cell(app_id, self.linux_hours_col, hours)
 
     def set_last_playtime(self, app_id, set_last_playtime):
         """
         Sets `app_id`'s last play time to `set_last_playtime`.
         """
         column = self.last_play_time_col
-        return self.steam.update_cell(app_id, column, set_last_playtime)
+        return self.library.update_cell(app_id, column, set_last_playtime)
 
     def set_time_played(self, app_id, time_played):
         """
         Sets `app_id`'s time played to `time_played`.
         """
         column = self.time_played_col
-        return self.steam.update_cell(app_id, column, time_played)
+        return self.library.update_cell(app_id, column, time_played)
 
     def set_play_status(self, app_id, new_status, cur_status=None):
         """
         Sets `app_id`'s Play Status cell to `new_status` if it the current status is unplayed.
         """
         if cur_status == "Unplayed" and new_status != cur_status:
-            return self.steam.update_cell(app_id, self.play_status_col, new_status)
+            return self.library.update_cell(app_id, self.play_status_col, new_status)
 
     def set_date_updated(self, app_id):
         """
         Sets `app_id`'s Date Updated cell to the current date.
         """
         cur_date = dt.datetime.now()
-        return self.steam.update_cell(app_id, self.date_updated_col, cur_date)
+        return self.library.update_cell(app_id, self.date_updated_col, cur_date)
 
     @staticmethod
     def get_price_info(game_info: {}):
@@ -414,18 +638,14 @@ class Tracker(Steam, Utils):
         app_details = self.get_app_details(app_id)
         if not app_details:
             return info_dict
-        # gets games store data
-        store_link = self.get_store_link(app_id)
-        self.api_sleeper("store_data")
-        response = self.request_url(store_link)
+        # gets games store data with a single parse of the store page
+        store_page = self.get_store_page(app_id)
         # steam review data
-        percent, total = self.get_steam_review(app_id=app_id, response=response)
-        info_dict[self.steam_rev_per_col] = percent
-        info_dict[self.steam_rev_total_col] = total
+        info_dict[self.steam_rev_per_col] = store_page.review_percent
+        info_dict[self.steam_rev_total_col] = store_page.review_total
         # get user tags
-        tags = self.get_steam_user_tags(app_id=app_id, response=response)
-        if tags:
-            info_dict[self.user_tags_col] = ", ".join(tags)
+        if store_page.tags:
+            info_dict[self.user_tags_col] = ", ".join(store_page.tags)
         # info_dict setup
         if "data" in app_details[str(app_id)].keys():
             game_info = app_details[str(app_id)]["data"]
@@ -475,12 +695,12 @@ class Tracker(Steam, Utils):
             if "drm_notice" in keys:
                 info_dict["drm_notice"] = game_info["drm_notice"]
             # runs unicode remover on all values
-            return {k: self.unicode_remover(v) for k, v in info_dict.items()}
+            return dict(zip(info_dict, self.unicode_remover_bulk(info_dict.values())))
         return info_dict
 
     def find_recent_games(
         self,
-        df: pd.DataFrame,
+        df: "pd.DataFrame",
         column: str,
         n_days: int = 7,
     ) -> list[dict]:
@@ -493,50 +713,107 @@ class Tracker(Steam, Utils):
             by=self.date_updated_col, ascending=False
         ).to_dict(orient="records")
 
+    def fetch_extra_steam_info(self, app_id, game_name, cur_ttb):
+        """
+        Gets the time to beat and Steam info for `app_id` without touching the
+        sheet so it can be run on a worker thread.
+        """
+        new_ttb = None
+        if not cur_ttb:
+            new_ttb = self.get_time_to_beat(game_name, app_id)
+        return new_ttb, self.get_game_info(app_id)
+
     def update_extra_steam_info(self, app_ids):
         """
-        ph
+        Fetches extra Steam info for all `app_ids` concurrently and writes the
+        results to the sheet from this thread as they finish.
         """
-        save_every_nth = self.create_save_every_nth()
         update_total = len(app_ids)
+        # sheet reads happen up front as openpyxl is not thread safe
+        games = {app_id: self.library.get_row(app_id) for app_id in app_ids}
+
+        def fetch(app_id):
+            game_data = games[app_id]
+            game_name = game_data[self.name_col]
+            cur_ttb = game_data[self.time_to_beat_col]
+            return self.fetch_extra_steam_info(app_id, game_name, cur_ttb)
+
+        pool = FetchPool(self.max_workers)
         cur_itr = 0
         print()
         desc = "Syncing Game Data"
-        for app_id in track(app_ids, description=desc):
-            game_data = self.steam.get_row(app_id)
-            game_name = game_data[self.name_col]
-            # How long to beat check
-            cur_ttb = game_data[self.time_to_beat_col]
-            if not cur_ttb:
-                new_ttb = self.get_time_to_beat(game_name)
+        results = pool.imap(fetch, app_ids)
+        for app_id, result in track(results, description=desc, total=update_total):
+            cur_itr += 1
+            if result:
+                new_ttb, steam_info = result
+                # How long to beat
+                cur_ttb = games[app_id][self.time_to_beat_col]
                 self.set_time_to_beat(app_id, new_ttb, cur_ttb)
-            steam_info = self.get_game_info(app_id)
-            # updates sheet with data found in steam_info
-            special_case_col = [self.release_col]
-            for key, val in steam_info.items():
-                if key in self.excel_columns and steam_info[key]:
-                    if key not in special_case_col:
-                        self.steam.update_cell(app_id, key, val)
-            # release year
-            if steam_info[self.release_col]:
-                year = steam_info[self.release_col]
-                self.set_release_year(app_id, year)
-            if self.save_to_file:
-                save_every_nth()
+                # updates sheet with data found in steam_info
+                special_case_col = [self.release_col]
+                for key, val in steam_info.items():
+                    if key in self.excel_columns and steam_info[key]:
+                        if key not in special_case_col:
+                            self.library.update_cell(app_id, key, val)
+                # release year
+                if steam_info[self.release_col]:
+                    year = steam_info[self.release_col]
+                    self.set_release_year(app_id, year)
+                self.checkpoint()
             # title progress percentage
-            cur_itr += 1
             progress = cur_itr / update_total * 100
             self.set_title(f"{progress:.2f}% - {self.title}")
         self.set_title()
+        msg = (
+            f"Synced {pool.completed} games at {pool.games_per_minute:.1f} games/minute"
+        )
+        if pool.failed:
+            msg += f" ({pool.failed} failed)"
+        self.console.print(msg, style="info")
+        self.output_network_stats()
+
+    def output_network_stats(self):
+        """
+        Prints the response cache hit and miss statistics along with
+        connection reuse and timing.
+        """
+        stats = self.response_cache.get_stats()
+        if stats["hits"] or stats["misses"]:
+            msg = (
+                f"Response Cache: {stats['hits']:,} hits and {stats['misses']:,} misses "
+                f"({stats['hit_rate']:.0%} hit rate, {stats['size_mb']} MB)"
+            )
+            self.console.print(msg, style="info")
+        if "time_to_beat_cache" in self.__dict__:
+            stats = self.time_to_beat_cache.get_stats()
+            lookups = stats["hits"] + stats["negative_hits"] + stats["misses"]
+            if lookups:
+                msg = (
+                    f"Time To Beat Cache: {stats['hits'] + stats['negative_hits']:,} "
+                    f"hits and {stats['misses']:,} misses "
+                    f"({stats['hit_rate']:.0%} hit rate, {stats['entries']:,} games)"
+                )
+                self.console.print(msg, style="info")
+        stats = self.session.metrics.get_stats()
+        if stats["requests"]:
+            msg = (
+                f"Connections: {stats['requests']:,} requests over "
+                f"{stats['connections']:,} connections ({stats['reuse_rate']:.0%} reused) | "
+                f"Handshakes {stats['handshake_seconds']:.1f}s, "
+                f"Waiting {stats['wait_seconds']:.1f}s, "
+                f"Downloading {stats['payload_seconds']:.1f}s"
+            )
+            self.console.print(msg, style="info")
 
     def update_all_game_data(self):
         """
         ph
         """
-        app_ids = [int(app_id) for app_id in self.steam.row_idx.keys()]
+        app_ids = [int(app_id) for app_id in self.library.keys()]
         self.update_extra_steam_info(app_ids)
 
-    def get_recently_played_app_ids(self, df: pd.DataFrame, n_days=30) -> list:
+    def get_recently_played_app_ids(self, df: "pd.DataFrame", n_days=30) -> list:
         """
         ph
         """
@@ -544,7 +821,7 @@ class Tracker(Steam, Utils):
         if self.recently_executed(self.config_data, "updated_recently_played", n_days):
             return []
         # get recently played games
-        recently_played = App.find_recent_games(df, self.date_updated_col, n_days)
+        recently_played = self.find_recent_games(df, self.date_updated_col, n_days)
         recently_played_app_ids = [game[self.app_id_col] for game in recently_played]
         return recently_played_app_ids
 
@@ -557,7 +834,9 @@ class Tracker(Steam, Utils):
         Use `skip_by_play_status` to only check games with a specific play status.
         """
         # starts the update list with recently played games
-        update_list = self.get_recently_played_app_ids(df, n_days=30)
+        # as string keys like the library uses
+        recent_app_ids = self.get_recently_played_app_ids(df, n_days=30)
+        update_list = [str(app_id) for app_id in recent_app_ids]
         updated_recent = True if update_list else False
         column_list = [
             self.genre_col,
@@ -571,26 +850,24 @@ class Tracker(Steam, Utils):
             self.ea_col,
         ]
         # adds games with missing data to update_list
-        for app_id in self.steam.row_idx:
-            game_data = self.steam.get_row(app_id)
-            if skip_by_play_status:
-                if game_data[self.play_status_col] not in [
-                    "Unplayed",
-                    "Played",
-                    "Finished",
-                    "Quit",
-                    "Replay",
-                    "Must Play",
-                ]:
-                    continue
-            if skip_filled:
-                for column in column_list:
-                    cell = game_data[column]
-                    if cell == None and app_id not in update_list:
-                        update_list.append(app_id)
-                        continue
-            else:
-                update_list.append(app_id)
+        df = self.library.df
+        to_update = pd.Series(True, index=df.index)
+        if skip_by_play_status:
+            play_statuses = [
+                "Unplayed",
+                "Played",
+                "Finished",
+                "Quit",
+                "Replay",
+                "Must Play",
+            ]
+            to_update &= df[self.play_status_col].isin(play_statuses)
+        if skip_filled:
+            to_update &= df[column_list].isnull().any(axis=1)
+        queued = set(update_list)
+        update_list += [
+            app_id for app_id in df.index[to_update] if app_id not in queued
+        ]
         # checks if data should be updated
         if update_list:
             msg = f"\nDo you want to update data for {len(update_list)} games?\n"
@@ -608,13 +885,13 @@ class Tracker(Steam, Utils):
             print("\nCancelled")
         finally:
             if self.save_to_file:
-                self.excel.save(use_print=False)
+                self.save_excel(use_print=False)
 
     def output_recently_played_games(self, df, n_days=7):
         """
         Creates a table with the recently played Gmes.
         """
-        recently_played_games = App.find_recent_games(df, "Date Updated", n_days)
+        recently_played_games = self.find_recent_games(df, "Date Updated", n_days)
         # creates table
         title = "Recently Played Games"
         table = Table(
@@ -757,38 +1034,187 @@ class Tracker(Steam, Utils):
 
         self.console.print(table, new_line_start=True)
 
-    def find_tag_rating_avg(self, df):
+    @lazy_property
+    def tag_matrices(self):
+        # TagMatrix of each column by column name
+        return {}
+
+    def get_tag_matrix(self, df, column=None) -> TagMatrix:
         """
-        Finds the average library owner rating for each game tag.
+        Gets the `TagMatrix` of `column` in `df` which defaults to the user
+        tags. It is only rebuilt once the library or game total changes.
         """
-        # Split the comma-separated values in the 'Genres' column into separate rows
-        df_exploded = df.assign(Tag=df["User Tags"].str.split(",")).explode("Tag")
+        column = column or self.user_tags_col
+        source_key = (self.library.version, len(df))
+        tag_matrix = self.tag_matrices.get(column)
+        if tag_matrix is None or tag_matrix.source_key != source_key:
+            # these columns were written as a sentence
+            split_and = column in (self.genre_col, self.dev_col, self.pub_col)
+            tag_matrix = TagMatrix.from_series(df[column], split_and, source_key)
+            self.tag_matrices[column] = tag_matrix
+        return tag_matrix
 
-        tag_counts = df_exploded["Tag"].value_counts()
-        print("\nTag Counts", tag_counts)
-        min_tags = 2
-        min_total_ratings = 5
-
-        popular_tags = tag_counts[tag_counts >= min_tags].index
+    def find_tag_rating_avg(self, df, min_games=5) -> "pd.Series":
+        """
+        Finds the average library owner rating for each game tag on more than
+        `min_games` games, highest first. Tags without a rated game are left out.
+        """
+        tags = self.get_tag_matrix(df)
+        ratings = tags.aggregate(df[self.my_rating_col])["mean"]
+        ratings = ratings[tags.counts().reindex(ratings.index) > min_games]
+        ratings = ratings.dropna().rename(self.my_rating_col)
+        return ratings.sort_values(ascending=False, kind="stable")
 
-        print("\nPopular Tags", popular_tags)
-        df_filtered_tags = df_exploded[df_exploded["Tag"].isin(popular_tags)]
+    def get_recommender(self, df) -> Recommender:
+        """
+        Gets the `Recommender` for `df` which is only rebuilt once one of the
+        columns in `recommender_weights` has a new `TagMatrix`.
+        """
+        matrices = {
+            column: self.get_tag_matrix(df, column)
+            for column in self.recommender_weights
+        }
+        recommender = getattr(self, "recommender", None)
+        if recommender is None or any(
+            recommender.matrices[column] is not matrices[column] for column in matrices
+        ):
+            recommender = Recommender(matrices, self.recommender_weights)
+            self.recommender = recommender
+        return recommender
 
-        # Group by the 'Genre' column and calculate the average rating for each genre
-        average_ratings_by_genre = df_filtered_tags.groupby("Tag")["My Rating"].mean()
+    def recommend_games(self, df, min_rating=8, limit=15) -> "pd.DataFrame":
+        """
+        Finds the `limit` unplayed or must play games most similar to the
+        games rated at least `min_rating`.
+        """
+        ratings = pd.to_numeric(df[self.my_rating_col], errors="coerce")
+        liked = ratings[ratings >= min_rating]
+        play_statuses = df[self.play_status_col].astype(str).str.lower()
+        candidates = df.index[play_statuses.isin(["unplayed", "must play"])]
+        return self.get_recommender(df).recommend(liked, candidates, limit)
 
-        filtered_tags = average_ratings_by_genre.index[
-            average_ratings_by_genre.index.isin(
-                tag_counts[tag_counts > min_total_ratings].index
+    def output_recommendations(self, df):
+        """
+        Shows the unplayed and must play games most similar to your favorite
+        games.
+        """
+        min_rating = IntPrompt.ask(
+            "\nWhat is the minimum rating for games you liked? (1-10)",
+            choices=["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"],
+            default=8,
+            show_choices=False,
+            show_default=True,
+        )
+        recommendations = self.recommend_games(df, min_rating)
+        if recommendations.empty:
+            self.console.print("\nNo similar games were found", style="warning")
+            return
+        table = Table(
+            title="Similar Game Recommendations",
+            show_lines=True,
+            title_style="bold",
+            style="deep_sky_blue1",
+        )
+        table.add_column("Name", justify="left")
+        table.add_column("Play Status", justify="center")
+        table.add_column("Match", justify="center")
+        table.add_column("Similar To", justify="left")
+        table.add_column("Shared Tags", justify="left")
+        tags = df[self.user_tags_col].fillna("").astype(str)
+        for app_id, score, similar_to in recommendations.itertuples():
+            shared = [
+                tag
+                for tag in tags[app_id].split(", ")
+                if tag and tag in tags[similar_to].split(", ")
+            ]
+            table.add_row(
+                str(df.at[app_id, self.name_col]),
+                str(df.at[app_id, self.play_status_col]),
+                f"{score:.0%}",
+                str(df.at[similar_to, self.name_col]),
+                ", ".join(shared[:4]),
             )
-        ]
+        self.console.print(table, new_line_start=True)
 
-        # Display the result
-        top_30_ratings = filtered_tags.sort_values(ascending=False)
-        print(top_30_ratings)
+    def find_genre_playtime(self, df) -> "pd.Series":
+        """
+        Finds the total hours played for each genre, most played first.
+        """
+        genres = self.get_tag_matrix(df, self.genre_col)
+        hours = genres.aggregate(df[self.hours_played_col])["sum"]
+        hours = hours.rename(self.hours_played_col)
+        return hours.sort_values(ascending=False, kind="stable")
 
-        # for ind in top_30_ratings.index:
-        #     print(df["Name"][ind], df["My Rating"][ind])
+    def output_tag_info(self, df, limit=10):
+        """
+        Outputs tables of the highest rated user tags and the tags that are
+        most often on the same games.
+        """
+        ratings = self.find_tag_rating_avg(df).head(limit)
+        if ratings.empty:
+            return
+        tags = self.get_tag_matrix(df)
+        counts = tags.counts()
+        table = Table(
+            title="Highest Rated Tags",
+            show_lines=True,
+            title_style="bold",
+            style="deep_sky_blue1",
+        )
+        table.add_column("Tag", justify="left")
+        table.add_column("My\nAverage", justify="center")
+        table.add_column("Games", justify="center")
+        table.add_column("Often With", justify="left")
+        for tag, rating in ratings.items():
+            table.add_row(
+                tag,
+                str(round(rating, 1)),
+                str(counts[tag]),
+                ", ".join(tags.related(tag, limit=3).index),
+            )
+        self.console.print(table, new_line_start=True)
+        # each pair of the most common tags is only listed once
+        pairs = tags.co_occurrence(top_n=limit).stack()
+        first, second = pairs.index.get_level_values(0), pairs.index.get_level_values(1)
+        pairs = pairs[first < second]
+        pairs = pairs[pairs > 0].sort_values(ascending=False, kind="stable")
+        table = Table(
+            title="Most Common Tag Pairs",
+            show_lines=True,
+            title_style="bold",
+            style="deep_sky_blue1",
+        )
+        table.add_column("Tags", justify="left")
+        table.add_column("Games", justify="center")
+        for (first, second), total in pairs.head(limit).items():
+            table.add_row(f"{first} and {second}", str(total))
+        self.console.print(table, new_line_start=True)
+
+    def output_genre_info(self, df, limit=10):
+        """
+        Outputs a table of the most played genres and their most played game.
+        """
+        hours = self.find_genre_playtime(df).head(limit)
+        hours = hours[hours > 0]
+        if hours.empty:
+            return
+        genres = self.get_tag_matrix(df, self.genre_col)
+        hours_played = pd.to_numeric(df[self.hours_played_col], errors="coerce")
+        table = Table(
+            title="Most Played Genres",
+            show_lines=True,
+            title_style="bold",
+            style="deep_sky_blue1",
+        )
+        table.add_column("Genre", justify="left")
+        table.add_column("Hours", justify="center")
+        table.add_column("Most Played", justify="left")
+        for genre, total in hours.items():
+            most_played = hours_played[genres.games_with(genre)].idxmax()
+            table.add_row(
+                genre, str(round(total, 1)), str(df.at[most_played, self.name_col])
+            )
+        self.console.print(table, new_line_start=True)
 
     def output_statistics(self, dataframe):
         """
@@ -797,6 +1223,8 @@ class Tracker(Steam, Utils):
         self.output_play_status_info(dataframe)
         self.output_playtime_info(dataframe)
         self.output_review_info(dataframe)
+        self.output_tag_info(dataframe)
+        self.output_genre_info(dataframe)
 
     @staticmethod
     def decide_play_status(play_status: str, minutes_played: int or float):
@@ -840,7 +1268,8 @@ class Tracker(Steam, Utils):
             for names_dict in name_changes:
                 app_id = names_dict["app_id"]
                 new_name = names_dict["new_name"]
-                self.steam.update_cell(app_id, self.name_col, new_name)
+                self.library.update_cell(app_id, self.name_col, new_name)
+                self.index_game_name(app_id, new_name)
             return
         print("Skipping Name Changes")
 
@@ -895,39 +1324,42 @@ class Tracker(Steam, Utils):
             table.add_row(*row)
         self.console.print(table, new_line_start=True)
 
-    def game_check(self, steam_games, sheet_games):
+    def game_check(self, steam_games, full_sync=True):
         """
-        Checks for new games or game updates from `steam_games` based on `sheet_games`.
+        Checks for new games or game updates from `steam_games` based on the Steam sheet.
+
+        Games missing from `steam_games` are only checked for removal if
+        `full_sync` is True as it must then be every owned game.
         """
         self.total_session_playtime = 0
         added_games = []
         played_games = []
         name_changes = []
-        save_every_nth = self.create_save_every_nth()
+        # finds the changes first so unchanged games are skipped
+        self.game_skipper.refresh()
+        game_differ = GameDiffer(
+            self.name_col, self.hours_played_col, self.game_skipper.skip_game
+        )
+        diff = game_differ.diff(steam_games, self.library.df)
+        # name change check
+        for app_id, old_name, new_name in diff.renamed:
+            msg = f'Name Change: "{old_name}" to "{new_name}"'
+            if self.logging:
+                self.tracker.info(msg)
+            name_change_dict = {
+                "new_name": new_name,
+                "old_name": old_name,
+                "app_id": app_id,
+            }
+            name_changes.append(name_change_dict)
         # game checking
         print()
-        total_games = len(steam_games)
-        desc = f"Syncing [bold]{total_games:,}[/bold] Steam Games"
-        for game in track(steam_games, description=desc):
-            game_name, app_id = game["name"], game["appid"]
-            # ignore check
-            if self.game_skipper.skip_game(game_name, app_id):
-                continue
-            # name change check
-            # TODO below fails if game is added at this time.
-            cur_game_data = self.steam.get_row(app_id)
-            if (
-                cur_game_data[self.name_col]
-                and cur_game_data[self.name_col] != game_name
-            ):
-                msg = f'Name Change: "{cur_game_data[self.name_col]}" to "{game_name}"'
-                self.tracker.info(msg)
-                name_change_dict = {
-                    "new_name": game_name,
-                    "old_name": cur_game_data[self.name_col],
-                    "app_id": app_id,
-                }
-                name_changes.append(name_change_dict)
+        games = {game["appid"]: game for game in steam_games}
+        changed_app_ids = diff.played + diff.added
+        desc = f"Syncing [bold]{len(changed_app_ids):,}[/bold] Changed Steam Games"
+        for app_id in track(changed_app_ids, description=desc):
+            game = games[app_id]
+            game_name = game["name"]
             # sets play time earlier so it only needs to be set up once
             minutes_played = game["playtime_forever"]
             time_played = self.convert_time_passed(min=minutes_played)
@@ -935,11 +1367,10 @@ class Tracker(Steam, Utils):
             if "playtime_linux_forever" in game.keys():
                 linux_minutes_played = game["playtime_linux_forever"]
             # play status
-            cur_status = cur_game_data[self.play_status_col]
+            cur_status = self.library.get_cell(app_id, self.play_status_col)
             new_status = self.decide_play_status(cur_status, minutes_played)
             # updates or adds game
-            if app_id in sheet_games:
-                sheet_games.remove(app_id)
+            if app_id in self.library:
                 update_info = self.update_steam_game(
                     app_id,
                     game_name,
@@ -961,9 +1392,8 @@ class Tracker(Steam, Utils):
                     new_status,
                 )
                 added_games.append(added_info)
-        # saves each time the checks count is divisible by num
-        if self.save_to_file:
-            save_every_nth()
+        # saves once the pending changes are over budget
+        self.checkpoint()
         # prints the total games updated and added
         if 0 < len(played_games) < 50:
             self.output_played_games_info(played_games)
@@ -977,39 +1407,80 @@ class Tracker(Steam, Utils):
                 print("Showing First 50 Games Added")
             self.output_added_games_info(added_games)
         # checks for removed games
+        sheet_games = diff.removed if full_sync else []
         total_removed_games = len(sheet_games)
+        deleted_games = 0
         if total_removed_games:
             removed_game_names = [
-                self.steam.get_cell(app_id, self.name_col) for app_id in sheet_games
+                self.library.get_cell(app_id, self.name_col) for app_id in sheet_games
             ]
             removed_games_names_str = self.list_to_sentence(removed_game_names)
             if self.is_response_yes(
                 f"\nDo you want to delele all the following games?\n{removed_games_names_str}"
             ):
                 for app_id in sheet_games:
-                    self.steam.delete_row(str(app_id))
-        if self.excel.changes_made and self.save_to_file:
-            self.excel.save(use_print=False)
-        else:
+                    self.library.delete_row(app_id)
+                    self.index_game_name(app_id)
+                    deleted_games += 1
+        # checkpoints clear `changes_made` so only this sync's changes are used
+        changed = played_games or added_games or deleted_games or self.library.dirty
+        if not changed:
             print("\nNo Steam games were added or updated")
+            return
+        self.library.flush()
+        if self.save_to_file:
+            self.save_excel(use_print=False)
 
-    def sync_steam_games(self, steam_key: int, steam_id: int):
+    def sync_steam_games(self, steam_key: int, steam_id: int, full_sync=False):
         """
         Gets games owned by the entered `steam_id`
         and runs excel update/add functions.
+
+        Only recently played games are synced unless `full_sync` is True, a
+        full sync has not run within `full_sync_freq` days or the owned game
+        count changed.
         """
+        if not full_sync and self.recently_executed(
+            self.config_data, "full_steam_sync", self.full_sync_freq
+        ):
+            if self.sync_recent_steam_games(steam_key, steam_id):
+                return
         steam_games = self.get_owned_steam_games(steam_key, steam_id)
-        sheet_app_ids = [int(app_id) for app_id in self.steam.row_idx.keys()]
         if not steam_games:
             print("\nFailed to retrieve Steam Games")
         else:
-            if not sheet_app_ids:
+            if not len(self.library):
                 print(f"\nStarting First Steam Sync")
-            self.game_check(steam_games, sheet_app_ids)
+            self.game_check(steam_games)
+            self.config_data["steam_owned_count"] = len(steam_games)
+            self.update_last_run(self.config_data, "full_steam_sync")
             return
         input()
         exit()
 
+    def sync_recent_steam_games(self, steam_key: int, steam_id: int):
+        """
+        Syncs only the games played in the last two weeks. Returns False if a
+        full sync is needed instead.
+        """
+        owned_count = self.get_owned_game_count(steam_key, steam_id)
+        if owned_count is None:
+            return False
+        if owned_count != self.config_data.get("steam_owned_count"):
+            print("\nOwned Steam games changed so every game will be synced")
+            return False
+        recent_games = self.get_recently_played_steam_games(steam_key, steam_id, 0)
+        if recent_games is None:
+            return False
+        # games that are new to the sheet need the full sync to be added
+        for game in recent_games:
+            if game["appid"] in self.library:
+                continue
+            if not self.game_skipper.skip_game(game["name"], game["appid"]):
+                return False
+        self.game_check(recent_games, full_sync=False)
+        return True
+
     def update_steam_game(
         self,
         app_id,
@@ -1024,7 +1495,7 @@ class Tracker(Steam, Utils):
         Updates the games playtime and play status if they changed.
         """
         # all hours
-        previous_hours_played = self.steam.get_cell(app_id, self.hours_played_col)
+        previous_hours_played = self.library.get_cell(app_id, self.hours_played_col)
         current_hours_played = self.hours_played(minutes_played)
         current_linux_hours_played = self.hours_played(linux_minutes_played)
         # makes sure hours played is a number
@@ -1043,7 +1514,7 @@ class Tracker(Steam, Utils):
             self.set_time_played(app_id, time_played)
             self.set_date_updated(app_id)
             self.set_play_status(app_id, new_status, cur_status)
-            self.steam.format_row(app_id)
+            self.format_row(app_id)
             self.total_session_playtime += hours_played
             # updated game logging
             msg = f"Playtime: {game_name} played for {added_time_played}"
@@ -1091,7 +1562,7 @@ class Tracker(Steam, Utils):
             self.name_col: game_name,
             self.play_status_col: play_status,
             self.ea_col: early_access,
-            self.time_to_beat_col: self.get_time_to_beat(game_name),
+            self.time_to_beat_col: self.get_time_to_beat(game_name, app_id),
             self.hours_played_col: hours_played,
             self.linux_hours_col: linux_hours_played,
             self.time_played_col: time_played,
@@ -1104,16 +1575,17 @@ class Tracker(Steam, Utils):
             for column in self.excel_columns:
                 if column in steam_info.keys():
                     column_info[column] = steam_info[column]
-        self.steam.add_new_line(column_info)
+        self.library.add_row(column_info)
+        self.index_game_name(app_id, column_info[self.name_col])
         # logging
         if not hours_played:
             time_played = "no time"
         if self.logging:
             info = f"New Game: Added {game_name} with {time_played} played"
             self.tracker.info(info)
-        self.steam.format_row(app_id)
+        self.format_row(app_id)
         if save_after_add and self.save_to_file:
-            self.excel.save(use_print=False)
+            self.save_excel(use_print=False)
         return {
             "name": game_name,
             "total_playtime": hours_played or 0,
@@ -1174,14 +1646,14 @@ class Tracker(Steam, Utils):
         if not games:
             print("No Playstation Games Found")
             return
-        save_every_nth = self.create_save_every_nth()
         added_ps_games = []
         updated_ps_games = []
         all_game_names = []
         print()
         desc = f"Syncing [bold]{len(games):,}[/bold] Playstation Games"
-        for game in track(games, description=desc):
-            game_name = self.unicode_remover(game["name"])
+        self.game_skipper.refresh()
+        game_names = self.unicode_remover_bulk(game["name"] for game in games)
+        for game, game_name in zip(track(games, description=desc), game_names):
             all_game_names.append(game_name)
             latest_platform = "PS5"
             platform = game["platform"]
@@ -1214,7 +1686,7 @@ class Tracker(Steam, Utils):
             else:
                 added_info = self.add_ps_game(game_name, platform)
                 added_ps_games.append(added_info)
-            save_every_nth()
+            self.checkpoint()
         # Updates Owned on Steam Row
         for game in self.playstation.row_idx.keys():
             games = self.search_games(game, exact=True)
@@ -1246,25 +1718,22 @@ class Tracker(Steam, Utils):
         # TODO add info on removed ps games
         # saving
         if total_added or total_updated and self.save_to_file:
-            self.excel.save(use_print=False)
+            self.save_excel(use_print=False)
 
     def get_random_game_name(self, play_status, choice_list=[]):
         """
         Picks random game with the given `play_status` then removes it from the `choice_list` so it wont show up again during this session.
         """
         if not choice_list:
-            for app_id in self.steam.row_idx.keys():
-                game_play_status = self.steam.get_cell(app_id, self.play_status_col)
-                if not game_play_status:
-                    continue
-                if game_play_status.lower() == play_status.lower():
-                    choice_list.append(app_id)
+            play_statuses = self.library.column(self.play_status_col).str.lower()
+            matches = play_statuses == play_status.lower()
+            choice_list.extend(play_statuses.index[matches])
         # picks random game then removes it from the choice list so it wont show up again during this session
         if not choice_list:
             return None, choice_list
         picked_app_id = random.choice(choice_list)
         choice_list.pop(choice_list.index(picked_app_id))
-        picked_game_name = self.steam.get_cell(picked_app_id, self.name_col)
+        picked_game_name = self.library.get_cell(picked_app_id, self.name_col)
         return picked_game_name, choice_list
 
     def pick_random_game(self):
@@ -1293,40 +1762,84 @@ class Tracker(Steam, Utils):
     def get_favorite_games(self, min_rating=8):
         """
         gets favorite games from excel file as a list of dicts
+
+        Prices for every favorite are fetched in a few batched requests and
+        everything else comes from the library.
         """
-        # starts check with progress bar
         print(f"Minimum Rating set to {min_rating}\n")
         games = []
-        desc = "Finding Favorite Games"
-        for app_id in track(self.steam.row_idx.keys(), description=desc):
-            game_data = self.steam.get_row(app_id)
-            if game_data[self.my_rating_col] == None:
+        ratings = pd.to_numeric(
+            self.library.column(self.my_rating_col),
+            errors="coerce",
+        )
+        favorite_app_ids = ratings.index[ratings >= min_rating]
+        with self.console.status("Checking Favorite Game Prices"):
+            prices = self.get_app_prices(favorite_app_ids)
+        self.record_prices(prices)
+        for app_id in favorite_app_ids:
+            if str(app_id) not in prices:
                 continue
-            if game_data[self.my_rating_col] >= min_rating and app_id:
-                game_info = self.get_game_info(app_id)
-                if not game_info or not "on_sale" in game_info.keys():
-                    continue
-                # create game_dict
-                game_dict = {
-                    self.date_updated_col: dt.datetime.now(),
-                    self.name_col: game_info["game_name"],
-                    self.discount_col: game_info["discount"] * 0.01,
-                    self.price_col: game_info["price"],
-                    self.my_rating_col: game_data[self.my_rating_col],
-                    self.steam_rev_per_col: game_info[self.steam_rev_per_col],
-                    self.steam_rev_total_col: game_info[self.steam_rev_total_col],
-                    self.store_link_col: game_data[self.store_link_col],
-                    self.time_to_beat_col: game_data[self.time_to_beat_col],
-                    self.user_tags_col: game_info[self.user_tags_col],
-                    self.release_col: game_info[self.release_col],
-                    self.genre_col: game_info[self.genre_col],
-                    self.ea_col: game_info[self.ea_col],
-                    self.dev_col: game_info[self.dev_col],
-                    self.pub_col: game_info[self.pub_col],
-                }
-                games.append(game_dict)
+            game_data = self.library.get_row(app_id)
+            price, discount, _ = self.get_price_info(prices[str(app_id)])
+            # create game_dict
+            game_dict = {
+                self.date_updated_col: dt.datetime.now(),
+                self.name_col: game_data[self.name_col],
+                self.discount_col: (discount or 0.0) * 0.01,
+                self.price_col: price or "-",
+            }
+            for column in (
+                self.my_rating_col,
+                self.steam_rev_per_col,
+                self.steam_rev_total_col,
+                self.store_link_col,
+                self.time_to_beat_col,
+                self.user_tags_col,
+                self.release_col,
+                self.genre_col,
+                self.ea_col,
+                self.dev_col,
+                self.pub_col,
+            ):
+                game_dict[column] = game_data[column]
+            games.append(game_dict)
         return games
 
+    def record_prices(self, prices: dict) -> int:
+        """
+        Adds the price overviews from `get_app_prices` to the price history.
+        """
+        return self.price_history.record(prices)
+
+    def output_price_lows(self, app_ids):
+        """
+        Shows the games from `app_ids` that are at the lowest price seen.
+        """
+        lows = self.price_history.at_all_time_low(app_ids)
+        if lows.empty:
+            return
+        table = Table(
+            title="Lowest Prices Seen",
+            show_lines=True,
+            title_style="bold",
+            style="deep_sky_blue1",
+        )
+        table.add_column("Name", justify="left")
+        table.add_column("Price", justify="center")
+        table.add_column("Discount", justify="center")
+        table.add_column("Average", justify="center")
+        table.add_column("Checks", justify="center")
+        for row in lows.itertuples():
+            name = self.library.get_row(str(row.Index))[self.name_col]
+            table.add_row(
+                str(name),
+                f"${row.price / 100:.2f}",
+                f"{row.discount}%",
+                f"${row.average / 100:.2f}",
+                str(row.observations),
+            )
+        self.console.print(table, new_line_start=True)
+
     def update_sales_sheet(self, games):
         """
         Updates the sales sheet with each games info from `games`.
@@ -1348,7 +1861,7 @@ class Tracker(Steam, Utils):
             self.sales.add_new_line(game)
         self.sales.format_all_cells()
         if self.save_to_file:
-            self.excel.save(use_print=False)
+            self.save_excel(use_print=False)
 
     def sync_favorite_games_sales(self):
         """
@@ -1374,6 +1887,8 @@ class Tracker(Steam, Utils):
         # prints info
         print(f"\nFound {total_sales} Favorite Game Sales:\n")
         self.update_sales_sheet(games=games)
+        self.output_price_lows(self.library.column(self.name_col).index)
+        self.output_network_stats()
 
     @staticmethod
     def advanced_picker(choices, title):
@@ -1384,29 +1899,22 @@ class Tracker(Steam, Utils):
         selected_index = pick(options, title)[1]
         return choices[selected_index]
 
-    def search_games(self, search_query, exact=False, min_match=0.6) -> list[dict]:
+    def search_games(
+        self, search_query, exact=False, min_match=0.6, limit=10
+    ) -> list[dict]:
         """
         Uses `search_query` to find any games that match within the Steam game library.
         Set `exact` to True for it to require a perfect game name match instead of just
         checking of the `search_query` is within the game name.
+
+        Fuzzy matches are ranked best first and limited to `limit` games.
         """
-        possible_games = []
-        for app_id in self.steam.row_idx.keys():
-            name = self.steam.get_cell(app_id, "Name")
-            search_query_lower = search_query.lower()
-            name_lower = name.lower()
-            if exact:
-                if search_query_lower == name_lower:
-                    possible_games.append(self.steam.get_row(app_id))
-            else:
-                match = SequenceMatcher(None, search_query_lower, name_lower)
-                if match.ratio() >= min_match:
-                    possible_games.append(self.steam.get_row(app_id))
-                # TODO decide if this should be used with only the top n results
-                # dist = self.lev_distance(search_query_lower, name_lower)
-                # if dist <= 4:
-                #     possible_games.append(self.steam.get_row(app_id))
-        return possible_games
+        if exact:
+            matched_app_ids = self.search_index.find_exact(search_query)
+        else:
+            matches = self.search_index.search(search_query, limit, min_match)
+            matched_app_ids = [app_id for app_id, _ in matches]
+        return [self.library.get_row(app_id) for app_id in matched_app_ids]
 
     def game_finder(self, search_query=None) -> dict or None:
         """
@@ -1442,26 +1950,38 @@ class Tracker(Steam, Utils):
                 return None
             print(f"\nSelected: {chosen_game[0]}")
             app_id = chosen_game[1]
-            game = self.steam.get_row(app_id)
+            game = self.library.get_row(app_id)
             return game
         else:
             print("\nNo game matches found")
             return None
 
     def bulk_update_player_count(self, app_ids, update_type):
+        """
+        Updates player counts for `app_ids` concurrently, skipping games that
+        were refreshed recently.
+        """
         print()  # forced new line due to how track() works
-        player_counts = []
+        refresher = PlayerCountRefresher(
+            lambda app_id: self.get_steam_game_player_count(app_id, self.steam_key),
+            max_age_minutes=self.player_count_max_age,
+            max_workers=self.max_workers,
+        )
+        app_ids = list(app_ids)
+        stale_app_ids = refresher.get_stale(app_ids)
+        player_counts = {}
         desc = f"Updating {update_type} Player Count(s)"
-        for app_id in track(app_ids, description=desc):
-            player_count = self.get_steam_game_player_count(app_id, self.steam_key)
-            player_counts.append(player_count)
-            self.steam.update_cell(
-                app_id,
-                self.steam_player_count_col,
-                player_count,
-            )
-            self.api_sleeper("steam_player_count")
-        return player_counts
+        results = refresher.refresh(stale_app_ids)
+        for app_id, player_count in track(
+            results, description=desc, total=len(stale_app_ids)
+        ):
+            player_counts[app_id] = player_count
+        self.library.update_column(self.steam_player_count_col, player_counts)
+        refresher.save()
+        if skipped := len(app_ids) - len(stale_app_ids):
+            msg = f"Skipped {skipped} games refreshed in the last {self.player_count_max_age} minutes"
+            self.console.print(msg, style="info")
+        return list(player_counts.values())
 
     def update_player_counts(self, df, last_num=15):
         """
@@ -1477,7 +1997,7 @@ class Tracker(Steam, Utils):
         app_ids = []
         if selected_action == options[0]:
             update_type = "Recent"
-            recently_played = App.find_recent_games(df, self.date_updated_col, 30)
+            recently_played = self.find_recent_games(df, self.date_updated_col, 30)
             app_ids = [game[self.app_id_col] for game in recently_played]
         elif selected_action == options[1]:
             update_type = "Single"
@@ -1488,9 +2008,9 @@ class Tracker(Steam, Utils):
                 return
         elif selected_action == options[2]:
             update_type = "All"
-            app_ids = self.steam.row_idx.keys()
+            app_ids = self.library.keys()
         self.bulk_update_player_count(app_ids, update_type)
-        self.excel.save(use_print=False)
+        self.save_excel(use_print=False)
 
     def pick_game_to_update(self, games):
         """
@@ -1545,30 +2065,123 @@ class Tracker(Steam, Utils):
             if repeat:
                 self.pick_task(choices, repeat)
 
-    def game_library_actions(self, df):
+    def get_library_actions(self, df=None):
         """
-        Gives a choice of actions for the current game library.
+        Gets the name and function of each game library action.
+
+        `df` is only created once an action needs it if it is not given.
         """
+        get_df = lambda: self.create_library_dataframe() if df is None else df
         # lamdas
-        output_statistics_func = lambda: self.output_statistics(df)
-        update_player_counts_func = lambda: self.update_player_counts(df)
-        sync_friends_list = self.get_friends_list_changes()
-        # choice picker
-        choices = [
-            ("Exit and Open the Excel File", self.excel.open_excel),
+        output_statistics_func = lambda: self.output_statistics(get_df())
+        update_player_counts_func = lambda: self.update_player_counts(get_df())
+        recommendations_func = lambda: self.output_recommendations(get_df())
+        return [
+            ("Exit and Open the Excel File", self.open_excel),
             ("Random Game Explorer", self.pick_random_game),
+            ("Similar Game Recommender", recommendations_func),
             ("Player Counts Sync", update_player_counts_func),
             ("Favorite Games Sales Sync", self.sync_favorite_games_sales),
             ("Game Data Sync", self.update_all_game_data),
             ("Statistics Display", output_statistics_func),
-            ("Steam Friends List Sync", sync_friends_list),
+            ("Steam Friends List Sync", self.get_friends_list_changes),
             ("Playstation Games Sync", self.sync_playstation_games),
+            ("Export Excel File from Datastore", self.export_excel),
+            ("Steam App ID Fix", self.fix_app_ids),
             # ("Update All Cell Formatting", self.steam.format_all_cells),
             ("Open Log", self.open_log),
         ]
+
+    def game_library_actions(self, df):
+        """
+        Gives a choice of actions for the current game library.
+        """
+        # choice picker
+        choices = self.get_library_actions(df)
         self.pick_task(choices)
         exit()
 
+    def run_action(self, action_name):
+        """
+        Runs the game library action named `action_name` right away without
+        syncing anything first.
+        """
+        for name, func in self.get_library_actions():
+            if name.lower() == action_name.lower():
+                func()
+                self.save_excel(use_print=False)
+                return True
+        names = [name for name, _ in self.get_library_actions()]
+        print(f"\n{action_name} is not an action. Choose from:\n" + "\n".join(names))
+        return False
+
+    def output_startup_profile(self):
+        """
+        Loads everything used at startup and shows how long each part took.
+        """
+        self.library
+        self.excel
+        self.playstation
+        self.sales
+        self.response_cache
+        table = Table(
+            title="Startup Profile",
+            show_lines=True,
+            title_style="bold",
+            style="deep_sky_blue1",
+        )
+        table.add_column("Part", justify="left")
+        table.add_column("Seconds", justify="right")
+        for name, seconds in sorted(
+            startup_times.items(), key=lambda item: item[1], reverse=True
+        ):
+            table.add_row(name.replace("_", " ").title(), f"{seconds:.3f}")
+        self.console.print(table, new_line_start=True)
+        print("Parts that use other parts include their time.")
+
+    def output_metrics(self):
+        """
+        Saves where this run spent its time to `metrics_path` and shows it
+        as tables if `show_metrics` is True.
+        """
+        summary = metrics.save(self.metrics_path)
+        if not self.show_metrics:
+            return summary
+        table = Table(
+            title="Run Metrics",
+            show_lines=True,
+            title_style="bold",
+            style="deep_sky_blue1",
+        )
+        table.add_column("Span", justify="left")
+        table.add_column("Calls", justify="right")
+        table.add_column("Seconds", justify="right")
+        table.add_column("Slowest", justify="right")
+        for path, span in summary["spans"].items():
+            names = path.split(metrics.separator)
+            table.add_row(
+                "  " * (len(names) - 1) + names[-1],
+                f"{span['count']:,}",
+                f"{span['seconds']:.3f}",
+                f"{span['max_seconds']:.3f}",
+            )
+        self.console.print(table, new_line_start=True)
+        if summary["counters"]:
+            table = Table(
+                title="Run Counters",
+                show_lines=True,
+                title_style="bold",
+                style="deep_sky_blue1",
+            )
+            table.add_column("Counter", justify="left")
+            table.add_column("Total", justify="right")
+            for name, value in summary["counters"].items():
+                total = f"{value:,.1f}" if isinstance(value, float) else f"{value:,}"
+                table.add_row(name.replace("_", " ").title(), total)
+            self.console.print(table, new_line_start=True)
+        print(f"Took {summary['elapsed_seconds']:.1f}s, saved to {self.metrics_path}")
+        return summary
+
     def show_errors(self):
         """
         Shows errors that occurred if they were added to the errors list.
@@ -1580,28 +2193,58 @@ class Tracker(Steam, Utils):
         for error in self.errors:
             print(error)
 
+    def update_app_list(self):
+        """
+        Updates the cached Steam app list if it is older than
+        `app_list_max_age` hours. Returns True if it was updated.
+        """
+        app_list = self.app_list
+        if not app_list.is_stale(self.app_list_max_age):
+            return False
+        # only apps changed since the last update are downloaded
+        if len(app_list) and self.steam_key:
+            changes = self.get_app_list_changes(self.steam_key, app_list.last_modified)
+            if changes is not None:
+                app_list.update(changes)
+                return True
+        apps = self.get_app_list()
+        if not apps:
+            return False
+        app_list.update(apps, full=True)
+        return True
+
     def fix_app_ids(self):
         """
         Created to fix steam ID's in case they get messed up.
+
+        Games are only given the app ID of an app matching their name and
+        keep their current ID when no app matches.
         """
-        app_list = self.get_app_list()
-        for app_id in self.steam.row_idx:
-            name = self.steam.get_cell(app_id, self.name_col)
-            correct_app_id = self.get_app_id(name, app_list)
-            if app_id and correct_app_id:
-                if int(app_id) != int(correct_app_id):
-                    print(name, app_id, correct_app_id)
-                    if correct_app_id:
-                        self.steam.update_cell(app_id, self.app_id_col, correct_app_id)
-            else:
-                print(name, app_id, correct_app_id)
-                self.steam.update_cell(app_id, self.app_id_col, "")
-        self.excel.save(use_print=False)
+        self.update_app_list()
+        if not len(self.app_list):
+            print("\nThe Steam app list could not be downloaded.")
+            return
+        fixed = 0
+        for app_id, name in list(self.library.column(self.name_col).items()):
+            if not isinstance(name, str):
+                continue
+            app_ids = self.app_list.get_app_ids(name)
+            # games sharing a name with another app keep their current ID
+            if not app_ids or app_id in map(str, app_ids):
+                continue
+            correct_app_id = self.get_app_id(name, self.app_list)
+            if self.library.rename_key(app_id, correct_app_id):
+                fixed += 1
+        print(f"\nFixed {fixed} Steam App IDs.")
+        if fixed:
+            self.save_excel(use_print=False)
 
     @keyboard_interrupt
-    def run(self):
+    def run(self, full_sync=False):
         """
         Main run function.
+
+        Every owned Steam game is synced if `full_sync` is True.
         """
         self.console.print(self.title, style="primary")
 
@@ -1615,22 +2258,55 @@ class Tracker(Steam, Utils):
         # internet checks
         internet = self.check_internet_connection()
         if internet:
-            self.sync_steam_games(self.steam_key, self.steam_id)
+            with metrics.span("steam sync"):
+                self.sync_steam_games(self.steam_key, self.steam_id, full_sync)
         else:
             self.console.print("\nNo Internet Detected", style="warning")
 
-        df = self.steam.create_dataframe(na_vals=self.na_values)
+        with metrics.span("library dataframe"):
+            df = self.create_library_dataframe()
         self.output_recently_played_games(df)
 
         # extra data updates
         if internet:
-            self.updated_game_data(df)
-            self.get_friends_list_changes()
+            with metrics.span("game data updates"):
+                self.updated_game_data(df)
+            with metrics.span("friends list"):
+                self.get_friends_list_changes()
 
         self.show_errors()
+        self.output_metrics()
         self.game_library_actions(df)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=Tracker.title)
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="shows where import and startup time goes and then exits",
+    )
+    parser.add_argument(
+        "--action",
+        help='runs one game library action such as "Random Game Explorer"',
+    )
+    parser.add_argument(
+        "--full-sync",
+        action="store_true",
+        help="syncs every owned Steam game instead of only recently played ones",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="shows where the run spent its time before the game library actions",
+    )
+    args = parser.parse_args()
     App = Tracker(save=True)
-    App.run()
+    if args.metrics:
+        App.show_metrics = True
+    if args.profile_startup:
+        App.output_startup_profile()
+    elif args.action:
+        App.run_action(args.action)
+    else:
+        App.run(full_sync=args.full_sync)
@@ -0,0 +1,364 @@
+"""
+Local stand-in for the Steam Web API, Steam store and HowLongToBeat serving
+generated data so syncs can be load tested without touching the real
+services.
+
+Run it with `python -m testing.fake_steam_server` and set the "steam_api_url"
+and "steam_store_url" settings in config.json to the printed url.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from difflib import SequenceMatcher
+from collections import deque
+from typing import NamedTuple
+import argparse, json, random, threading, time
+
+import requests
+
+ADJECTIVES = ["Dark", "Lost", "Super", "Hollow", "Iron", "Neon", "Silent", "Wild"]
+NOUNS = ["Knight", "Souls", "Frontier", "Legacy", "Tactics", "Odyssey", "Arena"]
+TAGS = ["Action", "Indie", "Roguelike", "RPG", "Strategy", "Co-op", "Puzzle"]
+
+
+class FakeSteamHandler(BaseHTTPRequestHandler):
+    """
+    Routes each request to the `FakeSteamServer` it belongs to.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        status, content_type, body = self.server.fake.handle(url.path, params)
+        body = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeSteamServer:
+    def __init__(
+        self,
+        total_games: int = 1000,
+        total_friends: int = 50,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: float = None,
+        seed: int = 1,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Serves `total_games` generated owned games and `total_friends`
+        friends on `host` and `port`, which is picked automatically when 0.
+
+        Every response is delayed by `latency` seconds, `error_rate` of them
+        fail with a 500 and each endpoint responds with a 429 once it gets
+        more than `rate_limit` requests in a second.
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rng = random.Random(seed)
+        self.games = {}
+        for app_id in range(10, (total_games + 1) * 10, 10):
+            name = f"{self.rng.choice(ADJECTIVES)} {self.rng.choice(NOUNS)} {app_id}"
+            recent = self.rng.randint(1, 600) if self.rng.random() < 0.05 else 0
+            self.games[app_id] = {
+                "appid": app_id,
+                "name": name,
+                "playtime_forever": self.rng.choice([0, self.rng.randint(1, 10_000)])
+                + recent,
+                "playtime_2weeks": recent,
+                "playtime_linux_forever": 0,
+            }
+        self.friend_ids = [
+            str(76561197960265728 + self.rng.randint(1, 10**9))
+            for _ in range(total_friends)
+        ]
+        self.routes = {
+            "/IPlayerService/GetOwnedGames/v0001/": self.get_owned_games,
+            "/IPlayerService/GetRecentlyPlayedGames/v1/": self.get_recently_played,
+            "/ISteamUserStats/GetNumberOfCurrentPlayers/v1/": self.get_player_count,
+            "/ISteamUser/GetFriendList/v0001/": self.get_friend_list,
+            "/ISteamUser/GetPlayerSummaries/v0002/": self.get_player_summaries,
+            "/api/appdetails": self.get_app_details,
+            "/hltb/search": self.search_time_to_beat,
+        }
+        self.stats = {"requests": 0, "errors": 0, "throttled": 0, "paths": {}}
+        self.recent_requests = {}
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), FakeSteamHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake = self
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FakeSteamServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def play(self, app_id: int, minutes: int) -> None:
+        """
+        Adds `minutes` of recent playtime to `app_id`.
+        """
+        with self.lock:
+            game = self.games[app_id]
+            game["playtime_forever"] += minutes
+            game["playtime_2weeks"] += minutes
+
+    def is_throttled(self, path: str) -> bool:
+        """
+        Records a request to `path` and checks if it went over the rate limit.
+        Must be called while holding the lock.
+        """
+        if not self.rate_limit:
+            return False
+        cur_time = time.monotonic()
+        recent = self.recent_requests.setdefault(path, deque())
+        while recent and recent[0] <= cur_time - 1:
+            recent.popleft()
+        if len(recent) >= self.rate_limit:
+            return True
+        recent.append(cur_time)
+        return False
+
+    def handle(self, path: str, params: dict) -> tuple[int, str, str]:
+        """
+        Gets the status, content type and body for a request to `path`.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        route = path
+        if path.startswith("/app/"):
+            route = "/app/"
+        with self.lock:
+            self.stats["requests"] += 1
+            paths = self.stats["paths"]
+            paths[route] = paths.get(route, 0) + 1
+            if self.is_throttled(route):
+                self.stats["throttled"] += 1
+                return 429, "text/plain", "Too Many Requests"
+            if self.error_rate and self.rng.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return 500, "text/plain", "Internal Server Error"
+        if route == "/app/":
+            app_id = int(path.split("/")[2])
+            if app_id not in self.games:
+                return 404, "text/plain", "Not Found"
+            return 200, "text/html; charset=UTF-8", self.get_store_page(app_id)
+        if route not in self.routes:
+            return 404, "text/plain", "Not Found"
+        with self.lock:
+            data = self.routes[route](params)
+        return 200, "application/json", json.dumps(data)
+
+    def get_owned_games(self, params: dict) -> dict:
+        include_appinfo = params.get("include_appinfo") == "1"
+        games = []
+        for game in self.games.values():
+            game = dict(game)
+            del game["playtime_2weeks"]
+            if not include_appinfo:
+                del game["name"]
+            games.append(game)
+        return {"response": {"game_count": len(games), "games": games}}
+
+    def get_recently_played(self, params: dict) -> dict:
+        games = [dict(g) for g in self.games.values() if g["playtime_2weeks"]]
+        response = {"total_count": len(games)}
+        count = int(params.get("count", 0))
+        if count:
+            games = games[:count]
+        # steam leaves games out when nothing was played recently
+        if games:
+            response["games"] = games
+        return {"response": response}
+
+    def get_player_count(self, params: dict) -> dict:
+        app_id = int(params.get("appid", 0))
+        if app_id not in self.games:
+            return {"response": {"result": 42}}
+        player_count = random.Random(app_id).randint(0, 50_000)
+        return {"response": {"player_count": player_count, "result": 1}}
+
+    def get_friend_list(self, params: dict) -> dict:
+        friends = [
+            {"steamid": steam_id, "relationship": "friend", "friend_since": 0}
+            for steam_id in self.friend_ids
+        ]
+        return {"friendslist": {"friends": friends}}
+
+    def get_player_summaries(self, params: dict) -> dict:
+        players = [
+            {"steamid": steam_id, "personaname": f"Player {steam_id[-4:]}"}
+            for steam_id in params.get("steamids", "").split(",")
+            if steam_id
+        ]
+        return {"response": {"players": players}}
+
+    def get_app_details(self, params: dict) -> dict:
+        """
+        Gets the details of every comma separated app ID in "appids".
+        """
+        app_details = {}
+        for app_id in params.get("appids", "").split(","):
+            game = self.games.get(int(app_id)) if app_id.isdigit() else None
+            if not game:
+                app_details[app_id] = {"success": False}
+                continue
+            rng = random.Random(game["appid"])
+            price = rng.randint(0, 60) * 100 - 1 if rng.random() > 0.1 else 0
+            discount = rng.choice([0, 0, 0, 10, 25, 50, 75])
+            data = {
+                "name": game["name"],
+                "steam_appid": game["appid"],
+                "is_free": price <= 0,
+                "developers": [f"Studio {rng.randint(1, 500)}"],
+                "publishers": [f"Publisher {rng.randint(1, 100)}"],
+                "genres": [{"description": g} for g in rng.sample(TAGS, 2)],
+                "categories": [{"description": "Single-player"}],
+                "release_date": {"date": f"14 Sep, {rng.randint(2000, 2024)}"},
+                "platforms": {"windows": True, "linux": rng.random() < 0.3},
+            }
+            if price > 0:
+                final = round(price * (100 - discount) / 100)
+                data["price_overview"] = {
+                    "currency": "USD",
+                    "initial": price,
+                    "final": final,
+                    "discount_percent": discount,
+                    "initial_formatted": f"${price / 100:.2f}" if discount else "",
+                    "final_formatted": f"${final / 100:.2f}",
+                }
+            if params.get("filters") == "price_overview":
+                data = {"price_overview": data["price_overview"]} if price > 0 else []
+            app_details[app_id] = {"success": True, "data": data}
+        return app_details
+
+    def get_store_page(self, app_id: int) -> str:
+        """
+        Gets a store page with the parts `StorePageParser` reads.
+        """
+        rng = random.Random(app_id)
+        recent_percent, percent = rng.randint(40, 100), rng.randint(40, 100)
+        recent_total, total = rng.randint(10, 5_000), rng.randint(10, 200_000)
+        tags = "".join(
+            f'<a href="#" class="app_tag">{tag}</a>' for tag in rng.sample(TAGS, 4)
+        )
+        return (
+            f"<html><body><h1>{self.games[app_id]['name']}</h1>"
+            '<span class="game_review_summary positive">Positive</span>'
+            '<span class="nonresponsive_hidden responsive_reviewdesc">'
+            f"- {recent_percent}% of the {recent_total:,} user reviews in the "
+            "last 30 days are positive.</span>"
+            '<span class="game_review_summary positive">Very Positive</span>'
+            '<span class="nonresponsive_hidden responsive_reviewdesc">'
+            f"- {percent}% of the {total:,} user reviews for this game are "
+            f'positive.</span>{tags}<div class="app_tag add_button">+</div>'
+            "</body></html>"
+        )
+
+    def search_time_to_beat(self, params: dict) -> list:
+        """
+        Gets HowLongToBeat like results for games containing "q".
+        """
+        query = params.get("q", "").casefold()
+        results = []
+        for game in self.games.values():
+            name = game["name"]
+            if query and query in name.casefold():
+                rng = random.Random(game["appid"])
+                main_story = round(rng.uniform(2, 60), 1)
+                results.append(
+                    {
+                        "game_name": name,
+                        "similarity": SequenceMatcher(
+                            None, query, name.casefold()
+                        ).ratio(),
+                        "main_story": main_story,
+                        "main_extra": round(main_story * 1.5, 1),
+                        "completionist": round(main_story * 2.5, 1),
+                    }
+                )
+        return results
+
+
+class FakeHowLongToBeatEntry(NamedTuple):
+    """
+    The parts of a howlongtobeatpy `HowLongToBeatEntry` the Tracker uses.
+    """
+
+    game_name: str
+    similarity: float
+    main_story: float
+    main_extra: float
+    completionist: float
+
+
+class FakeHowLongToBeat:
+    def __init__(self, base_url: str) -> None:
+        """
+        Searches a `FakeSteamServer` at `base_url`. Can replace the Tracker's
+        `hltb` client since howlongtobeatpy can not be pointed at another host.
+        """
+        self.url = base_url + "hltb/search"
+        self.session = requests.Session()
+
+    def search(self, game_name: str) -> list[FakeHowLongToBeatEntry]:
+        response = self.session.get(self.url, params={"q": game_name}, timeout=30)
+        response.raise_for_status()
+        return [FakeHowLongToBeatEntry(**entry) for entry in response.json()]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--port", default=8080, type=int)
+    arg_parser.add_argument("--games", default=1000, type=int)
+    arg_parser.add_argument("--friends", default=50, type=int)
+    arg_parser.add_argument("--latency", default=0.0, type=float)
+    arg_parser.add_argument("--error-rate", default=0.0, type=float)
+    arg_parser.add_argument("--rate-limit", default=None, type=float)
+    args = arg_parser.parse_args()
+    server = FakeSteamServer(
+        total_games=args.games,
+        total_friends=args.friends,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        port=args.port,
+    )
+    print(f"Serving {args.games:,} games at {server.url}")
+    print(f'Set "steam_api_url" and "steam_store_url" to "{server.url}"')
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print(json.dumps(server.stats, indent=2))
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
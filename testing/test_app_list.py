@@ -0,0 +1,106 @@
+from pathlib import Path
+import tempfile, time
+import unittest
+
+# classes
+from classes.app_list import AppList
+from classes.steam import Steam
+
+
+class AppListTestCase(unittest.TestCase):
+    """
+    Creates an app list cache with a few apps in a temp folder.
+    """
+
+    apps = [
+        {"appid": 1145360, "name": "Hades", "last_modified": 1600000000},
+        {"appid": 504230, "name": "Celeste", "last_modified": 1500000000},
+        {"appid": 620, "name": "Portal™ 2", "last_modified": 1400000000},
+        {"appid": 99999, "name": "hades", "last_modified": 1300000000},
+    ]
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.temp_dir.name) / "app_list.bin"
+        self.app_list = AppList(self.cache_path)
+        self.app_list.update(self.apps)
+
+    def tearDown(self):
+        self.app_list.close()
+        self.temp_dir.cleanup()
+
+
+class Lookups(AppListTestCase):
+    """
+    Tests `get_name` and `get_app_id` functions.
+    """
+
+    def test_get_name(self):
+        self.assertEqual(self.app_list.get_name(504230), "Celeste")
+        self.assertEqual(self.app_list.get_name("620"), "Portal™ 2")
+        self.assertIsNone(self.app_list.get_name(12345))
+        self.assertIsNone(self.app_list.get_name(-1))
+
+    def test_get_app_id(self):
+        self.assertEqual(self.app_list.get_app_id("Celeste"), 504230)
+        self.assertEqual(self.app_list.get_app_id("portal 2"), 620)
+        self.assertIsNone(self.app_list.get_app_id("Not Real"))
+
+    def test_exact_name_first(self):
+        self.assertEqual(self.app_list.get_app_ids("HADES"), [99999, 1145360])
+        self.assertEqual(self.app_list.get_app_id("Hades"), 1145360)
+        self.assertEqual(self.app_list.get_app_id("hades"), 99999)
+
+    def test_steam_get_app_id(self):
+        self.assertEqual(Steam.get_app_id("Celeste", self.app_list), 504230)
+
+    def test_many_apps(self):
+        apps = {app_id: f"Game {app_id}" for app_id in range(10, 50000, 7)}
+        self.app_list.save(apps)
+        for app_id, name in list(apps.items())[::101]:
+            self.assertEqual(self.app_list.get_app_id(name), app_id)
+            self.assertEqual(self.app_list.get_name(app_id), name)
+
+
+class Cache(AppListTestCase):
+    """
+    Tests `load` and `update` functions.
+    """
+
+    def test_reload(self):
+        app_list = AppList(self.cache_path)
+        self.assertEqual(len(app_list), 4)
+        self.assertEqual(app_list.last_modified, 1600000000)
+        self.assertEqual(app_list.to_dict(), self.app_list.to_dict())
+
+    def test_missing_cache(self):
+        app_list = AppList(Path(self.temp_dir.name) / "missing.bin")
+        self.assertEqual(len(app_list), 0)
+        self.assertTrue(app_list.is_stale(24))
+        self.assertIsNone(app_list.get_app_id("Hades"))
+
+    def test_incremental_update(self):
+        changes = [
+            {"appid": 504230, "name": "Celeste Deluxe", "last_modified": 1700000000},
+            {"appid": 1, "name": "New Game", "last_modified": 1650000000},
+        ]
+        self.assertEqual(self.app_list.update(changes), 5)
+        self.assertEqual(self.app_list.get_app_id("Celeste Deluxe"), 504230)
+        self.assertIsNone(self.app_list.get_app_id("Celeste"))
+        self.assertEqual(self.app_list.get_name(1), "New Game")
+        self.assertEqual(self.app_list.last_modified, 1700000000)
+
+    def test_full_update(self):
+        self.app_list.update([{"appid": 1, "name": "Only Game"}], full=True)
+        self.assertEqual(self.app_list.to_dict(), {1: "Only Game"})
+
+    def test_no_changes(self):
+        self.app_list.fetched = 0
+        self.assertTrue(self.app_list.is_stale(24))
+        self.app_list.update([])
+        self.assertFalse(AppList(self.cache_path).is_stale(24))
+        self.assertLess(time.time() - self.app_list.fetched, 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+from pathlib import Path
+import tempfile
+import datetime as dt
+import unittest
+
+# classes
+from classes.datastore import Datastore
+from classes.library import Library
+from testing.workbook_fixture import create_steam_sheet
+
+# my package
+from easierexcel import Excel, Sheet
+
+
+class DatastoreTestCase(unittest.TestCase):
+    """
+    Creates a Steam sheet with a few games and an empty datastore.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        temp_path = Path(self.temp_dir.name)
+        games = [
+            {"App ID": 10, "Name": "Hades", "My Rating": 9, "Hours Played": 30.5},
+            {
+                "App ID": 20,
+                "Name": "Celeste",
+                "Date Updated": dt.datetime(2023, 1, 2, 3, 4),
+                "Steam Review Percent": "No Reviews",
+            },
+        ]
+        self.excel_path, self.excel, self.sheet = create_steam_sheet(
+            temp_path, games, save=True
+        )
+        self.store = Datastore(temp_path / "library.db")
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+
+class Sync(DatastoreTestCase):
+    """
+    Tests `sync_sheet` and `get_rows` functions.
+    """
+
+    def test_rows(self):
+        self.assertEqual(self.store.sync_sheet(self.sheet, 1.0), 2)
+        rows = self.store.get_rows("Steam")
+        self.assertEqual(list(rows), ["10", "20"])
+        self.assertEqual(rows["10"]["Hours Played"], 30.5)
+        self.assertEqual(rows["20"]["Date Updated"], dt.datetime(2023, 1, 2, 3, 4))
+        self.assertEqual(self.store.get_columns("Steam"), list(self.sheet.col_idx))
+
+    def test_fresh(self):
+        self.assertFalse(self.store.is_fresh("Steam", 1.0))
+        self.store.sync_sheet(self.sheet, 1.0)
+        self.assertTrue(self.store.is_fresh("Steam", 1.0))
+        self.store.mark_synced(2.0)
+        self.assertFalse(self.store.is_fresh("Steam", 1.0))
+        self.assertTrue(self.store.is_fresh("Steam", 2.0))
+
+
+class Changes(DatastoreTestCase):
+    """
+    Tests `upsert`, `update_cells` and `delete` functions.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.store.sync_sheet(self.sheet)
+
+    def test_update_cells(self):
+        cells = {("10", "My Rating"): 10, (20, "Name"): "Celeste 2", ("99", "Name"): 1}
+        self.assertEqual(self.store.update_cells("Steam", cells), 2)
+        self.assertEqual(self.store.get_row("Steam", 10)["My Rating"], 10)
+        self.assertEqual(self.store.get_row("Steam", 20)["Name"], "Celeste 2")
+
+    def test_upsert_keeps_order(self):
+        self.store.upsert("Steam", 30, {"App ID": 30, "Name": "Inscryption"})
+        self.store.upsert("Steam", 10, {"App ID": 10, "Name": "Hades II"})
+        self.assertEqual(list(self.store.get_rows("Steam")), ["10", "20", "30"])
+        self.assertEqual(self.store.get_row("Steam", 10)["Name"], "Hades II")
+
+    def test_delete(self):
+        self.assertTrue(self.store.delete("Steam", 10))
+        self.assertFalse(self.store.delete("Steam", 10))
+        self.assertIsNone(self.store.get_row("Steam", 10))
+
+
+class CreateDataframe(DatastoreTestCase):
+    """
+    Tests `create_dataframe` function.
+    """
+
+    def test_matches_excel(self):
+        self.store.sync_sheet(self.sheet)
+        na_vals = ["No Reviews"]
+        df = self.store.create_dataframe("Steam", na_vals)
+        excel_df = self.sheet.create_dataframe(na_vals=na_vals)
+        self.assertEqual(list(df.columns), list(excel_df.columns))
+        self.assertEqual(df["Name"].tolist(), excel_df["Name"].tolist())
+        self.assertEqual(df["My Rating"].sum(), 9)
+        self.assertTrue(df["Steam Review Percent"].isnull().all())
+        self.assertEqual(df["Date Updated"].dtype, excel_df["Date Updated"].dtype)
+
+
+class ExportSheet(DatastoreTestCase):
+    """
+    Tests `export_sheet` function.
+    """
+
+    def test_regenerates_sheet(self):
+        self.store.sync_sheet(self.sheet)
+        self.store.update_cells("Steam", {("10", "My Rating"): 7})
+        self.store.upsert("Steam", 30, {"App ID": 30, "Name": "Inscryption"})
+        self.store.delete("Steam", 20)
+        self.assertGreater(self.store.export_sheet(self.sheet), 0)
+        self.assertEqual(self.sheet.get_cell(10, "My Rating"), 7)
+        self.assertEqual(self.sheet.get_cell(30, "Name"), "Inscryption")
+        self.assertNotIn("20", self.sheet.row_idx)
+
+
+class LibraryMirror(DatastoreTestCase):
+    """
+    Tests `Library` keeping the datastore up to date.
+    """
+
+    def test_loads_from_fresh_store(self):
+        Library(self.sheet, self.store)
+        self.store.update_cells("Steam", {("10", "Name"): "From Store"})
+        # as if the workbook was saved with the change
+        self.store.mark_synced(self.excel_path.stat().st_mtime)
+        library = Library(self.sheet, self.store)
+        self.assertEqual(library.get_cell(10, "Name"), "From Store")
+        # workbook edits made outside the tracker reload from the sheet
+        self.store.mark_synced(0.0)
+        library = Library(self.sheet, self.store)
+        self.assertEqual(library.get_cell(10, "Name"), "Hades")
+
+    def test_opens_sheet_lazily(self):
+        Library(self.sheet, self.store)
+        opened = []
+
+        def open_sheet():
+            opened.append(True)
+            return self.sheet
+
+        library = Library(open_sheet, self.store, "Steam", self.excel_path)
+        self.assertEqual(library.get_cell(10, "Name"), "Hades")
+        self.assertFalse(opened)
+        library.update_cell(10, "My Rating", 8)
+        library.flush()
+        self.assertTrue(opened)
+
+    def test_mirrors_changes(self):
+        library = Library(self.sheet, self.store)
+        library.update_cell(10, "My Rating", 8)
+        library.add_row({"App ID": 30, "Name": "Inscryption"})
+        library.delete_row(20)
+        library.flush()
+        rows = self.store.get_rows("Steam")
+        self.assertEqual(list(rows), ["10", "30"])
+        self.assertEqual(rows["10"]["My Rating"], 8)
+
+    def test_mirrors_rename(self):
+        library = Library(self.sheet, self.store)
+        library.rename_key(20, 25)
+        rows = self.store.get_rows("Steam")
+        self.assertEqual(list(rows), ["10", "25"])
+        self.assertEqual(rows["25"]["App ID"], 25)
+        self.assertEqual(rows["25"]["Name"], "Celeste")
+
+    def test_unsaved_changes(self):
+        """
+        Changes the workbook was never saved with are not loaded from the store.
+        """
+        library = Library(self.sheet, self.store)
+        library.add_row({"App ID": 30, "Name": "Inscryption"})
+        library.update_cell(10, "Name", "Hades II")
+        library.flush()
+        # the next run opens the workbook as it was last saved
+        excel = Excel(self.excel_path, use_logging=False)
+        sheet = Sheet(excel, sheet_name="Steam", column_name="App ID")
+        library = Library(sheet, self.store)
+        self.assertNotIn(30, library)
+        self.assertEqual(library.keys(), list(sheet.row_idx))
+        self.assertEqual(library.get_cell(10, "Name"), "Hades")
+        # once saved the store is trusted again
+        library.add_row({"App ID": 30, "Name": "Inscryption"})
+        excel.save(use_print=False, backup=False)
+        self.store.mark_synced(self.excel_path.stat().st_mtime)
+        library = Library(lambda: sheet, self.store, "Steam", self.excel_path)
+        self.assertIn(30, library)
+        self.assertNotIn("sheet", library.__dict__)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+# classes
+from classes.http_session import create_session
+from classes.price_history import PriceHistory
+from classes.rate_limiter import RateLimiter
+from classes.response_cache import ResponseCache
+from classes.steam import Steam
+from testing.fake_steam_server import FakeSteamServer, FakeHowLongToBeat
+
+FAST_LIMITS = {
+    api: {"rate": 1000, "base_penalty": 0.01}
+    for api in [
+        "steam_owned_games",
+        "steam_app_details",
+        "steam_review_scrape",
+        "steam_player_count",
+        "127.0.0.1",
+    ]
+}
+
+
+class FakeSteamTestCase(unittest.TestCase):
+    """
+    Points a `Steam` instance at a `FakeSteamServer`.
+    """
+
+    server_kwargs = {}
+
+    def setUp(self):
+        self.server = FakeSteamServer(total_games=50, **self.server_kwargs).start()
+        self.steam = Steam()
+        self.steam.api_url = self.server.url
+        self.steam.store_url = self.server.url
+        self.steam.session = create_session()
+        self.steam.rate_limiter = RateLimiter(FAST_LIMITS)
+        self.steam.request_timeout = (5, 30)
+
+    def tearDown(self):
+        self.steam.session.close()
+        self.server.stop()
+
+
+class SteamApi(FakeSteamTestCase):
+    """
+    Tests the `Steam` api functions against the fake server.
+    """
+
+    def test_owned_games(self):
+        owned_games = self.steam.get_owned_steam_games("key", "id")
+        self.assertEqual(len(owned_games), 50)
+        self.assertEqual(owned_games[0]["appid"], 10)
+        self.assertIn("name", owned_games[0])
+        self.assertEqual(self.steam.get_owned_game_count("key", "id"), 50)
+
+    def test_recently_played(self):
+        self.server.play(10, 30)
+        recent = self.steam.get_recently_played_steam_games("key", "id", 0)
+        self.assertIn(10, [game["appid"] for game in recent])
+
+    def test_store_page(self):
+        percent, total = self.steam.get_steam_review(10)
+        self.assertIsInstance(percent, float)
+        self.assertIsInstance(total, int)
+        self.assertEqual(len(self.steam.get_steam_user_tags(10)), 4)
+
+    def test_app_details(self):
+        app_details = self.steam.get_app_details(10)
+        self.assertTrue(app_details["10"]["success"])
+        self.assertEqual(
+            app_details["10"]["data"]["name"], self.server.games[10]["name"]
+        )
+        self.assertFalse(self.steam.get_app_details(11)["11"]["success"])
+
+    def test_app_prices(self):
+        self.steam.price_chunk_size = 20
+        app_ids = [game["appid"] for game in self.server.games.values()] + [11]
+        prices = self.steam.get_app_prices(app_ids)
+        # 51 apps only take three requests
+        self.assertEqual(self.server.stats["paths"]["/api/appdetails"], 3)
+        for app_id in app_ids[:4] + [11]:
+            app_details = self.steam.get_app_details(app_id)[str(app_id)]
+            if "price_overview" in app_details.get("data", {}):
+                expected = app_details["data"]["price_overview"]
+                self.assertEqual(prices[str(app_id)]["price_overview"], expected)
+            else:
+                self.assertNotIn(str(app_id), prices)
+
+    def test_app_prices_not_cached(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.steam.response_cache = ResponseCache(Path(temp_dir) / "cache.db")
+            for _ in range(2):
+                self.steam.get_app_details(10)
+                self.steam.get_app_prices([10])
+            self.steam.response_cache.conn.close()
+        self.assertEqual(self.server.stats["paths"]["/api/appdetails"], 3)
+
+    def test_cached_prices_not_recorded(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.steam.response_cache = ResponseCache(Path(temp_dir) / "cache.db")
+            history = PriceHistory(Path(temp_dir) / "price_history.bin")
+            for _ in range(2):
+                prices = self.steam.get_app_prices([10, 20], use_cache=True)
+                history.record(prices)
+            self.steam.response_cache.conn.close()
+            self.assertEqual(len(history.read()), 2)
+
+    def test_player_count(self):
+        player_count = self.steam.get_steam_game_player_count(10, "key")
+        self.assertIsInstance(player_count, int)
+
+    def test_friends(self):
+        friends = self.steam.get_steam_friends("key", "id")
+        self.assertEqual(len(friends), 50)
+        username = self.steam.get_steam_username(friends[0]["steamid"], "key")
+        self.assertTrue(username.startswith("Player"))
+
+    def test_time_to_beat(self):
+        name = self.server.games[20]["name"]
+        results = FakeHowLongToBeat(self.server.url).search(name)
+        best = max(results, key=lambda element: element.similarity)
+        self.assertEqual(best.game_name, name)
+        self.assertGreater(best.main_extra, best.main_story)
+
+
+class Throttling(FakeSteamTestCase):
+    """
+    Tests that throttled requests back off and are retried.
+    """
+
+    server_kwargs = {"rate_limit": 2}
+
+    def test_throttled(self):
+        # backs off long enough for the servers one second window to clear
+        limits = {"steam_owned_games": {"rate": 1000, "base_penalty": 0.5}}
+        self.steam.rate_limiter = RateLimiter(limits)
+        for _ in range(3):
+            self.assertEqual(self.steam.get_owned_game_count("key", "id"), 50)
+        self.assertGreater(self.server.stats["throttled"], 0)
+
+
+class Errors(FakeSteamTestCase):
+    """
+    Tests that server errors are returned as failed requests.
+    """
+
+    server_kwargs = {"error_rate": 1.0}
+
+    def test_errors(self):
+        self.assertFalse(self.steam.get_owned_steam_games("key", "id"))
+        self.assertIsNone(self.steam.get_recently_played_steam_games("key", "id"))
+        self.assertEqual(self.server.stats["errors"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading, json, time
+import unittest
+
+# classes
+from classes.fetch_pool import FetchPool
+from classes.utils import Utils
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """
+    Returns the requested path as json after a short delay.
+    """
+
+    delay = 0.1
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Imap(unittest.TestCase):
+    """
+    Tests `imap` function.
+    """
+
+    def test_all_items_returned(self):
+        pool = FetchPool(max_workers=4)
+        results = dict(pool.imap(lambda num: num * 2, range(20)))
+        self.assertEqual(results, {num: num * 2 for num in range(20)})
+        self.assertEqual(pool.completed, 20)
+
+    def test_failed_fetch(self):
+        """
+        Tests that a failing fetch returns None without stopping the others.
+        """
+
+        def fetch(num):
+            if num == 3:
+                raise ValueError("Fetch Error")
+            return num
+
+        pool = FetchPool(max_workers=2)
+        results = dict(pool.imap(fetch, range(5)))
+        self.assertIsNone(results[3])
+        self.assertEqual(results[4], 4)
+        self.assertEqual(pool.failed, 1)
+
+    def test_results_on_calling_thread(self):
+        """
+        Tests that results are yielded on the calling thread.
+        """
+        pool = FetchPool(max_workers=4)
+        main_thread = threading.current_thread()
+        for _ in pool.imap(lambda num: num, range(10)):
+            self.assertIs(threading.current_thread(), main_thread)
+
+
+class LocalServer(unittest.TestCase):
+    """
+    Tests `imap` against a local HTTP server using `request_url`.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.utils = Utils()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_concurrent_requests(self):
+        app_ids = list(range(16))
+
+        def fetch(app_id):
+            return self.utils.request_url(f"{self.base_url}/app/{app_id}").json()
+
+        pool = FetchPool(max_workers=8)
+        start = time.perf_counter()
+        results = dict(pool.imap(fetch, app_ids))
+        elapsed = time.perf_counter() - start
+        self.assertEqual(results[5], {"path": "/app/5"})
+        # serial fetching would take at least 1.6 seconds
+        self.assertLess(elapsed, len(app_ids) * SlowHandler.delay / 2)
+        self.assertGreater(pool.games_per_minute, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest, time
+
+import pandas as pd
+
+# classes
+from classes.game_diff import GameDiff, GameDiffer
+
+
+class Diff(unittest.TestCase):
+    """
+    Tests `diff` function.
+    """
+
+    def setUp(self):
+        self.sheet_df = pd.DataFrame(
+            {
+                "Name": ["Hades", "Celeste", "Old Name", "Removed Game", None],
+                "Hours Played": [10.0, None, 1.5, 3.0, 2.0],
+            },
+            index=["10", "20", "30", "40", "50"],
+            dtype=object,
+        )
+        self.steam_games = [
+            {"appid": 10, "name": "Hades", "playtime_forever": 600},
+            {"appid": 20, "name": "Celeste", "playtime_forever": 0},
+            {"appid": 30, "name": "New Name", "playtime_forever": 90},
+            {"appid": 50, "name": "Blank Name", "playtime_forever": 120},
+            {"appid": 60, "name": "Added Game", "playtime_forever": 5},
+        ]
+        self.game_differ = GameDiffer("Name", "Hours Played")
+
+    def test_changes(self):
+        diff = self.game_differ.diff(self.steam_games, self.sheet_df)
+        self.assertEqual(diff.added, [60])
+        self.assertEqual(diff.removed, ["40"])
+        self.assertEqual(diff.renamed, [(30, "Old Name", "New Name")])
+        self.assertEqual(diff.played, [])
+
+    def test_played(self):
+        self.steam_games[0]["playtime_forever"] = 603
+        self.steam_games[1]["playtime_forever"] = 2
+        self.steam_games[2]["playtime_forever"] = 100
+        diff = self.game_differ.diff(self.steam_games, self.sheet_df)
+        # 603 minutes rounds to 10.1 hours and 2 minutes rounds to 0
+        self.assertEqual(diff.played, [10, 30])
+
+    def test_no_changes(self):
+        steam_games = self.steam_games[:2]
+        diff = self.game_differ.diff(steam_games, self.sheet_df.iloc[:2])
+        self.assertEqual(diff, GameDiff([], [], [], []))
+
+    def test_skipped_games(self):
+        skip_game = lambda name, app_id: app_id in (10, 60)
+        game_differ = GameDiffer("Name", "Hours Played", skip_game)
+        diff = game_differ.diff(self.steam_games, self.sheet_df)
+        self.assertEqual(diff.added, [])
+        # skipped games still on the sheet are treated as removed
+        self.assertEqual(diff.removed, ["10", "40"])
+
+    def test_no_change_speed(self):
+        total = 5000
+        steam_games = [
+            {"appid": app_id, "name": f"Game {app_id}", "playtime_forever": app_id}
+            for app_id in range(total)
+        ]
+        sheet_df = pd.DataFrame(
+            {
+                "Name": [game["name"] for game in steam_games],
+                "Hours Played": [round(app_id / 60, 1) for app_id in range(total)],
+            },
+            index=[str(app_id) for app_id in range(total)],
+            dtype=object,
+        )
+        start = time.perf_counter()
+        diff = self.game_differ.diff(steam_games, sheet_df)
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(diff, GameDiff([], [], [], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import unittest
+
+import requests
+
+# classes
+from classes.http_session import create_session
+from classes.rate_limiter import RateLimiter
+from classes.utils import Utils
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """
+    Responds with a small body over a keep-alive connection.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"payload"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ConnectionReuse(unittest.TestCase):
+    """
+    Tests `create_session` connection pooling and metrics.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+        self.utils = Utils()
+        self.utils.session = create_session(pool_size=2)
+
+    def tearDown(self):
+        self.utils.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reuses_connection(self):
+        for _ in range(5):
+            response = self.utils.request_url(self.url)
+            self.assertEqual(response.text, "payload")
+        stats = self.utils.session.metrics.get_stats()
+        self.assertEqual(stats["requests"], 5)
+        self.assertEqual(stats["connections"], 1)
+        self.assertEqual(stats["reused"], 4)
+
+    def test_timeout(self):
+        """
+        Tests that a server that never responds does not hang the request.
+        """
+        self.utils.request_timeout = (1, 0.2)
+        self.utils.rate_limiter = RateLimiter(
+            {"stalled": {"rate": 100, "base_penalty": 0.01}}
+        )
+        # never serves so the connection is accepted but nothing is sent back
+        stalled = ThreadingHTTPServer(("127.0.0.1", 0), BaseHTTPRequestHandler)
+        url = f"http://127.0.0.1:{stalled.server_port}/"
+        response = self.utils.request_url(url, api="stalled", max_retries=1)
+        stalled.server_close()
+        self.assertFalse(response)
+
+
+class RequestErrors(unittest.TestCase):
+    """
+    Tests how `request_url` retries requests that fail to connect.
+    """
+
+    def setUp(self):
+        self.utils = Utils()
+        self.utils.session = create_session()
+        self.utils.rate_limiter = RateLimiter()
+        self.utils.connection_retry_delay = 0.01
+        # nothing listens on a port freed by closing its server
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        self.url = f"http://127.0.0.1:{server.server_port}/"
+        server.server_close()
+
+    def tearDown(self):
+        self.utils.session.close()
+
+    def test_connection_error(self):
+        sent = []
+        get = self.utils.session.get
+
+        def counted_get(*args, **kwargs):
+            sent.append(1)
+            return get(*args, **kwargs)
+
+        self.utils.session.get = counted_get
+        self.assertFalse(self.utils.request_url(self.url, api="offline"))
+        self.assertEqual(len(sent), 2)
+        # the shared rate limit is not blocked by a failed connection
+        bucket = self.utils.rate_limiter.get_bucket("offline")
+        self.assertEqual(bucket.penalty, 0)
+        self.assertLess(self.utils.rate_limiter.acquire("offline"), 1)
+
+    def test_not_retried(self):
+        sent = []
+
+        def redirect_loop(*args, **kwargs):
+            sent.append(1)
+            raise requests.exceptions.TooManyRedirects
+
+        self.utils.session.get = redirect_loop
+        self.assertFalse(self.utils.request_url(self.url, api="redirects"))
+        self.assertEqual(len(sent), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import tempfile
+import datetime as dt
+import unittest
+
+# classes
+from classes.library import Library
+from testing.workbook_fixture import create_steam_sheet
+
+
+class LibraryTestCase(unittest.TestCase):
+    """
+    Creates a Steam sheet with a few games from the template workbook.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        games = [
+            {"App ID": 10, "Name": "Hades", "Play Status": "Played", "My Rating": 9},
+            {"App ID": 20, "Name": "Celeste", "Play Status": "Unplayed"},
+            {
+                "App ID": 30,
+                "Name": "Inscryption",
+                "Store Link": '=HYPERLINK("https://store.steampowered.com/app/30/","Store")',
+                "Date Added": dt.datetime(2022, 4, 22),
+            },
+        ]
+        _, self.excel, self.sheet = create_steam_sheet(self.temp_dir.name, games)
+        self.library = Library(self.sheet)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+
+class Load(LibraryTestCase):
+    """
+    Tests `load` function.
+    """
+
+    def test_keys(self):
+        self.assertEqual(self.library.keys(), ["10", "20", "30"])
+        self.assertIn(20, self.library)
+
+    def test_values_match_sheet(self):
+        for app_id in self.sheet.row_idx:
+            self.assertEqual(self.library.get_row(app_id), self.sheet.get_row(app_id))
+
+    def test_get_cell(self):
+        self.assertEqual(self.library.get_cell(10, "My Rating"), 9)
+        self.assertFalse(self.library.get_cell(20, "My Rating"))
+        link = self.library.get_cell(30, "Store Link")
+        self.assertEqual(link, "https://store.steampowered.com/app/30/")
+
+    def test_clickable_link(self):
+        """
+        Links set on the cell instead of a formula keep their target.
+        """
+        link = "https://store.steampowered.com/app/10/"
+        ws, row_idx = self.sheet.cur_sheet, self.sheet.row_idx
+        ws.cell(row=row_idx["20"], column=1).hyperlink = link
+        cell = ws.cell(row=row_idx["10"], column=self.sheet.col_idx["Store Link"])
+        cell.value, cell.hyperlink = 'Say "Store"', link
+        library = Library(self.sheet)
+        self.assertEqual(library.get_cell(10, "Store Link"), link)
+        self.assertEqual(
+            library.get_cell(10, "Store Link"), self.sheet.get_cell(10, "Store Link")
+        )
+        # a linked key cell still uses its value as the key
+        self.assertIn(20, library)
+
+    def test_missing_row(self):
+        row = self.library.get_row(99)
+        self.assertTrue(all(value is None for value in row.values()))
+
+
+class UpdateAndFlush(LibraryTestCase):
+    """
+    Tests `update_cell` and `flush` functions.
+    """
+
+    def test_dirty_until_flush(self):
+        self.assertTrue(self.library.update_cell(20, "Hours Played", 2.5))
+        self.assertEqual(self.library.get_cell(20, "Hours Played"), 2.5)
+        self.assertNotEqual(self.sheet.get_cell(20, "Hours Played"), 2.5)
+        self.assertEqual(self.library.flush(), 1)
+        self.assertEqual(self.sheet.get_cell(20, "Hours Played"), 2.5)
+        self.assertTrue(self.excel.changes_made)
+
+    def test_unchanged(self):
+        self.assertFalse(self.library.update_cell(10, "Name", "Hades"))
+        self.assertFalse(self.library.update_cell(10, "Name", "Other", replace=False))
+        self.assertEqual(self.library.dirty, {})
+
+    def test_flush_single_row(self):
+        self.library.update_cell(10, "Hours Played", 1.0)
+        self.library.update_cell(20, "Hours Played", 2.0)
+        self.assertEqual(self.library.flush(10), 1)
+        self.assertEqual(list(self.library.dirty), [("20", "Hours Played")])
+
+    def test_update_column(self):
+        updated = self.library.update_column("Hours Played", {10: 1.0, "20": 2.0})
+        self.assertEqual(updated, 2)
+
+
+class AddAndDelete(LibraryTestCase):
+    """
+    Tests `add_row` and `delete_row` functions.
+    """
+
+    def test_add_row(self):
+        self.library.add_row({"App ID": 40, "Name": "Hollow Knight", "Notes": ""})
+        self.assertEqual(self.library.get_cell(40, "Name"), "Hollow Knight")
+        self.assertIsNone(self.library.get_cell(40, "Notes"))
+        self.assertEqual(self.sheet.get_cell(40, "Name"), "Hollow Knight")
+
+    def test_delete_row(self):
+        self.library.update_cell(20, "Hours Played", 2.0)
+        self.library.delete_row(20)
+        self.assertNotIn(20, self.library)
+        self.assertNotIn("20", self.sheet.row_idx)
+        self.assertEqual(self.library.dirty, {})
+
+
+class RenameKey(LibraryTestCase):
+    """
+    Tests `rename_key` function.
+    """
+
+    def test_rename_key(self):
+        self.library.update_cell(20, "Hours Played", 2.0)
+        self.assertTrue(self.library.rename_key(20, 25))
+        self.assertEqual(self.library.keys(), ["10", "25", "30"])
+        self.assertEqual(self.library.get_cell(25, "Name"), "Celeste")
+        self.assertEqual(self.library.get_cell(25, "App ID"), 25)
+        self.assertEqual(self.sheet.get_cell(25, "Name"), "Celeste")
+        self.assertNotIn("20", self.sheet.row_idx)
+        self.assertEqual(list(self.library.dirty), [("25", "Hours Played")])
+        self.library.flush()
+        self.assertEqual(self.sheet.get_cell(25, "Hours Played"), 2.0)
+
+    def test_existing_key(self):
+        self.assertFalse(self.library.rename_key(20, 10))
+        self.assertFalse(self.library.rename_key(99, 40))
+        self.assertEqual(self.library.keys(), ["10", "20", "30"])
+
+
+class Version(LibraryTestCase):
+    """
+    Tests `version` going up with each change.
+    """
+
+    def test_changes(self):
+        version = self.library.version
+        self.library.update_cell(10, "Name", "Hades")
+        self.assertEqual(self.library.version, version)
+        changes = [
+            lambda: self.library.update_cell(10, "Name", "Hades II"),
+            lambda: self.library.add_row({"App ID": 40, "Name": "Hollow Knight"}),
+            lambda: self.library.rename_key(40, 45),
+            lambda: self.library.delete_row(45),
+        ]
+        for change in changes:
+            change()
+            self.assertGreater(self.library.version, version)
+            version = self.library.version
+        # flushing does not change the rows
+        self.library.flush()
+        self.assertEqual(self.library.version, version)
+
+
+if __name__ == "__main__":
+    unittest.main()
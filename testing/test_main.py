@@ -450,6 +450,42 @@ class PlayStatus(unittest.TestCase):
             self.assertEqual(result, test["ans"])
 
 
+class SyncRecentSteamGames(unittest.TestCase):
+    """
+    Tests `sync_recent_steam_games` function.
+    """
+
+    def setUp(self):
+        self.t = Tracker(save=False)
+        self.t.config_data["steam_owned_count"] = 2
+        # only the app ID membership check is needed
+        self.t.library = [10, 20]
+        self.recent_games = [{"appid": 10, "name": "Hades", "playtime_forever": 60}]
+
+    @patch.object(Tracker, "game_check")
+    @patch.object(Tracker, "get_recently_played_steam_games")
+    @patch.object(Tracker, "get_owned_game_count", return_value=2)
+    def test_recent_only(self, _, mock_recent, mock_game_check):
+        mock_recent.return_value = self.recent_games
+        self.assertTrue(self.t.sync_recent_steam_games("key", "id"))
+        mock_game_check.assert_called_once_with(self.recent_games, full_sync=False)
+
+    @patch.object(Tracker, "game_check")
+    @patch.object(Tracker, "get_owned_game_count", return_value=3)
+    def test_owned_count_changed(self, _, mock_game_check):
+        self.assertFalse(self.t.sync_recent_steam_games("key", "id"))
+        mock_game_check.assert_not_called()
+
+    @patch.object(Tracker, "game_check")
+    @patch.object(Tracker, "get_recently_played_steam_games")
+    @patch.object(Tracker, "get_owned_game_count", return_value=2)
+    def test_new_game(self, _, mock_recent, mock_game_check):
+        new_game = {"appid": 30, "name": "Celeste", "playtime_forever": 60}
+        mock_recent.return_value = self.recent_games + [new_game]
+        self.assertFalse(self.t.sync_recent_steam_games("key", "id"))
+        mock_game_check.assert_not_called()
+
+
 @patch("builtins.print")
 class ShowErrors(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import tempfile, json, io
+from contextlib import redirect_stdout
+import unittest
+
+# classes
+from classes.metrics import Metrics, metrics
+from classes.utils import benchmark
+
+
+class Spans(unittest.TestCase):
+    """
+    Tests `span` and `timed` functions.
+    """
+
+    def setUp(self):
+        self.metrics = Metrics()
+
+    def test_nested(self):
+        for _ in range(2):
+            with self.metrics.span("sync"):
+                with self.metrics.span("request"):
+                    pass
+        spans = self.metrics.get_summary()["spans"]
+        self.assertEqual(list(spans), ["sync", "sync > request"])
+        self.assertEqual(spans["sync > request"]["count"], 2)
+        self.assertGreaterEqual(
+            spans["sync"]["seconds"], spans["sync > request"]["seconds"]
+        )
+
+    def test_exception(self):
+        with self.assertRaises(ValueError):
+            with self.metrics.span("fails"):
+                raise ValueError
+        with self.metrics.span("after"):
+            pass
+        self.assertEqual(list(self.metrics.get_summary()["spans"]), ["after", "fails"])
+
+    def test_timed(self):
+        @self.metrics.timed()
+        def parse(value):
+            return value * 2
+
+        self.assertEqual(parse(2), 4)
+        self.assertEqual(parse.__name__, "parse")
+        self.assertEqual(self.metrics.get_summary()["spans"]["parse"]["count"], 1)
+
+    def test_threads(self):
+        def work(_):
+            with self.metrics.span("worker"):
+                self.metrics.count("requests")
+
+        # worker threads do not nest under the span open on this thread
+        with self.metrics.span("pool"):
+            with ThreadPoolExecutor(4) as executor:
+                list(executor.map(work, range(100)))
+        summary = self.metrics.get_summary()
+        self.assertEqual(summary["spans"]["worker"]["count"], 100)
+        self.assertEqual(summary["counters"]["requests"], 100)
+
+    def test_benchmark(self):
+        @benchmark
+        def slow_function():
+            return True
+
+        with redirect_stdout(io.StringIO()):
+            self.assertTrue(slow_function())
+        self.assertIn("slow_function", metrics.get_summary()["spans"])
+
+
+class Summary(unittest.TestCase):
+    """
+    Tests `count` and `save` functions.
+    """
+
+    def test_save(self):
+        registry = Metrics()
+        registry.count("sleep_seconds", 0.5)
+        registry.count("sleep_seconds", 0.25)
+        registry.count("response_bytes", 100)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "logs" / "metrics.json"
+            summary = registry.save(path)
+            self.assertEqual(json.loads(path.read_text()), summary)
+        self.assertEqual(
+            summary["counters"], {"response_bytes": 100, "sleep_seconds": 0.75}
+        )
+        registry.reset()
+        self.assertEqual(registry.get_summary()["counters"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+from pathlib import Path
+import tempfile, time
+import unittest
+
+# classes
+from classes.player_counts import PlayerCountRefresher
+
+
+class PlayerCountTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.state_path = Path(self.temp_dir.name) / "player_counts.json"
+        self.fetched = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def fetch_count(self, app_id):
+        self.fetched.append(app_id)
+        return app_id * 10
+
+    def create_refresher(self):
+        return PlayerCountRefresher(self.fetch_count, self.state_path, max_workers=4)
+
+
+class Refresh(PlayerCountTestCase):
+    """
+    Tests `refresh` function.
+    """
+
+    def test_counts(self):
+        refresher = self.create_refresher()
+        counts = dict(refresher.refresh([1, 2, 3]))
+        self.assertEqual(counts, {1: 10, 2: 20, 3: 30})
+
+    def test_failed_count_not_marked(self):
+        refresher = PlayerCountRefresher(lambda app_id: None, self.state_path)
+        list(refresher.refresh([1]))
+        self.assertEqual(refresher.get_stale([1]), [1])
+
+
+class GetStale(PlayerCountTestCase):
+    """
+    Tests `get_stale` function.
+    """
+
+    def test_skips_recent(self):
+        refresher = self.create_refresher()
+        list(refresher.refresh([1, 2]))
+        refresher.save()
+        # new refresher to be sure the refresh times were saved
+        refresher = self.create_refresher()
+        self.assertEqual(refresher.get_stale([1, 2, 3]), [3])
+
+    def test_old_refresh(self):
+        refresher = self.create_refresher()
+        refresher.refreshed = {"1": time.time() - 60 * 60}
+        self.assertEqual(refresher.get_stale(["1"]), ["1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
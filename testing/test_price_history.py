@@ -0,0 +1,114 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+import numpy as np
+
+# classes
+from classes.price_history import PriceHistory
+
+
+class PriceHistoryTestCase(unittest.TestCase):
+    """
+    Records three daily price checks of three games.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "price_history.bin"
+        self.history = PriceHistory(self.path)
+        day = 24 * 60 * 60
+        # game 10 keeps dropping, 20 went back up and 30 never changes
+        self.history.append([10, 20, 30], [2000, 1500, 999], [0, 50, 0], day)
+        self.history.append([10, 20, 30], [1500, 3000, 999], [25, 0, 0], 2 * day)
+        self.history.append([10, 20, 30], [1000, 3000, 999], [50, 0, 0], 3 * day)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+
+class Append(PriceHistoryTestCase):
+    """
+    Tests `append`, `record` and `read` functions.
+    """
+
+    def test_record_size(self):
+        self.assertEqual(self.path.stat().st_size, 9 * 13)
+        records = PriceHistory(self.path).read()
+        self.assertEqual(list(records["app_id"][:3]), [10, 20, 30])
+        self.assertEqual(records["price"][-3], 1000)
+
+    def test_partial_record(self):
+        # the end of a write that was cut off is skipped
+        with open(self.path, "ab") as file:
+            file.write(b"\x01\x02\x03")
+        self.assertEqual(len(self.history.read()), 9)
+
+    def test_record(self):
+        prices = {
+            "10": {"price_overview": {"final": 800, "discount_percent": 60}},
+            "20": {"price_overview": {"final": 3000}},
+            # an old response from the cache is not a new observation
+            "30": {"price_overview": {"final": 499}, "from_cache": True},
+        }
+        self.assertEqual(self.history.record(prices, 4 * 24 * 60 * 60), 2)
+        summary = self.history.summary()
+        self.assertEqual(summary.loc[10, "discount"], 60)
+        self.assertEqual(summary.loc[20, "discount"], 0)
+        self.assertEqual(summary.loc[30, "observations"], 3)
+        self.assertEqual(self.history.record({"30": prices["30"]}), 0)
+
+    def test_missing_file(self):
+        history = PriceHistory(Path(self.temp_dir.name) / "missing.bin")
+        self.assertTrue(history.summary().empty)
+        self.assertIsNone(history.historical_low(10))
+        self.assertTrue(history.at_all_time_low().empty)
+
+
+class Queries(PriceHistoryTestCase):
+    """
+    Tests `summary`, `historical_low` and `at_all_time_low` functions.
+    """
+
+    def test_summary(self):
+        summary = self.history.summary()
+        self.assertEqual(summary.loc[10, "price"], 1000)
+        self.assertEqual(summary.loc[10, "discount"], 50)
+        self.assertEqual(summary.loc[20, "average"], 2500)
+        self.assertAlmostEqual(summary.loc[10, "below_average"], 1 / 3)
+        self.assertEqual(summary.loc[30, "observations"], 3)
+
+    def test_historical_low(self):
+        self.assertEqual(self.history.historical_low(10), 1000)
+        self.assertEqual(self.history.historical_low("20"), 1500)
+        self.assertIsNone(self.history.historical_low(40))
+
+    def test_at_all_time_low(self):
+        self.assertEqual(list(self.history.at_all_time_low().index), [10])
+        self.assertTrue(self.history.at_all_time_low(["20", "30"]).empty)
+        # a new low is picked up without a new PriceHistory
+        self.history.append([20], [1200], [60])
+        self.assertEqual(list(self.history.at_all_time_low().index), [20, 10])
+
+    def test_out_of_order(self):
+        self.history.append([10], [500], [75], timestamp=0)
+        summary = self.history.summary()
+        self.assertEqual(summary.loc[10, "price"], 1000)
+        self.assertEqual(summary.loc[10, "low"], 500)
+
+    def test_large_history(self):
+        rng = np.random.default_rng(1)
+        history = PriceHistory(Path(self.temp_dir.name) / "large.bin")
+        app_ids = np.arange(1_000) * 10
+        for day in range(100):
+            prices = rng.integers(500, 6000, len(app_ids))
+            history.append(app_ids, prices, np.zeros(len(app_ids)), day)
+        records = history.read()
+        summary = history.summary()
+        self.assertEqual(len(summary), 1_000)
+        self.assertEqual(summary.loc[10, "low"], records["price"][1::1_000].min())
+        self.assertEqual(summary.loc[10, "price"], records["price"][-999])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor
+import threading, time
+import unittest
+
+# classes
+from classes.rate_limiter import TokenBucket, RateLimiter
+from classes.utils import Utils
+
+
+class Acquire(unittest.TestCase):
+    """
+    Tests `acquire` function.
+    """
+
+    def test_burst(self):
+        """
+        Tests that calls within the burst size do not wait.
+        """
+        bucket = TokenBucket(rate=5, per=1)
+        waits = [bucket.acquire() for _ in range(5)]
+        self.assertEqual(max(waits), 0)
+
+    def test_waits_for_refill(self):
+        bucket = TokenBucket(rate=20, per=1, burst=1)
+        start = time.perf_counter()
+        for _ in range(5):
+            bucket.acquire()
+        elapsed = time.perf_counter() - start
+        # 4 refills at 20 per second
+        self.assertGreaterEqual(elapsed, 0.19)
+        self.assertLess(elapsed, 0.5)
+
+    def test_thread_safe(self):
+        """
+        Tests that threads sharing a bucket never go over the limit.
+        """
+        bucket = TokenBucket(rate=50, per=1, burst=1)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: bucket.acquire(), range(11)))
+        elapsed = time.perf_counter() - start
+        self.assertGreaterEqual(elapsed, 0.19)
+
+
+class Backoff(unittest.TestCase):
+    """
+    Tests `backoff` and `reset_backoff` functions.
+    """
+
+    def test_exponential(self):
+        bucket = TokenBucket(rate=5, base_penalty=1, max_penalty=3)
+        self.assertEqual(bucket.backoff(), 1)
+        self.assertEqual(bucket.backoff(), 2)
+        self.assertEqual(bucket.backoff(), 3)
+        bucket.reset_backoff()
+        self.assertEqual(bucket.backoff(), 1)
+
+    def test_blocks_acquire(self):
+        bucket = TokenBucket(rate=100, base_penalty=0.4)
+        bucket.backoff()
+        self.assertGreater(bucket.acquire(), 0.15)
+
+
+class Limits(unittest.TestCase):
+    """
+    Tests `RateLimiter` limit setup.
+    """
+
+    def test_config_override(self):
+        limiter = RateLimiter({"steam_app_details": {"rate": 100}})
+        bucket = limiter.get_bucket("steam_app_details")
+        self.assertEqual(bucket.fill_rate, 100 / 300)
+        self.assertEqual(bucket.capacity, 10)
+
+    def test_new_api(self):
+        limiter = RateLimiter({"new_api": {"per": 10}})
+        self.assertEqual(limiter.get_bucket("new_api").fill_rate, 2 / 10)
+
+    def test_shared_bucket(self):
+        limiter = RateLimiter()
+        self.assertIs(limiter.get_bucket("unknown"), limiter.get_bucket("unknown"))
+
+
+class ThrottledHandler(BaseHTTPRequestHandler):
+    """
+    Responds with too many requests until `throttled` runs out.
+    """
+
+    throttled = 0
+
+    def do_GET(self):
+        if ThrottledHandler.throttled:
+            ThrottledHandler.throttled -= 1
+            self.send_response(429)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RequestUrlBackoff(unittest.TestCase):
+    """
+    Tests `request_url` backing off on too many requests responses.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottledHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+        self.utils = Utils()
+        self.utils.rate_limiter = RateLimiter(
+            {"local": {"rate": 100, "base_penalty": 0.05}}
+        )
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_retries(self):
+        ThrottledHandler.throttled = 2
+        response = self.utils.request_url(self.url, api="local")
+        self.assertEqual(response.text, "ok")
+
+    def test_gives_up(self):
+        ThrottledHandler.throttled = 5
+        response = self.utils.request_url(self.url, api="local", max_retries=2)
+        self.assertFalse(response)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest, random
+
+import numpy as np
+import pandas as pd
+
+# classes
+from classes.recommender import Recommender
+from classes.tag_matrix import TagMatrix
+
+
+class RecommenderTestCase(unittest.TestCase):
+    """
+    Creates a small library with user tags and genres.
+    """
+
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "User Tags": [
+                    "Roguelike, Action, Deckbuilder",
+                    "Roguelike, Deckbuilder, Strategy",
+                    "Farming Sim, Cozy",
+                    "Cozy, Farming Sim, Indie",
+                    "Action, Shooter",
+                    np.nan,
+                ],
+                "Genre": ["Indie", "Indie", "Simulation", "-", "Action", "Indie"],
+            },
+            index=["10", "20", "30", "40", "50", "60"],
+        )
+        self.recommender = Recommender(
+            {
+                "User Tags": TagMatrix.from_series(self.df["User Tags"]),
+                "Genre": TagMatrix.from_series(self.df["Genre"]),
+            },
+            {"Genre": 0.5},
+        )
+
+
+class Similarity(RecommenderTestCase):
+    """
+    Tests `similarity` function.
+    """
+
+    def test_matches_dense(self):
+        dense = self.recommender.vectors(self.recommender.keys)
+        expected = dense.T @ dense
+        for block_size in [1, 20, 40, 100, 10_000]:
+            self.recommender.block_size = block_size
+            scores = self.recommender.similarity(self.recommender.keys)
+            np.testing.assert_allclose(scores, expected, atol=1e-6)
+        # vectors are normalized so a game is a perfect match with itself
+        np.testing.assert_allclose(np.diag(expected)[:5], 1, atol=1e-6)
+
+    def test_ignored_labels(self):
+        labels = self.recommender.labels
+        self.assertIn("Genre: Indie", labels)
+        self.assertNotIn("Genre: -", labels[np.unique(self.recommender.indices)])
+
+    def test_large_library(self):
+        rng = random.Random(1)
+        tags = [f"Tag {number}" for number in range(500)]
+        series = pd.Series(
+            [", ".join(rng.sample(tags, rng.randint(0, 10))) for _ in range(1_000)]
+        )
+        recommender = Recommender({"User Tags": TagMatrix.from_series(series)})
+        recommender.block_size = 1_000
+        keys = recommender.keys[::50]
+        dense = recommender.vectors(recommender.keys)
+        expected = dense.T @ recommender.vectors(keys)
+        scores = recommender.similarity(keys)
+        np.testing.assert_allclose(scores, expected, atol=1e-5)
+
+
+class Recommend(RecommenderTestCase):
+    """
+    Tests `recommend` function.
+    """
+
+    def test_recommend(self):
+        liked = pd.Series({"10": 10, "30": 5})
+        recommendations = self.recommender.recommend(liked, self.df.index, limit=2)
+        # liked games are left out and the rating scales the score
+        self.assertEqual(list(recommendations.index), ["20", "40"])
+        self.assertEqual(list(recommendations["similar_to"]), ["10", "30"])
+        self.assertLess(recommendations["score"].iloc[1], 0.5)
+
+    def test_no_match(self):
+        liked = pd.Series({"10": 9})
+        recommendations = self.recommender.recommend(liked, ["30", "40", "99"])
+        self.assertTrue(recommendations.empty)
+        self.assertTrue(self.recommender.recommend(liked[:0], self.df.index).empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
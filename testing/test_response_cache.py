@@ -0,0 +1,125 @@
+from pathlib import Path
+import tempfile, time, os
+import unittest
+import requests
+
+# classes
+from classes.response_cache import ResponseCache
+
+
+def create_response(url, content=b'{"success": true}'):
+    """
+    Creates a successful response for `url` without making a request.
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = content
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+class CacheTestCase(unittest.TestCase):
+    app_details_url = "https://store.steampowered.com/api/appdetails"
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "response_cache.db"
+        self.cache = ResponseCache(self.db_path)
+
+    def tearDown(self):
+        self.cache.conn.close()
+        self.temp_dir.cleanup()
+
+
+class GetTtl(CacheTestCase):
+    """
+    Tests `get_ttl` function.
+    """
+
+    def test_endpoints(self):
+        self.assertEqual(self.cache.get_ttl(self.app_details_url), 3600)
+        player_count = "http://api.steampowered.com/ISteamUserStats/GetNumberOfCurrentPlayers/v1/"
+        self.assertEqual(self.cache.get_ttl(player_count), 300)
+
+    def test_not_cached(self):
+        owned_games = "http://api.steampowered.com/IPlayerService/GetOwnedGames/v0001/"
+        self.assertEqual(self.cache.get_ttl(owned_games), 0)
+        # `AppList` stores the app list itself
+        app_list = "https://api.steampowered.com/ISteamApps/GetAppList/v0002/"
+        self.assertEqual(self.cache.get_ttl(app_list), 0)
+
+
+class GetAndSet(CacheTestCase):
+    """
+    Tests `get` and `set` functions.
+    """
+
+    def test_hit(self):
+        params = {"appids": 752590, "l": "english"}
+        response = create_response(self.app_details_url)
+        self.assertTrue(self.cache.set(self.app_details_url, params, response))
+        cached = self.cache.get(self.app_details_url, params)
+        self.assertEqual(cached.json(), {"success": True})
+        self.assertEqual(cached.url, self.app_details_url)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_params_are_part_of_key(self):
+        response = create_response(self.app_details_url)
+        self.cache.set(self.app_details_url, {"appids": 1}, response)
+        self.assertIsNone(self.cache.get(self.app_details_url, {"appids": 2}))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_persists(self):
+        response = create_response(self.app_details_url)
+        self.cache.set(self.app_details_url, None, response)
+        self.cache.conn.close()
+        self.cache = ResponseCache(self.db_path)
+        self.assertIsNotNone(self.cache.get(self.app_details_url))
+
+    def test_expired(self):
+        self.cache.endpoint_ttls = {"appdetails": -1}
+        response = create_response(self.app_details_url)
+        self.cache.set(self.app_details_url, None, response)
+        self.assertIsNone(self.cache.get(self.app_details_url))
+
+    def test_uncached_endpoint(self):
+        url = "http://api.steampowered.com/IPlayerService/GetOwnedGames/v0001/"
+        self.assertFalse(self.cache.set(url, None, create_response(url)))
+        self.assertIsNone(self.cache.get(url))
+
+
+class Evict(CacheTestCase):
+    """
+    Tests `evict` function.
+    """
+
+    def test_least_recently_used(self):
+        self.cache.max_size = 2500
+        for app_id in range(3):
+            content = os.urandom(1024)
+            response = create_response(self.app_details_url, content)
+            self.cache.set(self.app_details_url, {"appids": app_id}, response)
+            time.sleep(0.01)
+        self.assertIsNone(self.cache.get(self.app_details_url, {"appids": 0}))
+        self.assertIsNotNone(self.cache.get(self.app_details_url, {"appids": 2}))
+        self.assertLessEqual(self.cache.get_stats()["entries"], 2)
+
+    def test_running_total(self):
+        for app_id in [1, 2, 1]:
+            content = os.urandom(100 * app_id)
+            response = create_response(self.app_details_url, content)
+            self.cache.set(self.app_details_url, {"appids": app_id}, response)
+        total = self.cache.conn.execute("SELECT SUM(size) FROM responses").fetchone()
+        self.assertEqual(self.cache.total_size, total[0])
+        # the total carries over to the next run
+        self.cache.conn.close()
+        self.cache = ResponseCache(self.db_path)
+        self.assertEqual(self.cache.total_size, total[0])
+        self.cache.clear()
+        self.assertEqual(self.cache.total_size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
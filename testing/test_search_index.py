@@ -0,0 +1,88 @@
+from difflib import SequenceMatcher
+import unittest
+
+# classes
+from classes.search_index import SearchIndex
+
+
+class SearchIndexTestCase(unittest.TestCase):
+    """
+    Creates an index of a few game names.
+    """
+
+    games = {
+        "10": "Hades",
+        "20": "Hades II",
+        "30": "Celeste",
+        "40": "Deep Rock Galactic",
+        "50": "Dishonored 2",
+        "60": "Dishonored",
+        "70": None,
+    }
+
+    def setUp(self):
+        self.index = SearchIndex(self.games)
+
+
+class Search(SearchIndexTestCase):
+    """
+    Tests `search` function.
+    """
+
+    def test_ranked(self):
+        keys = [key for key, _ in self.index.search("dishonored")]
+        self.assertEqual(keys, ["60", "50"])
+
+    def test_limit(self):
+        self.assertEqual(len(self.index.search("hades", limit=1)), 1)
+
+    def test_typo(self):
+        self.assertEqual(self.index.search("Deep Rok Galactik")[0][0], "40")
+
+    def test_matches_linear_scan(self):
+        """
+        Tests that the same games are found as scoring every name.
+        """
+        for query in ["hades", "celest", "Dishonored 2", "deep rock", "zzz"]:
+            with self.subTest(query=query):
+                expected = {
+                    key
+                    for key, name in self.games.items()
+                    if name
+                    and SequenceMatcher(None, query.lower(), name.lower()).ratio()
+                    >= 0.6
+                }
+                found = {key for key, _ in self.index.search(query)}
+                self.assertEqual(found, expected)
+
+    def test_empty_query(self):
+        self.assertEqual(self.index.search("  "), [])
+
+
+class Changes(SearchIndexTestCase):
+    """
+    Tests `add`, `remove` and `find_exact` functions.
+    """
+
+    def test_find_exact(self):
+        self.assertEqual(self.index.find_exact("hades ii"), ["20"])
+        self.assertEqual(self.index.find_exact("hades 2"), [])
+
+    def test_rename(self):
+        self.index.add(30, "Celeste Classic")
+        self.assertEqual(self.index.find_exact("celeste"), [])
+        self.assertEqual(self.index.find_exact("Celeste Classic"), ["30"])
+        self.assertEqual(len(self.index), 6)
+
+    def test_remove(self):
+        self.assertTrue(self.index.remove(10))
+        self.assertFalse(self.index.remove(10))
+        self.assertNotIn("10", [key for key, _ in self.index.search("hades")])
+        # trigrams only used by the removed name are dropped
+        index = SearchIndex({"1": "Celeste"})
+        index.remove(1)
+        self.assertEqual(index.postings, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,5 @@
+from pathlib import Path
+import tempfile, json, os
 import unittest
 
 # classes
@@ -78,6 +80,55 @@ class SkipGame(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.game_skipper.skip_game()
 
+    def test_keyword_case(self):
+        """
+        Keywords match no matter the case of the keyword or name.
+        """
+        self.assertTrue(self.game_skipper.skip_game(game_name="Game Open Beta"))
+        self.assertFalse(self.game_skipper.skip_game(game_name="Demolition"))
+
+    def test_decisions_reset(self):
+        """
+        Remembered decisions are dropped when the ignore lists change.
+        """
+        self.assertFalse(self.game_skipper.skip_game(game_name="Hades", app_id=10))
+        self.game_skipper.app_id_ignore_list = [10]
+        self.assertTrue(self.game_skipper.skip_game(game_name="Hades", app_id=10))
+        self.game_skipper.name_ignore_list = ["hades"]
+        self.assertTrue(self.game_skipper.skip_game(game_name="Hades"))
+
+
+class Refresh(unittest.TestCase):
+    """
+    Tests `refresh` function.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.ignore_path = Path(self.temp_dir.name) / "ignore.json"
+        self.write_ignore_file(["Hades"], [], mtime=1000)
+        self.game_skipper = GameSkipper(["Hades"], [], self.ignore_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_ignore_file(self, names, app_ids, mtime):
+        data = {"name_ignore_list": names, "app_id_ignore_list": app_ids}
+        self.ignore_path.write_text(json.dumps(data))
+        os.utime(self.ignore_path, (mtime, mtime))
+
+    def test_unchanged(self):
+        self.assertFalse(self.game_skipper.refresh())
+
+    def test_reloads_changes(self):
+        self.assertFalse(self.game_skipper.skip_game(game_name="Celeste"))
+        self.write_ignore_file(["Celeste"], [20], mtime=2000)
+        self.assertTrue(self.game_skipper.refresh())
+        self.assertTrue(self.game_skipper.skip_game(game_name="Celeste"))
+        self.assertTrue(self.game_skipper.skip_game(app_id=20))
+        self.assertFalse(self.game_skipper.skip_game(game_name="Hades"))
+        self.assertTrue(self.game_skipper.skip_game(game_name="Spotify"))
+
 
 if __name__ == "__main__":
     unittest.main()
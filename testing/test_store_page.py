@@ -0,0 +1,82 @@
+from pathlib import Path
+import unittest
+
+from bs4 import BeautifulSoup
+
+# classes
+from classes.store_page import StorePage, StorePageParser
+
+
+def bs4_tags(html):
+    """
+    User tags found the way the BeautifulSoup scraper found them.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    tags = [tag.text.strip() for tag in soup.find_all(class_="app_tag")]
+    return [tag for tag in tags if tag != "+"]
+
+
+def bs4_review_text(html):
+    """
+    Review description the BeautifulSoup scraper used.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    results = soup.find_all(class_="nonresponsive_hidden responsive_reviewdesc")
+    return results[min(len(results), 2) - 1].text.strip()
+
+
+class Parse(unittest.TestCase):
+    """
+    Tests `parse` function.
+    """
+
+    fixture = Path("testing/data/store_page.html")
+
+    def setUp(self):
+        self.parser = StorePageParser()
+        self.html = self.fixture.read_text(encoding="utf-8")
+
+    def test_store_page(self):
+        page = self.parser.parse(self.html)
+        self.assertIsInstance(page, StorePage)
+        self.assertEqual(page.review_percent, 0.97)
+        self.assertEqual(page.review_total, 188210)
+        self.assertEqual(page.review_summary, "Overwhelmingly Positive")
+        self.assertEqual(page.recent_review_percent, 0.96)
+
+    def test_matches_bs4(self):
+        page = self.parser.parse(self.html)
+        self.assertEqual(page.tags, bs4_tags(self.html))
+        self.assertIn("Rock & Roll", page.tags)
+        text = bs4_review_text(self.html)
+        self.assertEqual(
+            self.parser.parse_review_desc(text),
+            (page.review_percent, page.review_total),
+        )
+
+    def test_few_reviews(self):
+        html = (
+            '<span class="nonresponsive_hidden responsive_reviewdesc">'
+            "- Need more user reviews to generate a score</span>"
+        )
+        page = self.parser.parse(html)
+        self.assertEqual(page.review_percent, "Few Reviews")
+        self.assertEqual(page.review_total, "Few Reviews")
+
+    def test_perfect_score(self):
+        html = (
+            '<span class="nonresponsive_hidden responsive_reviewdesc">'
+            "- 100% of the 12 user reviews for this game are positive.</span>"
+        )
+        page = self.parser.parse(html)
+        self.assertEqual(page.review_percent, 1)
+        self.assertEqual(page.review_total, 12)
+
+    def test_no_reviews(self):
+        for html in ["", None, "<html><body>Not a store page</body></html>"]:
+            with self.subTest(html=html):
+                self.assertEqual(self.parser.parse(html), StorePage())
+
+
+if __name__ == "__main__":
+    unittest.main()
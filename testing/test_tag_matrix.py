@@ -0,0 +1,124 @@
+import unittest, random, time
+
+import numpy as np
+import pandas as pd
+
+# classes
+from classes.tag_matrix import TagMatrix
+
+
+class TagMatrixTestCase(unittest.TestCase):
+    """
+    Creates a small library with user tags, genres and ratings.
+    """
+
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "User Tags": [
+                    "Roguelike, Action, Indie",
+                    "Hack and Slash, Action",
+                    np.nan,
+                    "Indie ,  Puzzle,Indie",
+                    "Action",
+                ],
+                "Genre": ["Action, Indie", "Action and RPG", "-", "", "Action"],
+                "My Rating": [9, 7, 5, "-", np.nan],
+                "Hours Played": [10.0, 2.5, np.nan, 1.0, 4.0],
+            },
+            index=["10", "20", "30", "40", "50"],
+            dtype=object,
+        )
+        self.tags = TagMatrix.from_series(self.df["User Tags"])
+
+
+class FromSeries(TagMatrixTestCase):
+    """
+    Tests `from_series` function.
+    """
+
+    def test_labels(self):
+        self.assertEqual(
+            list(self.tags.labels),
+            ["Roguelike", "Action", "Indie", "Hack and Slash", "Puzzle"],
+        )
+        self.assertEqual(self.tags.shape, (5, 5))
+        # the duplicate Indie tag is only counted once
+        self.assertEqual(list(np.diff(self.tags.indptr)), [3, 2, 0, 2, 1])
+
+    def test_split_and(self):
+        genres = TagMatrix.from_series(self.df["Genre"], split_and=True)
+        self.assertEqual(list(genres.labels), ["Action", "Indie", "RPG", "-"])
+        self.assertEqual(list(genres.games_with("RPG")), ["20"])
+
+
+class Analytics(TagMatrixTestCase):
+    """
+    Tests `counts`, `aggregate`, `related` and `co_occurrence` functions.
+    """
+
+    def test_counts(self):
+        counts = self.tags.counts()
+        self.assertEqual(counts.to_dict()["Action"], 3)
+        self.assertEqual(counts.index[0], "Action")
+
+    def test_aggregate(self):
+        ratings = self.tags.aggregate(self.df["My Rating"])
+        # games without a number are left out
+        self.assertEqual(ratings.loc["Action", "count"], 2)
+        self.assertEqual(ratings.loc["Action", "mean"], 8)
+        self.assertTrue(np.isnan(ratings.loc["Puzzle", "mean"]))
+        hours = self.tags.aggregate(self.df["Hours Played"])["sum"]
+        self.assertEqual(hours["Action"], 16.5)
+
+    def test_aggregate_alignment(self):
+        ratings = self.tags.aggregate(self.df["My Rating"].iloc[::-1])
+        self.assertEqual(ratings.loc["Roguelike", "mean"], 9)
+
+    def test_related(self):
+        related = self.tags.related("Action")
+        self.assertEqual(
+            related.to_dict(), {"Roguelike": 1, "Indie": 1, "Hack and Slash": 1}
+        )
+        self.assertTrue(self.tags.related("Missing").empty)
+
+    def test_co_occurrence(self):
+        self.tags.chunk_size = 2
+        matrix = self.tags.co_occurrence(top_n=2)
+        self.assertEqual(list(matrix.index), ["Action", "Indie"])
+        self.assertEqual(matrix.loc["Action", "Action"], 3)
+        self.assertEqual(matrix.loc["Action", "Indie"], 1)
+        self.assertEqual(matrix.loc["Indie", "Indie"], 2)
+
+
+class MatchesExplode(unittest.TestCase):
+    """
+    Tests that the rating averages match exploding the DataFrame.
+    """
+
+    def test_large_library(self):
+        rng = random.Random(1)
+        tags = [f"Tag {number}" for number in range(3_000)]
+        df = pd.DataFrame(
+            {
+                "User Tags": [
+                    ", ".join(dict.fromkeys(rng.choices(tags, k=rng.randint(1, 20))))
+                    for _ in range(10_000)
+                ],
+                "My Rating": [rng.choice([np.nan, 1, 5, 10]) for _ in range(10_000)],
+            }
+        )
+        start = time.perf_counter()
+        tag_matrix = TagMatrix.from_series(df["User Tags"])
+        ratings = tag_matrix.aggregate(df["My Rating"])
+        self.assertLess(time.perf_counter() - start, 1)
+        exploded = df.assign(Tag=df["User Tags"].str.split(", ")).explode("Tag")
+        expected = exploded.groupby("Tag")["My Rating"].mean()
+        ratings = ratings["mean"][ratings["count"] > 0]
+        pd.testing.assert_series_equal(
+            ratings.sort_index(), expected.dropna().sort_index(), check_names=False
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from pathlib import Path
+import tempfile, time
+import unittest
+
+# classes
+from classes.time_to_beat_cache import TimeToBeatCache
+
+
+class TimeToBeatCacheTestCase(unittest.TestCase):
+    """
+    Creates an empty time to beat cache in a temp folder.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "time_to_beat.db"
+        self.cache = TimeToBeatCache(self.db_path)
+
+    def tearDown(self):
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+
+class Normalize(TimeToBeatCacheTestCase):
+    """
+    Tests `normalize` function.
+    """
+
+    def test_normalize(self):
+        tests = {
+            "Marvel’s Spider-Man": "marvels spider man",
+            "Marvel's Spider-Man": "marvels spider man",
+            "HADES": "hades",
+            "  Portal:   2 ": "portal 2",
+        }
+        for name, answer in tests.items():
+            with self.subTest(name=name):
+                self.assertEqual(self.cache.normalize(name), answer)
+
+
+class GetAndSet(TimeToBeatCacheTestCase):
+    """
+    Tests `get` and `set` functions.
+    """
+
+    def test_miss(self):
+        self.assertIsNone(self.cache.get("Hades"))
+        self.assertEqual(self.cache.get_stats()["misses"], 1)
+
+    def test_found(self):
+        self.cache.set("Hades", 22.5, app_id=1145360)
+        self.assertEqual(self.cache.get("HADES"), 22.5)
+        self.assertEqual(self.cache.get_stats()["hits"], 1)
+
+    def test_app_id_reuse(self):
+        self.cache.set("Hades", 22.5, app_id=1145360)
+        self.assertEqual(self.cache.get("Hades (Renamed)", app_id=1145360), 22.5)
+
+    def test_persists(self):
+        self.cache.set("Hades", 22.5)
+        cache = TimeToBeatCache(self.db_path)
+        self.assertEqual(cache.get("Hades"), 22.5)
+        cache.close()
+
+    def test_not_found(self):
+        self.cache.set("Not Real", "-")
+        self.assertEqual(self.cache.get("Not Real"), "-")
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["negative_hits"], 1)
+        self.assertEqual(stats["not_found"], 1)
+        self.assertEqual(stats["hit_rate"], 1)
+
+    def test_retry_after(self):
+        self.cache.error_retry = 0
+        self.cache.set("Hades", "")
+        time.sleep(0.01)
+        self.assertIsNone(self.cache.get("Hades"))
+        cache = TimeToBeatCache(self.db_path, not_found_retry_days=0)
+        cache.set("Not Real", "-")
+        time.sleep(0.01)
+        self.assertIsNone(cache.get("Not Real"))
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
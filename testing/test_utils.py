@@ -1,8 +1,9 @@
+from pathlib import Path
 import datetime as dt
-import unittest
+import unittest, json, sys
 
 # classes
-from classes.utils import Utils
+from classes.utils import Utils, lazy_import, lazy_property, startup_times
 
 
 class HoursPlayed(unittest.TestCase):
@@ -216,6 +217,40 @@ class UnicodeRemover(unittest.TestCase):
         new_string = self.t.unicode_remover(123)
         self.assertEqual(new_string, 123)
 
+    def test_corpus(self):
+        """
+        Matches the outputs of the chained replace version it replaced.
+        """
+        corpus = json.loads(Path("testing/data/unicode_corpus.json").read_text())
+        for string, answer in corpus:
+            with self.subTest(string=string):
+                self.assertEqual(self.t.unicode_remover(string), answer)
+
+
+class UnicodeRemoverBulk(unittest.TestCase):
+    """
+    Tests `unicode_remover_bulk` function
+    """
+
+    def setUp(self):
+        self.t = Utils()
+
+    def test_matches_single(self):
+        corpus = json.loads(Path("testing/data/unicode_corpus.json").read_text())
+        strings = [string for string, _ in corpus]
+        answers = [answer for _, answer in corpus]
+        self.assertEqual(self.t.unicode_remover_bulk(strings), answers)
+
+    def test_mixed_values(self):
+        values = ["Game™ ", 5, None, "Rock &amp Roll", ""]
+        cleaned = self.t.unicode_remover_bulk(values)
+        self.assertEqual(cleaned, ["Game", 5, None, "Rock & Roll", ""])
+
+    def test_new_match_formed(self):
+        values = ["&ampquot;Quoted", "Ã®›ber", "Plain"]
+        cleaned = self.t.unicode_remover_bulk(values)
+        self.assertEqual(cleaned, ['"Quoted', "Uber", "Plain"])
+
 
 class CreateAndSentence(unittest.TestCase):
     """
@@ -273,6 +308,43 @@ class LevenshteinDistance(unittest.TestCase):
         """
         self.assertEqual(self.t.lev_distance("Thinking", "Thoughts"), 6)
 
+    def test_max_distance(self):
+        """
+        Tests that distances over `max_distance` stop early.
+        """
+        self.assertEqual(self.t.lev_distance("Thinking", "Thoughts", max_distance=6), 6)
+        self.assertEqual(self.t.lev_distance("Thinking", "Thoughts", max_distance=3), 4)
+        self.assertEqual(self.t.lev_distance("a", "a long name", max_distance=2), 3)
+
+    def test_empty(self):
+        self.assertEqual(self.t.lev_distance("", "test"), 4)
+        self.assertEqual(self.t.lev_distance("test", ""), 4)
+
+
+class LevenshteinDistanceBatch(unittest.TestCase):
+    """
+    Tests `lev_distance_batch` Function.
+    """
+
+    def setUp(self):
+        self.t = Utils()
+        self.words = ["test", "tests", "the tests", "", "Thoughts", "spelt", "tEst"]
+
+    def test_matches_lev_distance(self):
+        for target in ["test", "Thinking", ""]:
+            with self.subTest(target=target):
+                distances = self.t.lev_distance_batch(target, self.words)
+                answers = [self.t.lev_distance(target, word) for word in self.words]
+                self.assertEqual(distances.tolist(), answers)
+
+    def test_max_distance(self):
+        distances = self.t.lev_distance_batch("test", self.words, max_distance=1)
+        self.assertEqual(distances.tolist(), [0, 1, 2, 2, 2, 2, 0])
+
+    def test_small_chunks(self):
+        distances = self.t.lev_distance_batch("test", self.words, chunk_size=2)
+        self.assertEqual(distances.tolist(), [0, 1, 5, 4, 6, 3, 0])
+
 
 class SimilarityMatching(unittest.TestCase):
     def setUp(self):
@@ -370,5 +442,41 @@ class AnyIsNum(unittest.TestCase):
         self.assertFalse(self.t.any_is_num("not a num"))
 
 
+class LazyImport(unittest.TestCase):
+    """
+    Tests `lazy_import` function.
+    """
+
+    def test_deferred(self):
+        sys.modules.pop("colorsys", None)
+        module = lazy_import("colorsys")
+        self.assertIs(sys.modules["colorsys"], module)
+        self.assertEqual(module.rgb_to_hsv(1, 0, 0), (0, 1, 1))
+
+    def test_already_imported(self):
+        self.assertIs(lazy_import("json"), sys.modules["json"])
+
+
+class LazyProperty(unittest.TestCase):
+    """
+    Tests `lazy_property` decorator.
+    """
+
+    def test_created_once(self):
+        class Example:
+            created = 0
+
+            @lazy_property
+            def example_resource(self):
+                Example.created += 1
+                return object()
+
+        example = Example()
+        self.assertEqual(Example.created, 0)
+        self.assertIs(example.example_resource, example.example_resource)
+        self.assertEqual(Example.created, 1)
+        self.assertIn("example_resource", startup_times)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,108 @@
+from pathlib import Path
+import tempfile, time
+import unittest
+
+import openpyxl
+
+# classes
+from classes.library import Library
+from classes.workbook_writer import WorkbookWriter
+from testing.workbook_fixture import create_steam_sheet
+
+
+class WriterTestCase(unittest.TestCase):
+    """
+    Creates a Steam sheet with one game from the template workbook.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.excel_path, self.excel, self.sheet = create_steam_sheet(
+            self.temp_dir.name, [{"App ID": 10, "Name": "Hades"}]
+        )
+        self.library = Library(self.sheet)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def saved_hours(self):
+        ws = openpyxl.load_workbook(self.excel_path)["Steam"]
+        col = self.sheet.col_idx["Hours Played"]
+        return ws.cell(row=self.sheet.row_idx["10"], column=col).value
+
+
+class Checkpoint(WriterTestCase):
+    """
+    Tests `checkpoint` function.
+    """
+
+    def test_under_budget(self):
+        writer = WorkbookWriter(self.excel, self.library, max_seconds=60)
+        self.library.update_cell(10, "Hours Played", 1.5)
+        self.assertFalse(writer.checkpoint())
+        self.assertEqual(writer.pending, 1)
+        self.assertIsNone(self.saved_hours())
+
+    def test_size_budget(self):
+        writer = WorkbookWriter(self.excel, self.library, max_changes=2)
+        self.library.update_cell(10, "Hours Played", 1.5)
+        self.library.update_cell(10, "My Rating", 8)
+        self.assertTrue(writer.checkpoint())
+        self.assertEqual(writer.pending, 0)
+        self.assertEqual(self.saved_hours(), 1.5)
+
+    def test_time_budget(self):
+        writer = WorkbookWriter(self.excel, self.library, max_seconds=0.05)
+        self.assertFalse(writer.checkpoint())
+        self.library.update_cell(10, "Hours Played", 2.5)
+        time.sleep(0.06)
+        self.assertTrue(writer.checkpoint())
+        self.assertEqual(self.saved_hours(), 2.5)
+
+    def test_sheet_changes(self):
+        """
+        Tests that rows added straight to a sheet are saved.
+        """
+        writer = WorkbookWriter(self.excel, self.library, max_seconds=0)
+        self.sheet.add_new_line({"App ID": 20, "Name": "Celeste"})
+        self.assertTrue(writer.checkpoint())
+
+
+class Save(WriterTestCase):
+    """
+    Tests `save` function.
+    """
+
+    def test_atomic(self):
+        writer = WorkbookWriter(self.excel, self.library)
+        self.library.update_cell(10, "Hours Played", 3.0)
+        self.assertTrue(writer.save(use_print=False))
+        self.assertEqual(self.saved_hours(), 3.0)
+        self.assertFalse(self.excel.changes_made)
+        # only the workbook and its backup remain
+        files = sorted(path.name for path in Path(self.temp_dir.name).iterdir())
+        self.assertEqual(files, ["Game Library.xlsx", "Game Library.xlsx.bak"])
+
+    def test_failed_save_keeps_file(self):
+        writer = WorkbookWriter(self.excel, self.library)
+        before = self.excel_path.read_bytes()
+        self.library.update_cell(10, "Hours Played", 4.0)
+
+        def broken_save(path):
+            Path(path).write_bytes(b"partial")
+            raise OSError("disk full")
+
+        self.excel.wb.save = broken_save
+        with self.assertRaises(OSError):
+            writer.save(use_print=False, backup=False)
+        self.assertEqual(self.excel_path.read_bytes(), before)
+        self.assertEqual(len(list(Path(self.temp_dir.name).iterdir())), 1)
+
+    def test_skips_without_changes(self):
+        writer = WorkbookWriter(self.excel, self.library)
+        self.assertFalse(writer.save(use_print=False))
+        self.assertEqual(writer.saves, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+Shared setup for tests that need a real game library workbook.
+"""
+
+from pathlib import Path
+import shutil
+
+# my package
+from easierexcel import Excel, Sheet
+
+TEMPLATE = Path("configs/templates/Game_Library_Template.xlsx")
+
+
+def create_steam_sheet(folder, games: list[dict], save: bool = False) -> tuple:
+    """
+    Copies the template workbook into `folder` and adds `games` to its Steam
+    sheet. Returns the workbook path, `Excel` and `Sheet`.
+
+    The additions are saved if `save` is True and otherwise left unsaved
+    but marked as no changes made.
+    """
+    excel_path = Path(folder) / "Game Library.xlsx"
+    shutil.copyfile(TEMPLATE, excel_path)
+    excel = Excel(excel_path, use_logging=False)
+    sheet = Sheet(excel, sheet_name="Steam", column_name="App ID")
+    for game in games:
+        sheet.add_new_line(game)
+    if save:
+        excel.save(use_print=False, backup=False)
+    else:
+        excel.changes_made = False
+    return excel_path, excel, sheet